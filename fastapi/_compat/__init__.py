@@ -25,6 +25,7 @@ from .shared import (
 from .shared import lenient_issubclass as lenient_issubclass
 from .shared import sequence_types as sequence_types
 from .shared import value_is_sequence as value_is_sequence
+from .v2 import FieldsValidator as FieldsValidator
 from .v2 import ModelField as ModelField
 from .v2 import PydanticSchemaGenerationError as PydanticSchemaGenerationError
 from .v2 import RequiredParam as RequiredParam
@@ -33,8 +34,11 @@ from .v2 import Url as Url
 from .v2 import copy_field_info as copy_field_info
 from .v2 import create_body_model as create_body_model
 from .v2 import evaluate_forwardref as evaluate_forwardref  # ty: ignore[deprecated]
+from .v2 import freeze_value as freeze_value
 from .v2 import get_cached_model_fields as get_cached_model_fields
+from .v2 import get_cached_type_adapter as get_cached_type_adapter
 from .v2 import get_definitions as get_definitions
+from .v2 import get_fields_validator as get_fields_validator
 from .v2 import get_flat_models_from_fields as get_flat_models_from_fields
 from .v2 import get_missing_field_error as get_missing_field_error
 from .v2 import get_model_name_map as get_model_name_map
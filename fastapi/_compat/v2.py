@@ -1,7 +1,7 @@
 import re
 import warnings
 from collections.abc import Callable, Sequence
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass, is_dataclass
 from enum import Enum
 from functools import lru_cache
@@ -38,7 +38,7 @@ from pydantic.fields import FieldInfo as FieldInfo
 from pydantic.json_schema import GenerateJsonSchema as _GenerateJsonSchema
 from pydantic.json_schema import JsonSchemaValue as JsonSchemaValue
 from pydantic_core import CoreSchema as CoreSchema
-from pydantic_core import PydanticUndefined
+from pydantic_core import PydanticUndefined, SchemaError, SchemaValidator, core_schema
 from pydantic_core import Url as Url
 from pydantic_core.core_schema import (
     with_info_plain_validator_function as with_info_plain_validator_function,
@@ -105,6 +105,73 @@ def asdict(field_info: FieldInfo) -> dict[str, Any]:
     }
 
 
+def freeze_value(value: Any) -> Any:
+    # Include the type, as e.g. 1 == 1.0 == True but they are different defaults
+    if isinstance(value, dict):
+        return dict, tuple((key, freeze_value(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(freeze_value(item) for item in value)
+    hash(value)
+    return type(value), value
+
+
+class _TypeAdapterKey:
+    """
+    Hashable key for the TypeAdapter of a ModelField, two fields with the same
+    annotation, metadata, attributes and config get the same key. It raises
+    TypeError if any of them is not hashable.
+    """
+
+    __slots__ = ("field_dict", "config", "_key", "_hash")
+
+    def __init__(self, *, field_dict: dict[str, Any], config: ConfigDict | None):
+        self.field_dict = field_dict
+        self.config = config
+        self._key = (
+            freeze_value(field_dict["annotation"]),
+            freeze_value(field_dict["metadata"]),
+            freeze_value(field_dict["attributes"]),
+            freeze_value(config),
+        )
+        self._hash = hash(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _TypeAdapterKey) and self._key == other._key
+
+
+def _create_type_adapter(
+    *, field_dict: dict[str, Any], config: ConfigDict | None
+) -> TypeAdapter[Any]:
+    annotated_args = (
+        field_dict["annotation"],
+        *field_dict["metadata"],
+        # this FieldInfo needs to be created again so that it doesn't include
+        # the old field info metadata and only the rest of the attributes
+        Field(**field_dict["attributes"]),
+    )
+    return TypeAdapter(
+        Annotated[annotated_args],  # ty: ignore[invalid-type-form]
+        config=config,
+    )
+
+
+# Share the same TypeAdapter (core schema, validator and serializer) between fields
+# with identical annotations, e.g. the same response_model in many path operations.
+# Use get_cached_type_adapter.cache_info() to check the hits and misses
+@lru_cache(maxsize=2048)
+def get_cached_type_adapter(key: _TypeAdapterKey) -> TypeAdapter[Any]:
+    return _create_type_adapter(field_dict=key.field_dict, config=key.config)
+
+
+# Defaults of these types can be shared by all the requests, without copying them
+_IMMUTABLE_DEFAULT_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, range}
+)
+
+
 @dataclass
 class ModelField:
     field_info: FieldInfo
@@ -148,23 +215,51 @@ class ModelField:
             # TODO: remove after setting the min Pydantic to v2.12.3
             # that adds asdict(), and use self.field_info.asdict() instead
             field_dict = asdict(self.field_info)
-            annotated_args = (
-                field_dict["annotation"],
-                *field_dict["metadata"],
-                # this FieldInfo needs to be created again so that it doesn't include
-                # the old field info metadata and only the rest of the attributes
-                Field(**field_dict["attributes"]),
-            )
-            self._type_adapter: TypeAdapter[Any] = TypeAdapter(
-                Annotated[annotated_args],  # ty: ignore[invalid-type-form]
-                config=self.config,
-            )
+            try:
+                type_adapter_key = _TypeAdapterKey(
+                    field_dict=field_dict, config=self.config
+                )
+            except TypeError:
+                # Something in the field is not hashable (e.g. a list default),
+                # build a TypeAdapter just for this field
+                self._type_adapter: TypeAdapter[Any] = _create_type_adapter(
+                    field_dict=field_dict, config=self.config
+                )
+            else:
+                self._type_adapter = get_cached_type_adapter(type_adapter_key)
+        # Decided once, the default is used on each request without a value
+        self._default_kind: Literal["required", "factory", "immutable", "mutable"]
+        if self.field_info.is_required():
+            self._default_kind = "required"
+        elif self.field_info.default_factory is not None:
+            self._default_kind = "factory"
+        elif type(self.field_info.default) in _IMMUTABLE_DEFAULT_TYPES or isinstance(
+            self.field_info.default, Enum
+        ):
+            self._default_kind = "immutable"
+        else:
+            self._default_kind = "mutable"
 
     def get_default(self) -> Any:
         if self.field_info.is_required():
             return Undefined
         return self.field_info.get_default(call_default_factory=True)
 
+    def copy_default(self) -> Any:
+        """
+        The default value to use in a request: the same value if it's immutable,
+        a new one from the default factory, or else a deep copy, so that changes
+        to it don't affect other requests.
+        """
+        default_kind = self._default_kind
+        if default_kind == "immutable":
+            return self.field_info.default
+        if default_kind == "factory":
+            return self.field_info.get_default(call_default_factory=True)
+        if default_kind == "mutable":
+            return deepcopy(self.field_info.default)
+        return Undefined
+
     def validate(
         self,
         value: Any,
@@ -182,6 +277,16 @@ class ModelField:
                 errors=exc.errors(include_url=False), loc_prefix=loc
             )
 
+    def validate_json(
+        self, value: bytes, *, loc: tuple[int | str, ...] = ()
+    ) -> tuple[Any, list[dict[str, Any]]]:
+        try:
+            return self._type_adapter.validate_json(value), []
+        except ValidationError as exc:
+            return None, _regenerate_error_with_loc(
+                errors=exc.errors(include_url=False), loc_prefix=loc
+            )
+
     def serialize(
         self,
         value: Any,
@@ -239,6 +344,57 @@ class ModelField:
         return id(self)
 
 
+class FieldsValidator:
+    """
+    Validates the values of several ModelFields with a single call to a combined
+    validator, with the same values and errors as calling `validate()` on each
+    field.
+
+    The values are passed and returned by the index of the field, as a string, the
+    errors are grouped by that index, with their loc relative to the field.
+    """
+
+    def __init__(self, fields: Sequence[ModelField]) -> None:
+        definitions: dict[str, CoreSchema] = {}
+        typed_dict_fields: dict[str, core_schema.TypedDictField] = {}
+        for index, field in enumerate(fields):
+            schema = field._type_adapter.core_schema
+            if schema["type"] == "definitions":
+                # Fields with the same types (e.g. an Enum) have the same definitions
+                for definition in schema["definitions"]:
+                    definitions.setdefault(definition["ref"], definition)
+                schema = schema["schema"]
+            typed_dict_fields[str(index)] = core_schema.typed_dict_field(
+                schema, required=False
+            )
+        combined_schema: CoreSchema = core_schema.typed_dict_schema(typed_dict_fields)
+        if definitions:
+            combined_schema = core_schema.definitions_schema(
+                combined_schema, list(definitions.values())
+            )
+        self._validator = SchemaValidator(combined_schema)
+
+    def validate(
+        self, values: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, list[dict[str, Any]]]]:
+        try:
+            return self._validator.validate_python(values, from_attributes=True), {}
+        except ValidationError as exc:
+            errors: dict[str, list[dict[str, Any]]] = {}
+            for error in exc.errors(include_url=False):
+                loc = error["loc"]
+                errors.setdefault(str(loc[0]), []).append({**error, "loc": loc[1:]})
+            return {}, errors
+
+
+def get_fields_validator(fields: Sequence[ModelField]) -> FieldsValidator | None:
+    try:
+        return FieldsValidator(fields)
+    except SchemaError:
+        # Some schema can't be combined, validate each field
+        return None
+
+
 def _has_computed_fields(field: ModelField) -> bool:
     computed_fields = field._type_adapter.core_schema.get("schema", {}).get(
         "computed_fields", []
@@ -1,6 +1,6 @@
 from collections.abc import Awaitable, Callable, Coroutine, Sequence
 from enum import Enum
-from typing import Annotated, Any, TypeVar
+from typing import Annotated, Any, Literal, TypeVar
 
 from annotated_doc import Doc
 from fastapi import routing
@@ -20,7 +20,8 @@ from fastapi.openapi.docs import (
 )
 from fastapi.openapi.utils import get_openapi
 from fastapi.params import Depends
-from fastapi.types import DecoratedCallable, IncEx
+from fastapi.streaming import JSONLBuffer
+from fastapi.types import BodyDecoder, DecoratedCallable, IncEx, ResponseEncoder
 from fastapi.utils import generate_unique_id
 from starlette.applications import Starlette
 from starlette.datastructures import State
@@ -859,6 +860,147 @@ class FastAPI(Starlette):
                 """
             ),
         ] = True,
+        radix_routing: Annotated[
+            bool,
+            Doc(
+                """
+                Find the route for each request using a prefix tree (radix tree) of
+                the route paths instead of checking every route one by one.
+
+                The tree is built from the routes the first time a request is
+                received (and rebuilt when routes are added), so finding a route
+                takes time proportional to the length of the path, not to the
+                number of routes. This is useful for applications with many
+                routes.
+
+                The behavior is the same as the default: the first matching route
+                wins, a route that matches the path but not the method still
+                produces a `405 Method Not Allowed`, and mounted applications
+                still work.
+                """
+            ),
+        ] = False,
+        lazy_routes: Annotated[
+            bool,
+            Doc(
+                """
+                Create the *path operations* without compiling them, they are
+                compiled the first time they are used (e.g. with the first request
+                or when generating the OpenAPI schema).
+
+                Compiling a *path operation* means analyzing its dependencies and
+                parameters and creating the validators and serializers for its
+                request body and response. Doing it lazily makes starting
+                applications with many *path operations* much faster.
+
+                Errors in the *path operations* declarations (e.g. an invalid
+                `response_model`) are only raised when they are compiled, call
+                `app.warmup()` (e.g. in your tests) to compile all of them at once.
+                """
+            ),
+        ] = False,
+        specialized_handlers: Annotated[
+            bool,
+            Doc(
+                """
+                Use a request handler specialized for each *path operation*.
+
+                By default, the same generic request handler checks on every request
+                if the *path operation* has a body, if it's a form, if it streams,
+                how to serialize the response, etc. With this option, those
+                decisions are taken once when the *path operation* is created, and
+                the request handler only includes the steps it needs.
+
+                The behavior is the same as with the default request handler.
+                """
+            ),
+        ] = False,
+        body_decoders: Annotated[
+            dict[str, BodyDecoder] | None,
+            Doc(
+                """
+                Functions to decode request bodies with other media types, for
+                example `{"application/msgpack": msgpack.unpackb}`.
+
+                Each function receives the body `bytes` and returns the decoded data,
+                that is then validated as with JSON. Errors raised while decoding
+                are returned as validation errors. A decoder for
+                `application/json` replaces the default JSON parsing.
+
+                They are used by the *path operations* added after this, and are
+                shown as the accepted media types of the request body in OpenAPI.
+                """
+            ),
+        ] = None,
+        response_encoders: Annotated[
+            dict[str, ResponseEncoder] | None,
+            Doc(
+                """
+                Functions to encode responses with other media types, for example
+                `{"application/msgpack": msgpack.packb}`, chosen with the `Accept`
+                header of each request.
+
+                Each function receives the JSON compatible data of the response,
+                serialized with the `response_model` (if any), and returns the
+                body `bytes`. JSON is still used when the client accepts it as much
+                as the other media types, or doesn't send an `Accept` header.
+
+                They are only used by the *path operations* that use the default
+                response class, added after this, and are shown as the response
+                media types in OpenAPI.
+                """
+            ),
+        ] = None,
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by the *path operations* with
+                their `response_model`, they can override it.
+
+                With `"full"` (the default), the returned data is always validated.
+
+                With `"trust_instances"`, when the returned data is already an
+                instance of exactly the `response_model` class (or a `list` of
+                them), it's only serialized, not validated again. Other data, like
+                `dict`s or database objects, is still validated.
+                """
+            ),
+        ] = "full",
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses of the *path operations* in chunks of this
+                many items, they can override it.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = None,
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of JSON Lines streams (*path operations* that use
+                `yield`), and send several of them in each chunk, instead of one
+                chunk per item, they can override it.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = None,
         **extra: Annotated[
             Any,
             Doc(
@@ -994,6 +1136,14 @@ class FastAPI(Starlette):
             responses=responses,
             generate_unique_id_function=generate_unique_id_function,
             strict_content_type=strict_content_type,
+            radix_routing=radix_routing,
+            lazy_routes=lazy_routes,
+            specialized_handlers=specialized_handlers,
+            body_decoders=body_decoders,
+            response_encoders=response_encoders,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
         self.exception_handlers: dict[
             Any, Callable[[Request, Any], Response | Awaitable[Response]]
@@ -1065,6 +1215,33 @@ class FastAPI(Starlette):
             app = cls(app, *args, **kwargs)
         return app
 
+    def warmup(self) -> None:
+        """
+        Compile all the *path operations* that were not compiled yet, when using
+        `lazy_routes=True`.
+
+        This is useful to pay the cost of compiling them before receiving
+        requests, e.g. after forking the worker processes, or to check in your
+        tests that all of them are declared correctly.
+
+        ## Example
+
+        ```python
+        from fastapi import FastAPI
+
+        app = FastAPI(lazy_routes=True)
+
+
+        @app.get("/items/")
+        def read_items():
+            return [{"name": "Foo"}]
+
+
+        app.warmup()
+        ```
+        """
+        self.router.warmup()
+
     def openapi(self) -> dict[str, Any]:
         """
         Generate the OpenAPI schema of the application. This is called by FastAPI
@@ -1187,6 +1364,10 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        response_validation: Literal["full", "trust_instances"]
+        | DefaultPlaceholder = Default("full"),
+        response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+        jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
     ) -> None:
         self.router.add_api_route(
             path,
@@ -1213,6 +1394,9 @@ class FastAPI(Starlette):
             name=name,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def api_route(
@@ -1243,6 +1427,10 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        response_validation: Literal["full", "trust_instances"]
+        | DefaultPlaceholder = Default("full"),
+        response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+        jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.router.add_api_route(
@@ -1270,6 +1458,9 @@ class FastAPI(Starlette):
                 name=name,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                response_validation=response_validation,
+                response_chunk_size=response_chunk_size,
+                jsonl_buffer=jsonl_buffer,
             )
             return func
 
@@ -1891,6 +2082,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1931,6 +2165,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def put(
@@ -2264,6 +2501,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2309,6 +2589,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def post(
@@ -2642,6 +2925,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2687,6 +3013,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def delete(
@@ -3020,6 +3349,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -3060,6 +3432,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def options(
@@ -3393,6 +3768,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3433,6 +3851,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def head(
@@ -3766,6 +4187,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3806,6 +4270,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def patch(
@@ -4139,6 +4606,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4184,6 +4694,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def trace(
@@ -4517,6 +5030,49 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4557,6 +5113,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def websocket_route(
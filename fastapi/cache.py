@@ -0,0 +1,159 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Annotated, Any, NamedTuple
+
+import anyio
+from annotated_doc import Doc
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class TTLCache:
+    """
+    A cache for the values of dependencies, shared by all the requests.
+
+    Pass it to `Depends(cache=...)`, the dependency is called once for each
+    combination of its resolved inputs (its parameters, sub-dependencies, etc.)
+    and the value is re-used by the next requests with the same inputs, until it
+    expires.
+
+    When several requests need the same missing value at the same time, the
+    dependency is called only once, and the other requests wait for it.
+
+    The same cache can be shared by several dependencies.
+
+    ## Example
+
+    ```python
+    from typing import Annotated
+
+    from fastapi import Depends, FastAPI, Header
+    from fastapi.cache import TTLCache
+
+    app = FastAPI()
+
+
+    async def get_tenant_config(x_tenant: Annotated[str, Header()]):
+        return await load_config(x_tenant)
+
+
+    @app.get("/items/")
+    async def read_items(
+        config: Annotated[
+            dict, Depends(get_tenant_config, cache=TTLCache(maxsize=100, ttl=60))
+        ],
+    ):
+        return config
+    ```
+    """
+
+    def __init__(
+        self,
+        maxsize: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of values to store, when it's reached, the least
+                recently used value is discarded. `None` means no limit.
+                """
+            ),
+        ] = 128,
+        ttl: Annotated[
+            float | None,
+            Doc(
+                """
+                The number of seconds a value is used after it's created. `None`
+                means the values don't expire.
+                """
+            ),
+        ] = None,
+        timer: Annotated[
+            Callable[[], float],
+            Doc(
+                """
+                The function that returns the current time in seconds, used for the
+                `ttl`.
+                """
+            ),
+        ] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        # Key: (expiration time or None, value), in least recently used order
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._pending: dict[Hashable, anyio.Event] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        item = self._data.get(key)
+        if item is None:
+            return False, None
+        expires, value = item
+        if expires is not None and expires <= self.timer():
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        found, value = self._lookup(key)
+        return value if found else default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def get_or_call(
+        self, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the value for `key`, calling and awaiting `call()` to create it if
+        it's missing or expired. Concurrent calls for the same missing `key` wait
+        for the first one, if it raises, the next one calls it again.
+        """
+        while True:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            await pending.wait()
+        self.misses += 1
+        pending = self._pending[key] = anyio.Event()
+        try:
+            value = await call()
+            self.set(key, value)
+        finally:
+            del self._pending[key]
+            pending.set()
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+        )
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
@@ -6,6 +6,7 @@ from functools import cached_property, partial
 from typing import Any, Literal
 
 from fastapi._compat import ModelField
+from fastapi.cache import TTLCache
 from fastapi.security.base import SecurityBase
 from fastapi.types import DependencyCacheKey
 
@@ -48,7 +49,9 @@ class Dependant:
     parent_oauth_scopes: list[str] | None = None
     use_cache: bool = True
     path: str | None = None
-    scope: Literal["function", "request"] | None = None
+    scope: Literal["function", "request", "app"] | None = None
+    parallel: bool = False
+    cache: TTLCache | None = None
 
     @cached_property
     def oauth_scopes(self) -> list[str]:
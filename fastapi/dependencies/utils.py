@@ -1,5 +1,6 @@
 import dataclasses
 import inspect
+import json
 import sys
 from collections.abc import (
     AsyncGenerator,
@@ -13,7 +14,7 @@ from collections.abc import (
     Sequence,
 )
 from contextlib import AsyncExitStack, contextmanager
-from copy import copy, deepcopy
+from copy import copy
 from dataclasses import dataclass
 from typing import (
     Annotated,
@@ -25,9 +26,13 @@ from typing import (
     get_args,
     get_origin,
 )
+from weakref import WeakKeyDictionary
 
+import anyio
+from anyio.abc import TaskGroup
 from fastapi import params
 from fastapi._compat import (
+    FieldsValidator,
     ModelField,
     RequiredParam,
     Undefined,
@@ -39,7 +44,9 @@ from fastapi._compat import (
     field_annotation_is_scalar_sequence,
     field_annotation_is_scalar_sequence_mapping,
     field_annotation_is_sequence,
+    freeze_value,
     get_cached_model_fields,
+    get_fields_validator,
     get_missing_field_error,
     is_bytes_or_nonable_bytes_annotation,
     is_bytes_sequence_annotation,
@@ -53,12 +60,13 @@ from fastapi._compat import (
     value_is_sequence,
 )
 from fastapi.background import BackgroundTasks
+from fastapi.cache import TTLCache
 from fastapi.concurrency import (
     asynccontextmanager,
     contextmanager_in_threadpool,
 )
 from fastapi.dependencies.models import Dependant
-from fastapi.exceptions import DependencyScopeError
+from fastapi.exceptions import DependencyScopeError, FastAPIError
 from fastapi.logger import logger
 from fastapi.security.oauth2 import SecurityScopes
 from fastapi.types import DependencyCacheKey
@@ -135,6 +143,8 @@ def get_parameterless_sub_dependant(*, depends: params.Depends, path: str) -> De
         call=depends.dependency,
         scope=depends.scope,
         own_oauth_scopes=own_oauth_scopes,
+        parallel=depends.parallel,
+        cache=depends.cache,
     )
 
 
@@ -171,6 +181,8 @@ def get_flat_dependant(
         use_cache=dependant.use_cache,
         path=dependant.path,
         scope=dependant.scope,
+        parallel=dependant.parallel,
+        cache=dependant.cache,
     )
     for sub_dependant in dependant.dependencies:
         if skip_repeats and sub_dependant.cache_key in visited:
@@ -192,6 +204,24 @@ def get_flat_dependant(
     return flat_dependant
 
 
+def copy_dependant(*, dependant: Dependant, path: str) -> Dependant:
+    # Re-use the already analyzed parameters (and their ModelFields), only
+    # updating the path, e.g. for a route included with a prefix
+    return dataclasses.replace(
+        dependant,
+        path_params=dependant.path_params.copy(),
+        query_params=dependant.query_params.copy(),
+        header_params=dependant.header_params.copy(),
+        cookie_params=dependant.cookie_params.copy(),
+        body_params=dependant.body_params.copy(),
+        dependencies=[
+            copy_dependant(dependant=sub_dependant, path=path)
+            for sub_dependant in dependant.dependencies
+        ],
+        path=path,
+    )
+
+
 def _get_flat_fields_from_params(fields: list[ModelField]) -> list[ModelField]:
     if not fields:
         return fields
@@ -294,7 +324,9 @@ def get_dependant(
     own_oauth_scopes: list[str] | None = None,
     parent_oauth_scopes: list[str] | None = None,
     use_cache: bool = True,
-    scope: Literal["function", "request"] | None = None,
+    scope: Literal["function", "request", "app"] | None = None,
+    parallel: bool = False,
+    cache: TTLCache | None = None,
 ) -> Dependant:
     dependant = Dependant(
         call=call,
@@ -302,9 +334,18 @@ def get_dependant(
         path=path,
         use_cache=use_cache,
         scope=scope,
+        parallel=parallel,
+        cache=cache,
         own_oauth_scopes=own_oauth_scopes,
         parent_oauth_scopes=parent_oauth_scopes,
     )
+    if cache is not None and (
+        dependant.is_gen_callable or dependant.is_async_gen_callable
+    ):
+        call_name = getattr(call, "__name__", "<unnamed_callable>")
+        raise FastAPIError(
+            f'The dependency "{call_name}" uses yield, it cannot have a cache.'
+        )
     current_scopes = (parent_oauth_scopes or []) + (own_oauth_scopes or [])
     path_param_names = get_path_param_names(path)
     endpoint_signature = get_typed_signature(call)
@@ -330,6 +371,13 @@ def get_dependant(
                     f'The dependency "{call_name}" has a scope of '
                     '"request", it cannot depend on dependencies with scope "function".'
                 )
+            if dependant.scope == "app" and param_details.depends.scope != "app":
+                assert dependant.call
+                call_name = getattr(dependant.call, "__name__", "<unnamed_callable>")
+                raise DependencyScopeError(
+                    f'The dependency "{call_name}" has a scope of "app", it can only '
+                    'depend on dependencies with scope "app".'
+                )
             sub_own_oauth_scopes: list[str] = []
             if isinstance(param_details.depends, params.Security):
                 if param_details.depends.scopes:
@@ -342,6 +390,8 @@ def get_dependant(
                 parent_oauth_scopes=current_scopes,
                 use_cache=param_details.depends.use_cache,
                 scope=param_details.depends.scope,
+                parallel=param_details.depends.parallel,
+                cache=param_details.depends.cache,
             )
             dependant.dependencies.append(sub_dependant)
             continue
@@ -359,9 +409,81 @@ def get_dependant(
             dependant.body_params.append(param_details.field)
         else:
             add_param_to_fields(field=param_details.field, dependant=dependant)
+    if dependant.scope == "app":
+        request_param_names = _get_request_param_names(dependant)
+        if request_param_names:
+            call_name = getattr(call, "__name__", "<unnamed_callable>")
+            raise DependencyScopeError(
+                f'The dependency "{call_name}" has a scope of "app", it cannot '
+                "use values from the request, as its value is shared by all the "
+                f"requests: {', '.join(request_param_names)}."
+            )
+    if cache is not None:
+        request_object_param_names = _get_request_object_param_names(dependant)
+        if request_object_param_names:
+            call_name = getattr(call, "__name__", "<unnamed_callable>")
+            raise FastAPIError(
+                f'The dependency "{call_name}" has a cache, it cannot use the '
+                "objects created for each request, as its value is stored for "
+                f"the values of its inputs: {', '.join(request_object_param_names)}."
+            )
+        # The values of other sub-dependencies are new for each request, they
+        # would never be found again in the cache
+        request_sub_dependency_names = [
+            getattr(sub_dependant.call, "__name__", "<unnamed_callable>")
+            for sub_dependant in dependant.dependencies
+            if sub_dependant.scope != "app" and sub_dependant.cache is None
+        ]
+        if request_sub_dependency_names:
+            call_name = getattr(call, "__name__", "<unnamed_callable>")
+            raise FastAPIError(
+                f'The dependency "{call_name}" has a cache, its sub-dependencies '
+                'need a cache or a scope of "app" too, as its value is stored for '
+                f"the values of its inputs: {', '.join(request_sub_dependency_names)}."
+            )
     return dependant
 
 
+def _get_request_param_names(dependant: Dependant) -> list[str]:
+    """
+    The names of the parameters of a dependant (not of its sub-dependencies) that
+    get their values from each request.
+    """
+    names = [
+        field.name
+        for fields in (
+            dependant.path_params,
+            dependant.query_params,
+            dependant.header_params,
+            dependant.cookie_params,
+            dependant.body_params,
+        )
+        for field in fields
+    ]
+    names.extend(_get_request_object_param_names(dependant))
+    if dependant.security_scopes_param_name is not None:
+        names.append(dependant.security_scopes_param_name)
+    return names
+
+
+def _get_request_object_param_names(dependant: Dependant) -> list[str]:
+    """
+    The names of the parameters of a dependant that get objects created for each
+    request, like the `Request` or the `Response`.
+    """
+    return [
+        name
+        for name in (
+            dependant.request_param_name,
+            dependant.websocket_param_name,
+            dependant.http_connection_param_name,
+            dependant.response_param_name,
+            dependant.background_tasks_param_name,
+        )
+        if name is not None
+    ]
+
+
 def add_non_field_param_to_dependency(
     *, param_name: str, type_annotation: Any, dependant: Dependant
 ) -> bool | None:
@@ -602,6 +724,209 @@ async def _solve_generator(
     return await stack.enter_async_context(cm)
 
 
+@dataclass
+class _OverriddenDependants:
+    dependency_overrides: dict[Any, Any]
+    dependants: dict[tuple[Any, ...], Dependant] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+# The dependants created for the dependency overrides, by dependency overrides
+# provider (e.g. the app), discarded when its dependency_overrides change
+_overridden_dependants: "WeakKeyDictionary[Any, _OverriddenDependants]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_overridden_dependant(
+    *, dependency_overrides_provider: Any, dependant: Dependant
+) -> Dependant:
+    dependency_overrides = getattr(
+        dependency_overrides_provider, "dependency_overrides", {}
+    )
+    original_call = cast(Callable[..., Any], dependant.call)
+    call = dependency_overrides.get(original_call, original_call)
+    key = (
+        original_call,
+        call,
+        dependant.path,
+        dependant.name,
+        tuple(dependant.oauth_scopes),
+        dependant.scope,
+    )
+    try:
+        overridden = _overridden_dependants.get(dependency_overrides_provider)
+    except TypeError:
+        # The provider can't be weakly referenced, don't cache
+        overridden = None
+        dependants: dict[tuple[Any, ...], Dependant] = {}
+    else:
+        if overridden is None or overridden.dependency_overrides != (
+            dependency_overrides
+        ):
+            overridden = _OverriddenDependants(
+                dependency_overrides=dict(dependency_overrides)
+            )
+            _overridden_dependants[dependency_overrides_provider] = overridden
+        dependants = overridden.dependants
+    overridden_dependant = dependants.get(key)
+    if overridden_dependant is None:
+        use_path: str = dependant.path  # type: ignore
+        overridden_dependant = dependants[key] = get_dependant(
+            path=use_path,
+            call=call,
+            name=dependant.name,
+            parent_oauth_scopes=dependant.oauth_scopes,
+            scope=dependant.scope,
+        )
+    return overridden_dependant
+
+
+class AppDependencies:
+    """
+    The values of the dependencies with `scope="app"` of an application, shared by
+    all the requests, and the exit stack to close the ones with `yield` when the
+    application shuts down.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[DependencyCacheKey, Any] = {}
+        self.pending: dict[DependencyCacheKey, anyio.Event] = {}
+        self.exit_stack: AsyncExitStack | None = None
+
+
+# By application (or router, when used without an application)
+_app_dependencies: "WeakKeyDictionary[Any, AppDependencies]" = WeakKeyDictionary()
+
+
+def get_app_dependencies(app: Any) -> AppDependencies:
+    app_dependencies = _app_dependencies.get(app)
+    if app_dependencies is None:
+        app_dependencies = _app_dependencies[app] = AppDependencies()
+    return app_dependencies
+
+
+@asynccontextmanager
+async def app_dependencies_lifespan(app: Any) -> AsyncIterator[None]:
+    app_dependencies = get_app_dependencies(app)
+    async with AsyncExitStack() as exit_stack:
+        app_dependencies.exit_stack = exit_stack
+        try:
+            yield
+        finally:
+            # The next lifespan (e.g. a new TestClient context) creates them again
+            app_dependencies.exit_stack = None
+            app_dependencies.values.clear()
+
+
+async def _solve_app_dependency(
+    *,
+    request: Request | WebSocket,
+    dependant: Dependant,
+    cache_key: DependencyCacheKey,
+    sub_values: dict[str, Any],
+) -> Any:
+    app_dependencies = get_app_dependencies(
+        request.scope.get("app") or request.scope.get("router")
+    )
+    values = app_dependencies.values
+    # Concurrent requests wait for the first one, if it raises, the next one
+    # calls the dependency again
+    while True:
+        if cache_key in values:
+            return values[cache_key]
+        pending = app_dependencies.pending.get(cache_key)
+        if pending is None:
+            break
+        await pending.wait()
+    pending = app_dependencies.pending[cache_key] = anyio.Event()
+    try:
+        if dependant.is_gen_callable or dependant.is_async_gen_callable:
+            if app_dependencies.exit_stack is None:
+                assert dependant.call
+                call_name = getattr(dependant.call, "__name__", "<unnamed_callable>")
+                raise FastAPIError(
+                    f'The dependency "{call_name}" has a scope of "app" and uses '
+                    "yield, it can only be used while the application lifespan is "
+                    "running, e.g. in tests use: with TestClient(app) as client"
+                )
+            solved = await _solve_generator(
+                dependant=dependant,
+                stack=app_dependencies.exit_stack,
+                sub_values=sub_values,
+            )
+        elif dependant.is_coroutine_callable:
+            assert dependant.call
+            solved = await dependant.call(**sub_values)
+        else:
+            assert dependant.call
+            solved = await run_in_threadpool(dependant.call, **sub_values)
+        values[cache_key] = solved
+    finally:
+        if app_dependencies.pending.get(cache_key) is pending:
+            del app_dependencies.pending[cache_key]
+        pending.set()
+    return solved
+
+
+async def _solve_cached_dependency(
+    *, cache: TTLCache, dependant: Dependant, sub_values: dict[str, Any]
+) -> Any:
+    call = cast(Callable[..., Any], dependant.call)
+
+    async def solve() -> Any:
+        if dependant.is_coroutine_callable:
+            return await call(**sub_values)
+        return await run_in_threadpool(call, **sub_values)
+
+    key_values = sub_values
+    if dependant.security_scopes_param_name:
+        # A new SecurityScopes for each request, use the scopes themselves
+        key_values = {
+            **sub_values,
+            dependant.security_scopes_param_name: tuple(dependant.oauth_scopes),
+        }
+    try:
+        key = (call, freeze_value(key_values))
+    except TypeError:
+        return await solve()
+    return await cache.get_or_call(key, solve)
+
+
+class ValidatedJSONBody:
+    """
+    A JSON request body for a single (not embedded) body field, validated directly
+    from the raw bytes, without creating the intermediate Python objects first.
+    """
+
+    __slots__ = ("field", "body", "value")
+
+    def __init__(self, *, field: ModelField, body: bytes, value: Any) -> None:
+        self.field = field
+        self.body = body
+        self.value = value
+
+    def decode(self) -> Any:
+        return json.loads(self.body)
+
+
+def validate_json_body(*, field: ModelField, body: bytes) -> ValidatedJSONBody | None:
+    """
+    Validate a JSON body directly from the raw bytes, `None` if it has to be
+    parsed with `json.loads()` and validated later, as without `validate_json()`:
+    for invalid JSON or data, to raise the same `JSONDecodeError` or to get the
+    same validation errors (with the Python names of the types), and for a JSON
+    `null`, validated as a missing body.
+    """
+    if body.strip() == b"null":
+        return None
+    value, errors = field.validate_json(body, loc=("body",))
+    if errors:
+        return None
+    return ValidatedJSONBody(field=field, body=body, value=value)
+
+
 @dataclass
 class SolvedDependency:
     values: dict[str, Any]
@@ -615,7 +940,7 @@ async def solve_dependencies(
     *,
     request: Request | WebSocket,
     dependant: Dependant,
-    body: dict[str, Any] | FormData | bytes | None = None,
+    body: dict[str, Any] | FormData | bytes | ValidatedJSONBody | None = None,
     background_tasks: StarletteBackgroundTasks | None = None,
     response: Response | None = None,
     dependency_overrides_provider: Any | None = None,
@@ -649,18 +974,11 @@ async def solve_dependencies(
             dependency_overrides_provider
             and dependency_overrides_provider.dependency_overrides
         ):
-            original_call = sub_dependant.call
-            call = getattr(
-                dependency_overrides_provider, "dependency_overrides", {}
-            ).get(original_call, original_call)
-            use_path: str = sub_dependant.path  # type: ignore
-            use_sub_dependant = get_dependant(
-                path=use_path,
-                call=call,
-                name=sub_dependant.name,
-                parent_oauth_scopes=sub_dependant.oauth_scopes,
-                scope=sub_dependant.scope,
+            use_sub_dependant = get_overridden_dependant(
+                dependency_overrides_provider=dependency_overrides_provider,
+                dependant=sub_dependant,
             )
+            call = cast(Callable[..., Any], use_sub_dependant.call)
 
         solved_result = await solve_dependencies(
             request=request,
@@ -679,6 +997,20 @@ async def solve_dependencies(
             continue
         if sub_dependant.use_cache and sub_dependant.cache_key in dependency_cache:
             solved = dependency_cache[sub_dependant.cache_key]
+        elif sub_dependant.scope == "app":
+            solved = await _solve_app_dependency(
+                request=request,
+                dependant=use_sub_dependant,
+                cache_key=use_sub_dependant.cache_key,
+                sub_values=solved_result.values,
+            )
+        elif sub_dependant.cache is not None and call is sub_dependant.call:
+            # Overridden dependencies are not cached
+            solved = await _solve_cached_dependency(
+                cache=sub_dependant.cache,
+                dependant=use_sub_dependant,
+                sub_values=solved_result.values,
+            )
         elif (
             use_sub_dependant.is_gen_callable or use_sub_dependant.is_async_gen_callable
         ):
@@ -751,6 +1083,466 @@ async def solve_dependencies(
     )
 
 
+@dataclass
+class DependencyStep:
+    dependant: Dependant
+    # Index of the first step of the sub-tree of this dependant, its sub-dependencies
+    # (recursively) are the steps from there up to this one
+    first_index: int
+    # The parameter name and step index of the sub-dependencies to pass as values
+    sub_dependencies: list[tuple[str, int]]
+    # Only the non-empty ones, with the name of the request attribute to read
+    request_params: list[tuple["RequestParamsExtractor", str]]
+    has_body_params: bool
+    has_special_params: bool
+    call: Callable[..., Any] | None
+    cache_key: DependencyCacheKey
+    use_cache: bool
+    is_generator: bool
+    is_coroutine: bool
+    use_function_stack: bool
+    use_app_scope: bool
+    cache: TTLCache | None
+
+
+@dataclass
+class DependencyPlan:
+    """
+    The dependency tree of a path operation, flattened in the order used by
+    `solve_dependencies()`: each dependency comes after its sub-dependencies, and
+    the last step is the path operation itself.
+    """
+
+    dependant: Dependant
+    steps: list[DependencyStep]
+    # Consecutive sibling dependencies declared with `Depends(parallel=True)`, by
+    # the index of their first step. Each group is the list of the (first, last)
+    # step indexes of each dependency. The outermost group comes first, as nested
+    # groups can start at the same index.
+    parallel_groups: dict[int, list[list[tuple[int, int]]]]
+
+
+def _add_dependency_steps(*, dependant: Dependant, plan: DependencyPlan) -> int:
+    steps = plan.steps
+    first_index = len(steps)
+    sub_dependencies: list[tuple[str, int]] = []
+    parallel_group: list[tuple[int, int]] = []
+    for sub_dependant in [*dependant.dependencies, None]:
+        if parallel_group and (sub_dependant is None or not sub_dependant.parallel):
+            if len(parallel_group) > 1:
+                plan.parallel_groups.setdefault(parallel_group[0][0], []).insert(
+                    0, parallel_group
+                )
+            parallel_group = []
+        if sub_dependant is None:
+            break
+        sub_first_index = len(steps)
+        sub_index = _add_dependency_steps(dependant=sub_dependant, plan=plan)
+        if sub_dependant.parallel:
+            parallel_group.append((sub_first_index, sub_index))
+        if sub_dependant.name is not None:
+            sub_dependencies.append((sub_dependant.name, sub_index))
+    request_params = [
+        (RequestParamsExtractor(fields), attribute)
+        for fields, attribute in (
+            (dependant.path_params, "path_params"),
+            (dependant.query_params, "query_params"),
+            (dependant.header_params, "headers"),
+            (dependant.cookie_params, "cookies"),
+        )
+        if fields
+    ]
+    steps.append(
+        DependencyStep(
+            dependant=dependant,
+            first_index=first_index,
+            sub_dependencies=sub_dependencies,
+            request_params=request_params,
+            has_body_params=bool(dependant.body_params),
+            has_special_params=any(
+                (
+                    dependant.http_connection_param_name,
+                    dependant.request_param_name,
+                    dependant.websocket_param_name,
+                    dependant.background_tasks_param_name,
+                    dependant.response_param_name,
+                    dependant.security_scopes_param_name,
+                )
+            ),
+            call=dependant.call,
+            cache_key=dependant.cache_key,
+            use_cache=dependant.use_cache,
+            is_generator=dependant.is_gen_callable or dependant.is_async_gen_callable,
+            is_coroutine=dependant.is_coroutine_callable,
+            use_function_stack=dependant.scope == "function",
+            use_app_scope=dependant.scope == "app",
+            cache=dependant.cache,
+        )
+    )
+    return len(steps) - 1
+
+
+def get_dependency_plan(dependant: Dependant) -> DependencyPlan:
+    plan = DependencyPlan(dependant=dependant, steps=[], parallel_groups={})
+    _add_dependency_steps(dependant=dependant, plan=plan)
+    return plan
+
+
+class _TaskExitStack:
+    """
+    An `AsyncExitStack` for the dependencies solved by a parallel task, added to
+    the exit stack of the request. When that one is closed, this is closed by the
+    parallel task, the same one that entered the context managers, as cancel
+    scopes and task groups (held by dependencies with `yield`) have to be exited
+    in the task that entered them.
+    """
+
+    def __init__(self) -> None:
+        self.stack = AsyncExitStack()
+        self._closing = anyio.Event()
+        self._closed = anyio.Event()
+        self._exc: BaseException | None = None
+        self._suppressed = False
+        self._error: BaseException | None = None
+
+    async def __aenter__(self) -> "_TaskExitStack":
+        return self
+
+    async def __aexit__(
+        self, exc_type: Any, exc: BaseException | None, traceback: Any
+    ) -> bool:
+        self._exc = exc
+        self._closing.set()
+        await self._closed.wait()
+        if self._error is not None:
+            raise self._error
+        return self._suppressed
+
+    async def close_in_task(self) -> None:
+        # Called by the parallel task, waits until the request closes the stack,
+        # even if the task is cancelled, to always run the exit code
+        with anyio.CancelScope(shield=True):
+            await self._closing.wait()
+        exc = self._exc
+        try:
+            self._suppressed = bool(
+                await self.stack.__aexit__(
+                    type(exc) if exc is not None else None,
+                    exc,
+                    exc.__traceback__ if exc is not None else None,
+                )
+            )
+        except BaseException as e:
+            # Raised in the task of the request, with the exception it passed
+            self._error = e
+        finally:
+            self._closed.set()
+
+
+@asynccontextmanager
+async def _parallel_task_group() -> AsyncIterator[TaskGroup]:
+    error: Exception | None = None
+    async with anyio.create_task_group() as task_group:
+        try:
+            yield task_group
+        except Exception as e:
+            # Raised after the task group, not wrapped in an exception group
+            error = e
+    if error is not None:
+        raise error
+
+
+class _DependencyPlanSolver:
+    def __init__(
+        self,
+        *,
+        request: Request | WebSocket,
+        plan: DependencyPlan,
+        body: dict[str, Any] | FormData | bytes | ValidatedJSONBody | None,
+        embed_body_fields: bool,
+    ) -> None:
+        self.request = request
+        self.plan = plan
+        self.body = body
+        self.embed_body_fields = embed_body_fields
+        self.background_tasks: StarletteBackgroundTasks | None = None
+        self.response = Response()
+        del self.response.headers["content-length"]
+        self.response.status_code = None  # type: ignore  # ty: ignore[unused-ignore-comment]
+        self.dependency_cache: dict[DependencyCacheKey, Any] = {}
+        # The value of each step that was called
+        self.solved_values: dict[int, Any] = {}
+        # The cache keys being solved by parallel dependencies, to solve each once
+        self.pending: dict[DependencyCacheKey, anyio.Event] = {}
+
+    async def solve(
+        self,
+        *,
+        start: int,
+        end: int,
+        errors: list[Any],
+        request_astack: AsyncExitStack,
+        function_astack: AsyncExitStack,
+    ) -> dict[str, Any]:
+        # Solve the steps from start to end (included), return the values for the
+        # last one
+        steps = self.plan.steps
+        parallel_groups = self.plan.parallel_groups
+        last_index = len(steps) - 1
+        # The number of errors before each step, to know if a sub-tree had errors
+        errors_before: dict[int, int] = {}
+        values: dict[str, Any] = {}
+        index = start
+        while index <= end:
+            errors_before[index] = len(errors)
+            if index in parallel_groups:
+                group = next(
+                    (group for group in parallel_groups[index] if group[-1][1] <= end),
+                    None,
+                )
+                if group is not None:
+                    await self.solve_parallel(
+                        group=group,
+                        errors=errors,
+                        request_astack=request_astack,
+                        function_astack=function_astack,
+                    )
+                    index = group[-1][1] + 1
+                    continue
+            step = steps[index]
+            values = await self.get_values(step=step, errors=errors)
+            # The last step is the path operation, it's called by the request
+            # handler, and a dependency with errors in its sub-tree is not called
+            if index != last_index and len(errors) == errors_before[step.first_index]:
+                self.solved_values[index] = await self.call(
+                    step=step,
+                    values=values,
+                    request_astack=request_astack,
+                    function_astack=function_astack,
+                )
+            index += 1
+        return values
+
+    async def solve_parallel(
+        self,
+        *,
+        group: list[tuple[int, int]],
+        errors: list[Any],
+        request_astack: AsyncExitStack,
+        function_astack: AsyncExitStack,
+    ) -> None:
+        # Each dependency gets its own errors and exit stacks, added in the order
+        # they were declared, so that the errors and the exit order of
+        # dependencies with yield are the same as when solving them one after
+        # the other. The task of each dependency waits until its exit stacks are
+        # closed, in a task group that lives until the end of the request
+        group_errors: list[list[Any]] = [[] for _ in group]
+        group_stacks = [(_TaskExitStack(), _TaskExitStack()) for _ in group]
+        exceptions: dict[int, Exception] = {}
+        solved = anyio.Event()
+        remaining = len(group)
+
+        async def solve_one(position: int) -> None:
+            nonlocal remaining
+            first, last = group[position]
+            member_request_astack, member_function_astack = group_stacks[position]
+            try:
+                await self.solve(
+                    start=first,
+                    end=last,
+                    errors=group_errors[position],
+                    request_astack=member_request_astack.stack,
+                    function_astack=member_function_astack.stack,
+                )
+            except Exception as e:
+                exceptions[position] = e
+            remaining -= 1
+            if not remaining:
+                solved.set()
+            await member_function_astack.close_in_task()
+            await member_request_astack.close_in_task()
+
+        task_group = await request_astack.enter_async_context(_parallel_task_group())
+        for member_request_astack, member_function_astack in group_stacks:
+            await request_astack.enter_async_context(member_request_astack)
+            await function_astack.enter_async_context(member_function_astack)
+        for position in range(len(group)):
+            task_group.start_soon(solve_one, position)
+        await solved.wait()
+        if exceptions:
+            raise exceptions[min(exceptions)]
+        for member_errors in group_errors:
+            errors.extend(member_errors)
+
+    async def get_values(
+        self, *, step: DependencyStep, errors: list[Any]
+    ) -> dict[str, Any]:
+        request = self.request
+        values: dict[str, Any] = {}
+        for name, sub_index in step.sub_dependencies:
+            if sub_index in self.solved_values:
+                values[name] = self.solved_values[sub_index]
+        for extractor, attribute in step.request_params:
+            param_values, param_errors = extractor.extract(getattr(request, attribute))
+            values.update(param_values)
+            errors.extend(param_errors)
+        if step.has_body_params:
+            body_values, body_errors = await request_body_to_args(
+                body_fields=step.dependant.body_params,
+                received_body=self.body,
+                embed_body_fields=self.embed_body_fields,
+            )
+            values.update(body_values)
+            errors.extend(body_errors)
+        if step.has_special_params:
+            dependant = step.dependant
+            if dependant.http_connection_param_name:
+                values[dependant.http_connection_param_name] = request
+            if dependant.request_param_name and isinstance(request, Request):
+                values[dependant.request_param_name] = request
+            elif dependant.websocket_param_name and isinstance(request, WebSocket):
+                values[dependant.websocket_param_name] = request
+            if dependant.background_tasks_param_name:
+                if self.background_tasks is None:
+                    self.background_tasks = BackgroundTasks()
+                values[dependant.background_tasks_param_name] = self.background_tasks
+            if dependant.response_param_name:
+                values[dependant.response_param_name] = self.response
+            if dependant.security_scopes_param_name:
+                values[dependant.security_scopes_param_name] = SecurityScopes(
+                    scopes=dependant.oauth_scopes
+                )
+        return values
+
+    async def call(
+        self,
+        *,
+        step: DependencyStep,
+        values: dict[str, Any],
+        request_astack: AsyncExitStack,
+        function_astack: AsyncExitStack,
+    ) -> Any:
+        dependency_cache = self.dependency_cache
+        cache_key = step.cache_key
+        if step.use_cache:
+            pending = self.pending.get(cache_key)
+            if pending is not None:
+                await pending.wait()
+            if cache_key in dependency_cache:
+                return dependency_cache[cache_key]
+        if self.plan.parallel_groups and cache_key not in self.pending:
+            pending = self.pending[cache_key] = anyio.Event()
+            try:
+                solved = await self.run(
+                    step=step,
+                    values=values,
+                    request_astack=request_astack,
+                    function_astack=function_astack,
+                )
+            finally:
+                del self.pending[cache_key]
+                pending.set()
+        else:
+            solved = await self.run(
+                step=step,
+                values=values,
+                request_astack=request_astack,
+                function_astack=function_astack,
+            )
+        if cache_key not in dependency_cache:
+            dependency_cache[cache_key] = solved
+        return solved
+
+    async def run(
+        self,
+        *,
+        step: DependencyStep,
+        values: dict[str, Any],
+        request_astack: AsyncExitStack,
+        function_astack: AsyncExitStack,
+    ) -> Any:
+        if step.use_app_scope:
+            return await _solve_app_dependency(
+                request=self.request,
+                dependant=step.dependant,
+                cache_key=step.cache_key,
+                sub_values=values,
+            )
+        elif step.cache is not None:
+            return await _solve_cached_dependency(
+                cache=step.cache, dependant=step.dependant, sub_values=values
+            )
+        elif step.is_generator:
+            return await _solve_generator(
+                dependant=step.dependant,
+                stack=function_astack if step.use_function_stack else request_astack,
+                sub_values=values,
+            )
+        elif step.is_coroutine:
+            return await cast(Callable[..., Any], step.call)(**values)
+        else:
+            return await run_in_threadpool(
+                cast(Callable[..., Any], step.call), **values
+            )
+
+
+async def solve_dependency_plan(
+    *,
+    request: Request | WebSocket,
+    plan: DependencyPlan,
+    body: dict[str, Any] | FormData | bytes | ValidatedJSONBody | None = None,
+    dependency_overrides_provider: Any | None = None,
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+) -> SolvedDependency:
+    """
+    Same as `solve_dependencies()` but running the steps of a plan from
+    `get_dependency_plan()` in a loop instead of recursively. Groups of
+    dependencies declared with `Depends(parallel=True)` are solved concurrently.
+
+    Dependency overrides can replace any part of the tree, with them this uses
+    `solve_dependencies()`.
+    """
+    if (
+        dependency_overrides_provider
+        and dependency_overrides_provider.dependency_overrides
+    ):
+        return await solve_dependencies(
+            request=request,
+            dependant=plan.dependant,
+            body=body,
+            dependency_overrides_provider=dependency_overrides_provider,
+            async_exit_stack=async_exit_stack,
+            embed_body_fields=embed_body_fields,
+        )
+    request_astack = request.scope.get("fastapi_inner_astack")
+    assert isinstance(request_astack, AsyncExitStack), (
+        "fastapi_inner_astack not found in request scope"
+    )
+    function_astack = request.scope.get("fastapi_function_astack")
+    assert isinstance(function_astack, AsyncExitStack), (
+        "fastapi_function_astack not found in request scope"
+    )
+    solver = _DependencyPlanSolver(
+        request=request, plan=plan, body=body, embed_body_fields=embed_body_fields
+    )
+    errors: list[Any] = []
+    values = await solver.solve(
+        start=0,
+        end=len(plan.steps) - 1,
+        errors=errors,
+        request_astack=request_astack,
+        function_astack=function_astack,
+    )
+    return SolvedDependency(
+        values=values,
+        errors=errors,
+        background_tasks=solver.background_tasks,
+        response=solver.response,
+        dependency_cache=solver.dependency_cache,
+    )
+
+
 def _validate_value_with_model_field(
     *, field: ModelField, value: Any, values: dict[str, Any], loc: tuple[str, ...]
 ) -> tuple[Any, list[Any]]:
@@ -758,7 +1550,7 @@ def _validate_value_with_model_field(
         if field.field_info.is_required():
             return None, [get_missing_field_error(loc=loc)]
         else:
-            return deepcopy(field.default), []
+            return field.copy_default(), []
     return field.validate(value, values, loc=loc)
 
 
@@ -807,102 +1599,291 @@ def _get_multidict_value(
         if field.field_info.is_required():
             return
         else:
-            return deepcopy(field.default)
+            return field.copy_default()
     return value
 
 
-def request_params_to_args(
-    fields: Sequence[ModelField],
-    received_params: Mapping[str, Any] | QueryParams | Headers,
-) -> tuple[dict[str, Any], list[Any]]:
-    values: dict[str, Any] = {}
-    errors: list[dict[str, Any]] = []
+class ParamExtractor:
+    """
+    Reads the value of a parameter field from the request, the same way as
+    `_get_multidict_value()`, but with the decisions that only depend on the
+    field made once, when the route is created.
+    """
 
-    if not fields:
-        return values, errors
+    __slots__ = (
+        "field",
+        "name",
+        "alias",
+        "header_alias",
+        "is_sequence",
+        "check_empty_sequence",
+        "is_scalar_mapping",
+        "is_scalar_sequence_mapping",
+        "is_form",
+    )
 
-    first_field = fields[0]
-    fields_to_extract = fields
-    single_not_embedded_field = False
-    default_convert_underscores = True
-    if len(fields) == 1 and lenient_issubclass(
-        first_field.field_info.annotation, BaseModel
-    ):
-        fields_to_extract = get_cached_model_fields(first_field.field_info.annotation)
-        single_not_embedded_field = True
-        # If headers are in a Pydantic model, the way to disable convert_underscores
-        # would be with Header(convert_underscores=False) at the Pydantic model level
-        default_convert_underscores = getattr(
-            first_field.field_info, "convert_underscores", True
+    def __init__(self, field: ModelField, *, convert_underscores: bool = True):
+        annotation = field.field_info.annotation
+        self.field = field
+        self.name = field.name
+        self.alias = get_validation_alias(field)
+        # Used for the fields of a Pydantic model for headers, each field doesn't
+        # have a FieldInfo of type Header with the default convert_underscores=True
+        self.header_alias = self.alias
+        if (
+            getattr(field.field_info, "convert_underscores", convert_underscores)
+            and self.alias == field.name
+        ):
+            self.header_alias = self.alias.replace("_", "-")
+        self.check_empty_sequence = field_annotation_is_sequence(annotation)
+        self.is_sequence = self.check_empty_sequence and not _is_json_field(field)
+        self.is_scalar_mapping = field_annotation_is_scalar_mapping(annotation)
+        self.is_scalar_sequence_mapping = field_annotation_is_scalar_sequence_mapping(
+            annotation
         )
+        self.is_form = isinstance(field.field_info, params.Form)
+
+    def get_value(
+        self,
+        received_params: Any,
+        *,
+        alias: str,
+        is_multidict: bool,
+        is_query_params: bool,
+    ) -> Any:
+        value: Any = None
+        if self.is_sequence and is_multidict:
+            value = received_params.getlist(alias)
+        elif alias in received_params:
+            value = received_params[alias]
+        elif received_params and is_query_params:
+            if self.is_scalar_mapping:
+                value = dict(received_params)
+            elif self.is_scalar_sequence_mapping:
+                value = {
+                    key: received_params.getlist(key) for key in received_params.keys()
+                }
+        if (
+            value is None
+            or (self.is_form and isinstance(value, str) and value == "")
+            or (self.check_empty_sequence and len(value) == 0)
+        ):
+            if self.field.field_info.is_required():
+                return None
+            else:
+                return self.field.copy_default()
+        return value
+
 
-    params_to_process: dict[str, Any] = {}
+class RequestParamsExtractor:
+    """
+    Extracts and validates the values of a group of parameter fields (e.g. all the
+    query parameters of a dependency), the same way as `request_params_to_args()`.
+
+    Create it once, when the route is created, and call `extract()` on each
+    request.
+    """
 
-    processed_keys = set()
+    __slots__ = (
+        "fields",
+        "model_field",
+        "model_loc",
+        "extractors",
+        "locs",
+        "mapping_names",
+        "mapping_aliases",
+        "validator",
+        "keys",
+    )
 
-    for field in fields_to_extract:
-        alias = None
-        if isinstance(received_params, Headers):
-            # Handle fields extracted from a Pydantic Model for a header, each field
-            # doesn't have a FieldInfo of type Header with the default convert_underscores=True
+    def __init__(self, fields: Sequence[ModelField]):
+        self.fields = fields
+        # A single Pydantic model with all the parameters, not embedded
+        self.model_field: ModelField | None = None
+        self.model_loc: tuple[str, ...] = ()
+        self.extractors: list[ParamExtractor] = []
+        self.locs: list[tuple[str, ...]] = []
+        # The values of mapping fields don't include the other fields
+        self.mapping_names: list[str] = []
+        self.mapping_aliases: list[str] = []
+        # Validate all the fields with one call, instead of one call per field
+        self.validator: FieldsValidator | None = None
+        # The keys of the values for the validator, by field
+        self.keys = [str(index) for index in range(len(fields))]
+        if not fields:
+            return
+        first_field = fields[0]
+        for field in fields:
+            field_info = field.field_info
+            assert isinstance(field_info, params.Param), (
+                "Params must be subclasses of Param"
+            )
+            self.locs.append((field_info.in_.value, get_validation_alias(field)))
+            if field_annotation_is_scalar_mapping(
+                field_info.annotation
+            ) or field_annotation_is_scalar_sequence_mapping(field_info.annotation):
+                self.mapping_names.append(field.name)
+            self.mapping_aliases.append(field.alias)
+        if len(fields) == 1 and lenient_issubclass(
+            first_field.field_info.annotation, BaseModel
+        ):
+            self.model_field = first_field
+            self.model_loc = (cast(params.Param, first_field.field_info).in_.value,)
+            # If headers are in a Pydantic model, the way to disable
+            # convert_underscores would be with Header(convert_underscores=False) at
+            # the Pydantic model level
             convert_underscores = getattr(
-                field.field_info, "convert_underscores", default_convert_underscores
+                first_field.field_info, "convert_underscores", True
             )
-            if convert_underscores:
-                alias = get_validation_alias(field)
-                if alias == field.name:
-                    alias = alias.replace("_", "-")
-        value = _get_multidict_value(field, received_params, alias=alias)
-        if value is not None:
-            params_to_process[get_validation_alias(field)] = value
-        processed_keys.add(alias or get_validation_alias(field))
-
-    for key in received_params.keys():
-        if key not in processed_keys:
-            if isinstance(received_params, (ImmutableMultiDict, Headers)):
-                value = received_params.getlist(key)
-                if isinstance(value, list) and (len(value) == 1):
-                    params_to_process[key] = value[0]
+            self.extractors = [
+                ParamExtractor(field, convert_underscores=convert_underscores)
+                for field in get_cached_model_fields(first_field.field_info.annotation)
+            ]
+        else:
+            self.extractors = [ParamExtractor(field) for field in fields]
+            if len(fields) > 1:
+                self.validator = get_fields_validator(fields)
+
+    def extract(
+        self, received_params: Mapping[str, Any] | QueryParams | Headers
+    ) -> tuple[dict[str, Any], list[Any]]:
+        values: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        if not self.fields:
+            return values, errors
+        is_headers = isinstance(received_params, Headers)
+        is_multidict = is_headers or isinstance(received_params, ImmutableMultiDict)
+        is_query_params = isinstance(received_params, QueryParams)
+        model_field = self.model_field
+        if model_field is not None:
+            return self._extract_model(
+                model_field,
+                received_params,
+                is_headers=is_headers,
+                is_multidict=is_multidict,
+                is_query_params=is_query_params,
+            )
+        if self.validator is not None:
+            self._extract_combined(
+                self.validator,
+                received_params,
+                values=values,
+                errors=errors,
+                is_multidict=is_multidict,
+                is_query_params=is_query_params,
+            )
+        else:
+            for extractor, loc in zip(self.extractors, self.locs, strict=True):
+                value = extractor.get_value(
+                    received_params,
+                    alias=extractor.alias,
+                    is_multidict=is_multidict,
+                    is_query_params=is_query_params,
+                )
+                v_, errors_ = _validate_value_with_model_field(
+                    field=extractor.field, value=value, values=values, loc=loc
+                )
+                if errors_:
+                    errors.extend(errors_)
+                else:
+                    values[extractor.name] = v_
+        # remove keys which were captured by a mapping query field but were
+        # specified as individual fields
+        for name in self.mapping_names:
+            mapping_value = values.get(name)
+            if isinstance(mapping_value, dict):
+                for alias in self.mapping_aliases:
+                    mapping_value.pop(alias, None)
+        return values, errors
+
+    def _extract_combined(
+        self,
+        validator: FieldsValidator,
+        received_params: Any,
+        *,
+        values: dict[str, Any],
+        errors: list[dict[str, Any]],
+        is_multidict: bool,
+        is_query_params: bool,
+    ) -> None:
+        # Same as _validate_value_with_model_field() for each field, but
+        # validating all the received values together
+        to_validate: dict[str, Any] = {}
+        for key, extractor in zip(self.keys, self.extractors, strict=True):
+            value = extractor.get_value(
+                received_params,
+                alias=extractor.alias,
+                is_multidict=is_multidict,
+                is_query_params=is_query_params,
+            )
+            if value is not None:
+                to_validate[key] = value
+        validated, field_errors = validator.validate(to_validate)
+        for key, extractor, loc in zip(
+            self.keys, self.extractors, self.locs, strict=True
+        ):
+            if key not in to_validate:
+                if extractor.field.field_info.is_required():
+                    errors.append(get_missing_field_error(loc=loc))
                 else:
-                    params_to_process[key] = value
+                    values[extractor.name] = extractor.field.copy_default()
+            elif not field_errors:
+                values[extractor.name] = validated[key]
+            elif key in field_errors:
+                errors.extend(
+                    {**error, "loc": loc + error["loc"]} for error in field_errors[key]
+                )
             else:
-                params_to_process[key] = received_params.get(key)
+                # There's no partial result, validate the valid values again
+                values[extractor.name] = extractor.field.validate(
+                    to_validate[key], loc=loc
+                )[0]
+
+    def _extract_model(
+        self,
+        model_field: ModelField,
+        received_params: Any,
+        *,
+        is_headers: bool,
+        is_multidict: bool,
+        is_query_params: bool,
+    ) -> tuple[dict[str, Any], list[Any]]:
+        params_to_process: dict[str, Any] = {}
+        processed_keys = set()
+        for extractor in self.extractors:
+            alias = extractor.header_alias if is_headers else extractor.alias
+            value = extractor.get_value(
+                received_params,
+                alias=alias,
+                is_multidict=is_multidict,
+                is_query_params=is_query_params,
+            )
+            if value is not None:
+                params_to_process[extractor.alias] = value
+            processed_keys.add(alias)
+
+        for key in received_params.keys():
+            if key not in processed_keys:
+                if is_multidict:
+                    value = received_params.getlist(key)
+                    if isinstance(value, list) and (len(value) == 1):
+                        params_to_process[key] = value[0]
+                    else:
+                        params_to_process[key] = value
+                else:
+                    params_to_process[key] = received_params.get(key)
 
-    if single_not_embedded_field:
-        field_info = first_field.field_info
-        assert isinstance(field_info, params.Param), (
-            "Params must be subclasses of Param"
-        )
-        loc: tuple[str, ...] = (field_info.in_.value,)
         v_, errors_ = _validate_value_with_model_field(
-            field=first_field, value=params_to_process, values=values, loc=loc
+            field=model_field, value=params_to_process, values={}, loc=self.model_loc
         )
-        return {first_field.name: v_}, errors_
+        return {model_field.name: v_}, errors_
 
-    for field in fields:
-        value = _get_multidict_value(field, received_params)
-        field_info = field.field_info
-        assert isinstance(field_info, params.Param), (
-            "Params must be subclasses of Param"
-        )
-        loc = (field_info.in_.value, get_validation_alias(field))
-        v_, errors_ = _validate_value_with_model_field(
-            field=field, value=value, values=values, loc=loc
-        )
-        if errors_:
-            errors.extend(errors_)
-        else:
-            values[field.name] = v_
-    # remove keys which were captured by a mapping query field but were
-    # specified as individual fields
-    for field in fields:
-        if isinstance(values.get(field.name), dict) and (
-            field_annotation_is_scalar_mapping(field.field_info.annotation)
-            or field_annotation_is_scalar_sequence_mapping(field.field_info.annotation)
-        ):
-            for f_ in fields:
-                values[field.name].pop(f_.alias, None)
-    return values, errors
+
+def request_params_to_args(
+    fields: Sequence[ModelField],
+    received_params: Mapping[str, Any] | QueryParams | Headers,
+) -> tuple[dict[str, Any], list[Any]]:
+    return RequestParamsExtractor(fields).extract(received_params)
 
 
 def is_union_of_base_models(field_type: Any) -> bool:
@@ -989,7 +1970,7 @@ async def _extract_form_body(
 
 async def request_body_to_args(
     body_fields: list[ModelField],
-    received_body: dict[str, Any] | FormData | bytes | None,
+    received_body: dict[str, Any] | FormData | bytes | ValidatedJSONBody | None,
     embed_body_fields: bool,
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     values: dict[str, Any] = {}
@@ -997,6 +1978,11 @@ async def request_body_to_args(
     assert body_fields, "request_body_to_args() should be called with fields"
     single_not_embedded_field = len(body_fields) == 1 and not embed_body_fields
     first_field = body_fields[0]
+    if isinstance(received_body, ValidatedJSONBody):
+        if single_not_embedded_field and received_body.field is first_field:
+            return {first_field.name: received_body.value}, []
+        # e.g. a dependency override with other body fields
+        received_body = cast(dict[str, Any], received_body.decode())
     body_to_process = received_body
 
     fields_to_extract: list[ModelField] = body_fields
@@ -2,7 +2,7 @@ import copy
 import http.client
 import inspect
 import warnings
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, Literal, cast
 
 from fastapi import routing
@@ -26,7 +26,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import FastAPIDeprecationWarning
 from fastapi.openapi.constants import METHODS_WITH_BODY, REF_PREFIX
 from fastapi.openapi.models import OpenAPI
-from fastapi.params import Body, ParamTypes
+from fastapi.params import Body, Form, ParamTypes
 from fastapi.responses import Response
 from fastapi.sse import _SSE_EVENT_SCHEMA
 from fastapi.types import ModelNameMap
@@ -185,6 +185,7 @@ def get_openapi_operation_request_body(
         tuple[ModelField, Literal["validation", "serialization"]], dict[str, Any]
     ],
     separate_input_output_schemas: bool = True,
+    body_decoders: Mapping[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     if not body_field:
         return None
@@ -209,6 +210,10 @@ def get_openapi_operation_request_body(
     elif field_info.example is not _Unset:
         request_media_content["example"] = jsonable_encoder(field_info.example)
     request_body_oai["content"] = {request_media_type: request_media_content}
+    if body_decoders and not isinstance(field_info, Form):
+        # The same schema is accepted with the media types of the body decoders
+        for media_type in body_decoders:
+            request_body_oai["content"].setdefault(media_type, request_media_content)
     return request_body_oai
 
 
@@ -317,6 +322,7 @@ def get_openapi_path(
                     model_name_map=model_name_map,
                     field_mapping=field_mapping,
                     separate_input_output_schemas=separate_input_output_schemas,
+                    body_decoders=route.body_decoders,
                 )
                 if request_body_oai:
                     operation["requestBody"] = request_body_oai
@@ -407,6 +413,16 @@ def get_openapi_path(
                     ).setdefault("content", {}).setdefault(
                         route_response_media_type, {}
                     )["schema"] = response_schema
+                    if route.response_encoders and isinstance(
+                        route.response_class, DefaultPlaceholder
+                    ):
+                        response_content = operation["responses"][status_code][
+                            "content"
+                        ]
+                        for media_type in route.response_encoders:
+                            response_content.setdefault(
+                                media_type, {"schema": response_schema}
+                            )
             if route.responses:
                 operation_responses = operation.setdefault("responses", {})
                 for (
@@ -4,6 +4,7 @@ from typing import Annotated, Any, Literal
 from annotated_doc import Doc
 from fastapi import params
 from fastapi._compat import Undefined
+from fastapi.cache import TTLCache
 from fastapi.datastructures import _Unset
 from fastapi.openapi.models import Example
 from pydantic import AliasChoices, AliasPath
@@ -2314,7 +2315,7 @@ def Depends(  # noqa: N802
         ),
     ] = True,
     scope: Annotated[
-        Literal["function", "request"] | None,
+        Literal["function", "request", "app"] | None,
         Doc(
             """
             Mainly for dependencies with `yield`, define when the dependency function
@@ -2330,12 +2331,66 @@ def Depends(  # noqa: N802
                 that handles the request (similar to when using `"function"`), but end
                 **after** the response is sent back to the client. So, the dependency
                 function will be executed **around** the **request** and response cycle.
+            * `"app"`: call the dependency only once, the first time it's needed, and
+                share the same value with all the requests. For a dependency with
+                `yield`, end it (the code after `yield`) when the application shuts
+                down, this requires running the application lifespan (e.g. with
+                `with TestClient(app) as client:` in tests). A dependency with
+                scope `"app"` can only depend on other dependencies with scope
+                `"app"`, and can't use values from the request (e.g. query or
+                header parameters, the `Request`, or the `Response`).
 
             Read more about it in the
             [FastAPI docs for FastAPI Dependencies with yield](https://fastapi.tiangolo.com/tutorial/dependencies/dependencies-with-yield/#early-exit-and-scope)
             """
         ),
     ] = None,
+    parallel: Annotated[
+        bool,
+        Doc(
+            """
+            Solve this dependency concurrently with the other dependencies next to
+            it (in the same function) that also have `parallel=True`.
+
+            This is useful for independent dependencies that wait for I/O, for
+            example one that gets the user from a cache service and another one
+            that loads feature flags from a config service, the request waits for
+            the slowest one instead of for all of them, one after the other.
+
+            Each dependency is still solved once per request (unless it has
+            `use_cache=False`), the validation errors are reported in the same
+            order, and dependencies with `yield` are closed in the same order, as
+            when solving them one after the other. Context variables set by these
+            dependencies are not visible outside of them.
+
+            Each of these dependencies runs in its own task, that is kept until
+            the exit code of its dependencies with `yield` (the code after
+            `yield`) has run, so that they can hold cancel scopes or task groups
+            across `yield`. If one of them raises an exception, it's raised after
+            the others finish, they are not cancelled.
+            """
+        ),
+    ] = False,
+    cache: Annotated[
+        TTLCache | None,
+        Doc(
+            """
+            A `TTLCache` to store the value of this dependency and re-use it in
+            the next requests, instead of only in the same request.
+
+            The value is stored for each combination of the resolved inputs of
+            the dependency (its parameters, sub-dependencies, etc.), so, the
+            dependency is called again, for example, when a header it declares
+            has a different value. If some of those values are not hashable, the
+            dependency is called every time.
+
+            It can't be used with dependencies with `yield`, nor with dependencies
+            that declare the objects created for each request (the `Request`, the
+            `Response`, `BackgroundTasks`, etc.). Its sub-dependencies need a
+            `cache` or `scope="app"` too.
+            """
+        ),
+    ] = None,
 ) -> Any:
     """
     Declare a FastAPI dependency.
@@ -2366,7 +2421,13 @@ def Depends(  # noqa: N802
         return commons
     ```
     """
-    return params.Depends(dependency=dependency, use_cache=use_cache, scope=scope)
+    return params.Depends(
+        dependency=dependency,
+        use_cache=use_cache,
+        scope=scope,
+        parallel=parallel,
+        cache=cache,
+    )
 
 
 def Security(  # noqa: N802
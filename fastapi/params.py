@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Annotated, Any, Literal
 
+from fastapi.cache import TTLCache
 from fastapi.exceptions import FastAPIDeprecationWarning
 from fastapi.openapi.models import Example
 from pydantic import AliasChoices, AliasPath
@@ -746,7 +747,9 @@ class File(Form):  # type: ignore[misc]  # ty: ignore[unused-ignore-comment]
 class Depends:
     dependency: Callable[..., Any] | None = None
     use_cache: bool = True
-    scope: Literal["function", "request"] | None = None
+    scope: Literal["function", "request", "app"] | None = None
+    parallel: bool = False
+    cache: TTLCache | None = None
 
 
 @dataclass(frozen=True)
@@ -1,7 +1,9 @@
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, TypeVar
 
 from fastapi.exceptions import FastAPIDeprecationWarning
 from fastapi.sse import EventSourceResponse as EventSourceResponse  # noqa
+from starlette.background import BackgroundTask
 from starlette.responses import FileResponse as FileResponse  # noqa
 from starlette.responses import HTMLResponse as HTMLResponse  # noqa
 from starlette.responses import JSONResponse as JSONResponse  # noqa
@@ -9,7 +11,7 @@ from starlette.responses import PlainTextResponse as PlainTextResponse  # noqa
 from starlette.responses import RedirectResponse as RedirectResponse  # noqa
 from starlette.responses import Response as Response  # noqa
 from starlette.responses import StreamingResponse as StreamingResponse  # noqa
-from typing_extensions import deprecated
+from typing_extensions import Self, deprecated
 
 try:
     import ujson
@@ -23,6 +25,41 @@ except ImportError:  # pragma: nocover
     orjson = None  # type: ignore
 
 
+ResponseT = TypeVar("ResponseT", bound=Response)
+
+
+def response_from_json_bytes(
+    response_class: type[ResponseT],
+    content: bytes,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+    media_type: str | None = None,
+    background: BackgroundTask | None = None,
+) -> ResponseT:
+    """
+    Create a `response_class` response with `content` already serialized to JSON
+    bytes (e.g. by Pydantic), without calling its `render()` method.
+
+    The same as `response_class(...)`, it goes through its `__init__()`, so it
+    keeps its media type, headers, etc.
+    """
+    response = response_class.__new__(response_class)
+    # Only for this instance, __init__() stores the bytes as the body, and
+    # init_headers() sets the content-length for them
+    response.render = lambda _: content  # type: ignore[method-assign, assignment]
+    try:
+        response.__init__(  # type: ignore[misc]
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+    finally:
+        del response.render
+    return response
+
+
 @deprecated(
     "UJSONResponse is deprecated, FastAPI now serializes data directly to JSON "
     "bytes via Pydantic when a return type or response model is set, which is "
@@ -52,6 +89,24 @@ class UJSONResponse(JSONResponse):
         assert ujson is not None, "ujson must be installed to use UJSONResponse"
         return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
 
+    @classmethod
+    def from_json_bytes(
+        cls,
+        content: bytes,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> Self:
+        return response_from_json_bytes(
+            cls,
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+
 
 @deprecated(
     "ORJSONResponse is deprecated, FastAPI now serializes data directly to JSON "
@@ -83,3 +138,21 @@ class ORJSONResponse(JSONResponse):
         return orjson.dumps(
             content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
         )
+
+    @classmethod
+    def from_json_bytes(
+        cls,
+        content: bytes,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> Self:
+        return response_from_json_bytes(
+            cls,
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
@@ -1,8 +1,11 @@
 import contextlib
-import email.message
 import functools
 import inspect
+import itertools
 import json
+import operator
+import threading
+import traceback
 import types
 from collections.abc import (
     AsyncIterator,
@@ -11,6 +14,7 @@ from collections.abc import (
     Collection,
     Coroutine,
     Generator,
+    Iterable,
     Iterator,
     Mapping,
     Sequence,
@@ -20,13 +24,19 @@ from contextlib import (
     AbstractContextManager,
     AsyncExitStack,
     asynccontextmanager,
+    contextmanager,
 )
+from contextvars import ContextVar
 from enum import Enum, IntEnum
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     Any,
+    Literal,
     TypeVar,
     cast,
+    get_args,
+    get_origin,
 )
 
 import anyio
@@ -35,20 +45,25 @@ from anyio.abc import ObjectReceiveStream
 from fastapi import params
 from fastapi._compat import (
     ModelField,
-    Undefined,
     lenient_issubclass,
 )
 from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import (
+    SolvedDependency,
+    ValidatedJSONBody,
     _should_embed_body_fields,
+    app_dependencies_lifespan,
+    copy_dependant,
     get_body_field,
     get_dependant,
+    get_dependency_plan,
     get_flat_dependant,
     get_parameterless_sub_dependant,
     get_stream_item_type,
     get_typed_return_annotation,
-    solve_dependencies,
+    solve_dependency_plan,
+    validate_json_body,
 )
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import (
@@ -61,26 +76,50 @@ from fastapi.exceptions import (
 from fastapi.sse import (
     _PING_INTERVAL,
     KEEPALIVE_COMMENT,
+    EncodedServerSentEvent,
     EventSourceResponse,
     ServerSentEvent,
+    _encode_server_sent_event,
+    _get_keepalive_scheduler,
+    _keepalive_scheduler_lifespan,
+    _request_last_event_id,
     format_sse_event,
 )
-from fastapi.types import DecoratedCallable, IncEx
+from fastapi.streaming import JSONLBuffer, buffered_jsonl_stream
+from fastapi.types import BodyDecoder, DecoratedCallable, IncEx, ResponseEncoder
 from fastapi.utils import (
+    copy_model_field,
     create_model_field,
     generate_unique_id,
+    get_accepted_media_type,
+    get_content_type_info,
+    get_path_param_names,
     get_value_or_default,
     is_body_allowed_for_status_code,
 )
+from pydantic import BaseModel
 from starlette import routing
 from starlette._exception_handler import wrap_app_handling_exceptions
-from starlette._utils import is_async_callable
+from starlette._utils import get_route_path, is_async_callable
 from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
-from starlette.datastructures import FormData
+from starlette.convertors import (
+    FloatConvertor,
+    IntegerConvertor,
+    PathConvertor,
+    StringConvertor,
+    UUIDConvertor,
+)
+from starlette.datastructures import URL, FormData
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.routing import (
+    PARAM_REGEX,
     BaseRoute,
     Match,
     compile_path,
@@ -247,6 +286,240 @@ class _DefaultLifespan:
         return self
 
 
+# Built-in convertors whose regex only ever matches a non-empty part of a single
+# path segment, so they can be indexed as a wildcard segment in the route tree.
+# Checked by exact type, as subclasses could use a different regex.
+_SEGMENT_CONVERTORS = (
+    StringConvertor,
+    IntegerConvertor,
+    FloatConvertor,
+    UUIDConvertor,
+)
+
+
+class _RouteTreeNode:
+    __slots__ = ("static", "param", "tail", "routes")
+
+    def __init__(self) -> None:
+        # Children for segments that are plain static text
+        self.static: dict[str, _RouteTreeNode] = {}
+        # Child for segments that contain at least one path parameter
+        self.param: _RouteTreeNode | None = None
+        # Indexes of routes with a trailing `{name:path}` starting at this segment
+        self.tail: list[int] = []
+        # Indexes of routes whose path ends exactly at this node
+        self.routes: list[int] = []
+
+
+class _RouteList(list[BaseRoute]):
+    """
+    A list of routes that counts its changes in `version`, so that the route
+    lookup tables built from it can be invalidated when a route is added,
+    removed, or replaced, without comparing all the routes on each request.
+    """
+
+    version = 0
+
+
+def _count_route_list_changes(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self: _RouteList, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_RouteList, _name, _count_route_list_changes(_name))
+
+
+class _RouteTree:
+    """
+    Prefix tree (radix tree) of the routes of a router, keyed by path segment.
+
+    It's only used to narrow down which routes could match a given path, each
+    candidate is then still checked with its own `matches()`, in declaration
+    order, so the semantics are exactly the same as Starlette's linear scan.
+
+    Routes that can't be indexed safely (e.g. `Host` routes, custom `matches()`
+    implementations, or custom path convertors) are always considered
+    candidates.
+    """
+
+    def __init__(self, routes: list[BaseRoute]) -> None:
+        self.routes_list = routes
+        self.routes_version = getattr(routes, "version", None)
+        self.routes = tuple(routes)
+        self.root = _RouteTreeNode()
+        self.always: list[int] = []
+        for index, route in enumerate(self.routes):
+            segments = self._get_route_segments(route)
+            if segments is None:
+                self.always.append(index)
+            else:
+                self._insert(index, segments)
+
+    def is_current(self, routes: list[BaseRoute]) -> bool:
+        if routes is not self.routes_list:
+            return False
+        if isinstance(routes, _RouteList):
+            return routes.version == self.routes_version
+        # A plain list assigned to the router, compare the routes themselves, as
+        # one could have been replaced in place
+        return len(routes) == len(self.routes) and all(
+            map(operator.is_, routes, self.routes)
+        )
+
+    @staticmethod
+    def _get_route_segments(route: BaseRoute) -> list[tuple[str, str]] | None:
+        matches = type(route).matches
+        if matches in (routing.Mount.matches,):
+            path = cast(routing.Mount, route).path + "/{path:path}"
+        elif matches in (
+            routing.Route.matches,
+            routing.WebSocketRoute.matches,
+            APIRoute.matches,
+            APIWebSocketRoute.matches,
+        ):
+            path = cast(routing.Route, route).path
+        else:
+            return None
+        convertors = cast(routing.Route, route).param_convertors
+        parts = path[1:].split("/")
+        segments: list[tuple[str, str]] = []
+        for position, part in enumerate(parts):
+            param_matches = list(PARAM_REGEX.finditer(part))
+            if not param_matches:
+                segments.append(("static", part))
+                continue
+            param_names = [match.group(1) for match in param_matches]
+            param_convertor_types = [type(convertors.get(name)) for name in param_names]
+            if PathConvertor in param_convertor_types:
+                # Only a whole trailing segment like `{name:path}` can be indexed
+                if position == len(parts) - 1 and param_matches[0].group(0) == part:
+                    segments.append(("tail", part))
+                    continue
+                return None
+            if not all(
+                convertor_type in _SEGMENT_CONVERTORS
+                for convertor_type in param_convertor_types
+            ):
+                return None
+            segments.append(("param", part))
+        return segments
+
+    def _insert(self, index: int, segments: list[tuple[str, str]]) -> None:
+        node = self.root
+        for kind, part in segments:
+            if kind == "tail":
+                node.tail.append(index)
+                return
+            if kind == "param":
+                if node.param is None:
+                    node.param = _RouteTreeNode()
+                node = node.param
+            else:
+                node = node.static.setdefault(part, _RouteTreeNode())
+        node.routes.append(index)
+
+    def get_candidate_indexes(self, route_path: str) -> list[int]:
+        if not route_path.startswith("/"):
+            return list(range(len(self.routes)))
+        found = list(self.always)
+        nodes = [self.root]
+        for segment in route_path[1:].split("/"):
+            next_nodes: list[_RouteTreeNode] = []
+            for node in nodes:
+                # A trailing `{name:path}` matches one or more remaining segments
+                found.extend(node.tail)
+                child = node.static.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                if segment and node.param is not None:
+                    next_nodes.append(node.param)
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            found.extend(node.routes)
+        found.sort()
+        return found
+
+    def get_candidates(self, route_path: str) -> list[BaseRoute]:
+        return [self.routes[index] for index in self.get_candidate_indexes(route_path)]
+
+
+class _StaticRouteTable:
+    """
+    Hash table from `(method, path)` to the HTTP routes without path parameters.
+
+    Each entry stores the routes to check, in order: the routes declared before
+    the static one that could also match the same path (e.g. `/items/{item_id}`
+    declared before `/items/special`), and then the static route itself. This
+    keeps the declaration order precedence of the linear scan.
+    """
+
+    def __init__(self, route_tree: _RouteTree) -> None:
+        self.route_tree = route_tree
+        self.routes: dict[tuple[str, str], tuple[BaseRoute, ...]] = {}
+        routes = route_tree.routes
+        static_indexes: set[int] = set()
+        for index, route in enumerate(routes):
+            if not self._is_static_route(route):
+                continue
+            route = cast(routing.Route, route)
+            static_indexes.add(index)
+            shadowing_routes = tuple(
+                routes[candidate]
+                for candidate in route_tree.get_candidate_indexes(route.path)
+                if candidate < index
+                and candidate not in static_indexes
+                and self._could_match(routes[candidate], route.path)
+            )
+            for method in route.methods or ():
+                self.routes.setdefault((method, route.path), (*shadowing_routes, route))
+
+    def is_current(self, routes: list[BaseRoute]) -> bool:
+        return self.route_tree.is_current(routes)
+
+    @staticmethod
+    def _is_static_route(route: BaseRoute) -> bool:
+        return (
+            type(route).matches in (routing.Route.matches, APIRoute.matches)
+            and not cast(routing.Route, route).param_convertors
+            and bool(cast(routing.Route, route).methods)
+        )
+
+    @staticmethod
+    def _could_match(route: BaseRoute, path: str) -> bool:
+        matches = type(route).matches
+        if matches in (routing.WebSocketRoute.matches, APIWebSocketRoute.matches):
+            return False
+        if matches in (routing.Route.matches, APIRoute.matches, routing.Mount.matches):
+            path_regex = cast(routing.Route, route).path_regex
+            return path_regex.match(path) is not None
+        return True
+
+    def get_candidates(self, method: str, route_path: str) -> tuple[BaseRoute, ...]:
+        return self.routes.get((method, route_path), ())
+
+
 # Cache for endpoint context to avoid re-extracting on every request
 _endpoint_context_cache: dict[int, EndpointContext] = {}
 
@@ -287,9 +560,14 @@ async def serialize_response(
     is_coroutine: bool = True,
     endpoint_ctx: EndpointContext | None = None,
     dump_json: bool = False,
+    is_trusted_instance: Callable[[Any], bool] | None = None,
 ) -> Any:
     if field:
-        if is_coroutine:
+        errors: list[Any] = []
+        if is_trusted_instance is not None and is_trusted_instance(response_content):
+            # Already an instance of the response model, only serialize it
+            value = response_content
+        elif is_coroutine:
             value, errors = field.validate(response_content, {}, loc=("response",))
         else:
             value, errors = await run_in_threadpool(
@@ -365,26 +643,52 @@ def get_request_handler(
     strict_content_type: bool | DefaultPlaceholder = Default(True),
     stream_item_field: ModelField | None = None,
     is_json_stream: bool = False,
+    body_decoders: dict[str, BodyDecoder] | None = None,
+    response_encoders: dict[str, ResponseEncoder] | None = None,
+    response_validation: Literal["full", "trust_instances"]
+    | DefaultPlaceholder = Default("full"),
+    response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+    jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
 ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
     assert dependant.call is not None, "dependant.call must be a function"
+    dependency_plan = get_dependency_plan(dependant)
     is_coroutine = dependant.is_coroutine_callable
-    is_body_form = body_field and isinstance(body_field.field_info, params.Form)
     if isinstance(response_class, DefaultPlaceholder):
         actual_response_class: type[Response] = response_class.value
     else:
         actual_response_class = response_class
     is_sse_stream = lenient_issubclass(actual_response_class, EventSourceResponse)
-    if isinstance(strict_content_type, DefaultPlaceholder):
-        actual_strict_content_type: bool = strict_content_type.value
+    if isinstance(jsonl_buffer, DefaultPlaceholder):
+        actual_jsonl_buffer: JSONLBuffer | None = jsonl_buffer.value
     else:
-        actual_strict_content_type = strict_content_type
+        actual_jsonl_buffer = jsonl_buffer
+    jsonl_batch_field = _get_jsonl_batch_field(stream_item_field, actual_jsonl_buffer)
+    # How to read the body and create the response only depends on the path
+    # operation, decide it once here instead of on every request
+    read_body = _get_request_body_reader(
+        body_field=body_field,
+        embed_body_fields=embed_body_fields,
+        strict_content_type=strict_content_type,
+        body_decoders=body_decoders,
+    )
+    build_response = _get_response_builder(
+        status_code=status_code,
+        response_class=response_class,
+        response_field=response_field,
+        response_model_include=response_model_include,
+        response_model_exclude=response_model_exclude,
+        response_model_by_alias=response_model_by_alias,
+        response_model_exclude_unset=response_model_exclude_unset,
+        response_model_exclude_defaults=response_model_exclude_defaults,
+        response_model_exclude_none=response_model_exclude_none,
+        is_coroutine=is_coroutine,
+        response_encoders=response_encoders,
+        response_validation=response_validation,
+        response_chunk_size=response_chunk_size,
+    )
 
     async def app(request: Request) -> Response:
         response: Response | None = None
-        file_stack = request.scope.get("fastapi_middleware_astack")
-        assert isinstance(file_stack, AsyncExitStack), (
-            "fastapi_middleware_astack not found in request scope"
-        )
 
         # Extract endpoint context for error messages
         endpoint_ctx = (
@@ -399,54 +703,11 @@ def get_request_handler(
             endpoint_ctx["path"] = f"{request.method} {mount_path}{dependant.path}"
 
         # Read body and auto-close files
-        try:
-            body: Any = None
-            if body_field:
-                if is_body_form:
-                    body = await request.form()
-                    file_stack.push_async_callback(body.close)
-                else:
-                    body_bytes = await request.body()
-                    if body_bytes:
-                        json_body: Any = Undefined
-                        content_type_value = request.headers.get("content-type")
-                        if not content_type_value:
-                            if not actual_strict_content_type:
-                                json_body = await request.json()
-                        else:
-                            message = email.message.Message()
-                            message["content-type"] = content_type_value
-                            if message.get_content_maintype() == "application":
-                                subtype = message.get_content_subtype()
-                                if subtype == "json" or subtype.endswith("+json"):
-                                    json_body = await request.json()
-                        if json_body != Undefined:
-                            body = json_body
-                        else:
-                            body = body_bytes
-        except json.JSONDecodeError as e:
-            validation_error = RequestValidationError(
-                [
-                    {
-                        "type": "json_invalid",
-                        "loc": ("body", e.pos),
-                        "msg": "JSON decode error",
-                        "input": {},
-                        "ctx": {"error": e.msg},
-                    }
-                ],
-                body=e.doc,
-                endpoint_ctx=endpoint_ctx,
-            )
-            raise validation_error from e
-        except HTTPException:
-            # If a middleware raises an HTTPException, it should be raised again
-            raise
-        except Exception as e:
-            http_error = HTTPException(
-                status_code=400, detail="There was an error parsing the body"
+        body: Any = None
+        if read_body is not None:
+            body = await _read_request_body(
+                request, read_body=read_body, endpoint_ctx=endpoint_ctx
             )
-            raise http_error from e
 
         # Solve dependencies and run path operation function, auto-closing dependencies
         errors: list[Any] = []
@@ -454,10 +715,12 @@ def get_request_handler(
         assert isinstance(async_exit_stack, AsyncExitStack), (
             "fastapi_inner_astack not found in request scope"
         )
-        solved_result = await solve_dependencies(
+        solved_result = await solve_dependency_plan(
             request=request,
-            dependant=dependant,
-            body=cast(dict[str, Any] | FormData | bytes | None, body),
+            plan=dependency_plan,
+            body=cast(
+                dict[str, Any] | FormData | bytes | ValidatedJSONBody | None, body
+            ),
             dependency_overrides_provider=dependency_overrides_provider,
             async_exit_stack=async_exit_stack,
             embed_body_fields=embed_body_fields,
@@ -498,27 +761,14 @@ def get_request_handler(
                 gen = dependant.call(**solved_result.values)
 
                 def _serialize_sse_item(item: Any) -> bytes:
+                    if isinstance(item, EncodedServerSentEvent):
+                        # Already encoded, e.g. by an EventBroadcaster
+                        return item.content
                     if isinstance(item, ServerSentEvent):
                         # User controls the event structure.
-                        # Serialize the data payload if present.
                         # For ServerSentEvent items we skip stream_item_field
                         # validation (the user may mix types intentionally).
-                        if item.raw_data is not None:
-                            data_str: str | None = item.raw_data
-                        elif item.data is not None:
-                            if hasattr(item.data, "model_dump_json"):
-                                data_str = item.data.model_dump_json()
-                            else:
-                                data_str = json.dumps(jsonable_encoder(item.data))
-                        else:
-                            data_str = None
-                        return format_sse_event(
-                            data_str=data_str,
-                            event=item.event,
-                            id=item.id,
-                            retry=item.retry,
-                            comment=item.comment,
-                        )
+                        return _encode_server_sent_event(item)
                     else:
                         # Plain object: validate + serialize via
                         # stream_item_field (if set) and wrap in data field
@@ -558,6 +808,33 @@ def get_request_handler(
                             async for raw_item in sse_aiter:
                                 await send_stream.send(_serialize_sse_item(raw_item))
 
+                    # While the app lifespan is running, a single task sends the
+                    # keepalive pings of all its streams, instead of a task and
+                    # a timer for each stream
+                    keepalive_scheduler = _get_keepalive_scheduler(
+                        request.scope.get("app") or request.scope.get("router")
+                    )
+                    if keepalive_scheduler is not None:
+
+                        async def _scheduled_producer() -> None:
+                            assert keepalive_scheduler is not None  # For types
+                            async with send_stream:
+                                keepalive_scheduler.register(send_stream)
+                                try:
+                                    async for raw_item in sse_aiter:
+                                        await send_stream.send(
+                                            _serialize_sse_item(raw_item)
+                                        )
+                                        keepalive_scheduler.touch(send_stream)
+                                finally:
+                                    keepalive_scheduler.unregister(send_stream)
+
+                        async with anyio.create_task_group() as tg:
+                            tg.start_soon(_scheduled_producer)
+                            yield receive_stream
+                            tg.cancel_scope.cancel()
+                        return
+
                     send_keepalive, receive_keepalive = (
                         anyio.create_memory_object_stream[bytes](max_buffer_size=1)
                     )
@@ -587,9 +864,17 @@ def get_request_handler(
                 # exit stack. The stack outlives the streaming response,
                 # so __aexit__ runs via proper structured teardown, not
                 # via GeneratorExit thrown into an async generator.
-                sse_receive_stream = await async_exit_stack.enter_async_context(
-                    _sse_producer_cm()
+                # The producer task copies the context when it starts, for
+                # EventBroadcaster.subscribe() in the generator
+                last_event_id_token = _request_last_event_id.set(
+                    request.headers.get("last-event-id")
                 )
+                try:
+                    sse_receive_stream = await async_exit_stack.enter_async_context(
+                        _sse_producer_cm()
+                    )
+                finally:
+                    _request_last_event_id.reset(last_event_id_token)
                 # Ensure the receive stream is closed when the exit stack
                 # unwinds, preventing ResourceWarning from __del__.
                 async_exit_stack.push_async_callback(sse_receive_stream.aclose)
@@ -624,7 +909,57 @@ def get_request_handler(
                 def _serialize_item(item: Any) -> bytes:
                     return _serialize_data(item) + b"\n"
 
-                if dependant.is_async_gen_callable:
+                if actual_jsonl_buffer is not None:
+
+                    def _serialize_items(items: list[Any]) -> bytes:
+                        if jsonl_batch_field is None:
+                            return b"".join(_serialize_item(item) for item in items)
+                        assert stream_item_field is not None  # For types
+                        values, errors_ = jsonl_batch_field.validate(
+                            items, {}, loc=("response",)
+                        )
+                        if errors_:
+                            # Each error refers to a single item, not to the batch
+                            for error in errors_:
+                                loc = error["loc"]
+                                if len(loc) > 1 and isinstance(loc[1], int):
+                                    error["loc"] = (loc[0], *loc[2:])
+                            raise ResponseValidationError(
+                                errors=errors_,
+                                body=items,
+                                endpoint_ctx=endpoint_ctx or EndpointContext(),
+                            )
+                        return b"".join(
+                            stream_item_field.serialize_json(
+                                value,
+                                include=response_model_include,
+                                exclude=response_model_exclude,
+                                by_alias=response_model_by_alias,
+                                exclude_unset=response_model_exclude_unset,
+                                exclude_defaults=response_model_exclude_defaults,
+                                exclude_none=response_model_exclude_none,
+                            )
+                            + b"\n"
+                            for value in values
+                        )
+
+                    if dependant.is_async_gen_callable:
+                        jsonl_aiter: AsyncIterator[Any] = gen.__aiter__()
+                    else:
+                        jsonl_aiter = iterate_in_threadpool(gen)
+                    # Entered on the request-scoped exit stack, as with
+                    # Server-Sent Events, so that the task reading the generator
+                    # is not torn down by async generator finalization
+                    jsonl_stream_content: (
+                        AsyncIterator[bytes] | Iterator[bytes]
+                    ) = await async_exit_stack.enter_async_context(
+                        buffered_jsonl_stream(
+                            jsonl_aiter,
+                            buffer=actual_jsonl_buffer,
+                            serialize_items=_serialize_items,
+                        )
+                    )
+                elif dependant.is_async_gen_callable:
 
                     async def _async_stream_jsonl() -> AsyncIterator[bytes]:
                         async for item in gen:
@@ -633,9 +968,7 @@ def get_request_handler(
                             # Ref: https://github.com/fastapi/fastapi/issues/14680
                             await anyio.sleep(0)
 
-                    jsonl_stream_content: AsyncIterator[bytes] | Iterator[bytes] = (
-                        _async_stream_jsonl()
-                    )
+                    jsonl_stream_content = _async_stream_jsonl()
                 else:
 
                     def _sync_stream_jsonl() -> Iterator[bytes]:
@@ -676,47 +1009,12 @@ def get_request_handler(
                     values=solved_result.values,
                     is_coroutine=is_coroutine,
                 )
-                if isinstance(raw_response, Response):
-                    if raw_response.background is None:
-                        raw_response.background = solved_result.background_tasks
-                    response = raw_response
-                else:
-                    response_args = _build_response_args(
-                        status_code=status_code, solved_result=solved_result
-                    )
-                    # Use the fast path (dump_json) when no custom response
-                    # class was set and a response field with a TypeAdapter
-                    # exists. Serializes directly to JSON bytes via Pydantic's
-                    # Rust core, skipping the intermediate Python dict +
-                    # json.dumps() step.
-                    use_dump_json = response_field is not None and isinstance(
-                        response_class, DefaultPlaceholder
-                    )
-                    content = await serialize_response(
-                        field=response_field,
-                        response_content=raw_response,
-                        include=response_model_include,
-                        exclude=response_model_exclude,
-                        by_alias=response_model_by_alias,
-                        exclude_unset=response_model_exclude_unset,
-                        exclude_defaults=response_model_exclude_defaults,
-                        exclude_none=response_model_exclude_none,
-                        is_coroutine=is_coroutine,
-                        endpoint_ctx=endpoint_ctx,
-                        dump_json=use_dump_json,
-                    )
-                    if use_dump_json:
-                        response = Response(
-                            content=content,
-                            media_type="application/json",
-                            **response_args,
-                        )
-                    else:
-                        response = actual_response_class(content, **response_args)
-                    if not is_body_allowed_for_status_code(response.status_code):
-                        response.body = b""
-                    response.headers.raw.extend(solved_result.response.headers.raw)
+                response = await build_response(
+                    request, raw_response, solved_result, endpoint_ctx
+                )
         if errors:
+            if isinstance(body, ValidatedJSONBody):
+                body = _decode_validated_json_body(body)
             validation_error = RequestValidationError(
                 errors, body=body, endpoint_ctx=endpoint_ctx
             )
@@ -729,11 +1027,728 @@ def get_request_handler(
     return app
 
 
+def _get_trusted_instance_check(
+    response_field: ModelField | None,
+    response_validation: Literal["full", "trust_instances"] | DefaultPlaceholder,
+) -> Callable[[Any], bool] | None:
+    # With "trust_instances", return values that are already instances of exactly
+    # the response model class (or a list of them) are not validated again.
+    # Subclasses are still validated, to filter out their extra fields.
+    if isinstance(response_validation, DefaultPlaceholder):
+        response_validation = response_validation.value
+    if response_validation != "trust_instances" or response_field is None:
+        return None
+    annotation = response_field.field_info.annotation
+    if lenient_issubclass(annotation, BaseModel):
+        model = annotation
+
+        def is_model_instance(value: Any) -> bool:
+            return type(value) is model
+
+        return is_model_instance
+    if get_origin(annotation) is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        if lenient_issubclass(item_annotation, BaseModel):
+            item_model = item_annotation
+
+            def is_model_instance_list(value: Any) -> bool:
+                return type(value) is list and all(
+                    type(item) is item_model for item in value
+                )
+
+            return is_model_instance_list
+    return None
+
+
+class _JSONArrayChunkSerializer:
+    """
+    Validate and serialize the items of a list response a chunk at a time, to
+    stream them as a JSON array.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_field: ModelField,
+        chunk_size: int,
+        by_alias: bool,
+        exclude_unset: bool,
+        exclude_defaults: bool,
+        exclude_none: bool,
+    ) -> None:
+        self.chunk_field = chunk_field
+        self.chunk_size = chunk_size
+        self.by_alias = by_alias
+        self.exclude_unset = exclude_unset
+        self.exclude_defaults = exclude_defaults
+        self.exclude_none = exclude_none
+
+    def iter_chunks(
+        self, items: Iterable[Any], endpoint_ctx: EndpointContext
+    ) -> Iterator[bytes]:
+        iterator = iter(items)
+        prefix = b"["
+        offset = 0
+        while chunk := list(itertools.islice(iterator, self.chunk_size)):
+            value, errors = self.chunk_field.validate(chunk, {}, loc=("response",))
+            if errors:
+                # After the first chunk, the response was already started, this
+                # only interrupts it, the client gets an incomplete JSON array
+                # Use the index in the whole list, not in the chunk
+                for error in errors:
+                    loc = error["loc"]
+                    if len(loc) > 1 and isinstance(loc[1], int):
+                        error["loc"] = (loc[0], loc[1] + offset, *loc[2:])
+                raise ResponseValidationError(
+                    errors=errors, body=chunk, endpoint_ctx=endpoint_ctx
+                )
+            content = self.chunk_field.serialize_json(
+                value,
+                by_alias=self.by_alias,
+                exclude_unset=self.exclude_unset,
+                exclude_defaults=self.exclude_defaults,
+                exclude_none=self.exclude_none,
+            )
+            # Without the brackets of the chunk list
+            yield prefix + content[1:-1]
+            prefix = b","
+            offset += len(chunk)
+        yield b"[]" if offset == 0 else b"]"
+
+    async def create_response(
+        self,
+        items: Iterable[Any],
+        *,
+        is_coroutine: bool,
+        endpoint_ctx: EndpointContext,
+        response_args: dict[str, Any],
+    ) -> StreamingResponse:
+        chunks = self.iter_chunks(items, endpoint_ctx)
+        # Validate the first chunk before starting the response, so that its
+        # errors are handled as with a non streaming response
+        if is_coroutine:
+            first_chunk = next(chunks)
+        else:
+            first_chunk = await run_in_threadpool(next, chunks)
+
+        def content() -> Iterator[bytes]:
+            yield first_chunk
+            yield from chunks
+
+        return StreamingResponse(
+            content(), media_type="application/json", **response_args
+        )
+
+
+def _get_json_array_chunk_serializer(
+    *,
+    response_field: ModelField | None,
+    response_chunk_size: int | None | DefaultPlaceholder,
+    response_class: type[Response] | DefaultPlaceholder,
+    response_model_include: IncEx | None,
+    response_model_exclude: IncEx | None,
+    response_model_by_alias: bool,
+    response_model_exclude_unset: bool,
+    response_model_exclude_defaults: bool,
+    response_model_exclude_none: bool,
+) -> _JSONArrayChunkSerializer | None:
+    chunk_size: int | None = (
+        response_chunk_size.value
+        if isinstance(response_chunk_size, DefaultPlaceholder)
+        else response_chunk_size
+    )
+    # include and exclude could refer to list indexes, that are different in
+    # each chunk
+    if (
+        not chunk_size
+        or response_field is None
+        or not isinstance(response_class, DefaultPlaceholder)
+        or response_model_include is not None
+        or response_model_exclude is not None
+    ):
+        return None
+    annotation = response_field.field_info.annotation
+    if get_origin(annotation) not in (list, Sequence, Iterable):
+        return None
+    (item_annotation,) = get_args(annotation)
+    chunk_field = create_model_field(
+        name=f"{response_field.name}_chunk",
+        type_=types.GenericAlias(list, (item_annotation,)),
+        mode="serialization",
+    )
+    return _JSONArrayChunkSerializer(
+        chunk_field=chunk_field,
+        chunk_size=chunk_size,
+        by_alias=response_model_by_alias,
+        exclude_unset=response_model_exclude_unset,
+        exclude_defaults=response_model_exclude_defaults,
+        exclude_none=response_model_exclude_none,
+    )
+
+
+def _get_jsonl_batch_field(
+    stream_item_field: ModelField | None, jsonl_buffer: JSONLBuffer | None
+) -> ModelField | None:
+    if (
+        stream_item_field is None
+        or jsonl_buffer is None
+        or jsonl_buffer.batch_size is None
+    ):
+        return None
+    return create_model_field(
+        name=f"{stream_item_field.name}_batch",
+        type_=types.GenericAlias(list, (stream_item_field.field_info.annotation,)),
+        mode="serialization",
+    )
+
+
+def _is_chunkable_response(raw_response: Any, response_args: dict[str, Any]) -> bool:
+    return isinstance(
+        raw_response, (list, tuple, Iterator)
+    ) and is_body_allowed_for_status_code(response_args.get("status_code"))
+
+
+def _get_json_bytes_response(
+    response_class: type[Response] | DefaultPlaceholder,
+) -> Callable[..., Response] | None:
+    # How to create a response with data already serialized to JSON bytes, None
+    # if the response class has to render the data itself
+    if isinstance(response_class, DefaultPlaceholder):
+        return functools.partial(Response, media_type="application/json")
+    for cls in response_class.__mro__:
+        if "from_json_bytes" in vars(cls):
+            # A subclass that overrides render() (but not from_json_bytes()) has
+            # to render the data itself
+            if response_class.render is not getattr(cls, "render", None):
+                return None
+            break
+    from_json_bytes: Callable[..., Response] | None = getattr(
+        response_class, "from_json_bytes", None
+    )
+    return from_json_bytes
+
+
+def _get_encoder_media_types(
+    response_encoders: dict[str, ResponseEncoder] | None,
+) -> tuple[str, ...]:
+    if not response_encoders:
+        return ()
+    # JSON first, it's still the default when the client accepts anything
+    return tuple(dict.fromkeys(("application/json", *response_encoders)))
+
+
+def _get_response_encoder(
+    request: Request,
+    response_encoders: dict[str, ResponseEncoder],
+    encoder_media_types: tuple[str, ...],
+) -> tuple[str, ResponseEncoder] | None:
+    accept = request.headers.get("accept")
+    if not accept:
+        return None
+    media_type = get_accepted_media_type(accept, encoder_media_types)
+    if media_type is None or media_type not in response_encoders:
+        return None
+    return media_type, response_encoders[media_type]
+
+
+def _get_response_builder(
+    *,
+    status_code: int | None,
+    response_class: type[Response] | DefaultPlaceholder,
+    response_field: ModelField | None,
+    response_model_include: IncEx | None,
+    response_model_exclude: IncEx | None,
+    response_model_by_alias: bool,
+    response_model_exclude_unset: bool,
+    response_model_exclude_defaults: bool,
+    response_model_exclude_none: bool,
+    is_coroutine: bool,
+    response_encoders: dict[str, ResponseEncoder] | None,
+    response_validation: Literal["full", "trust_instances"] | DefaultPlaceholder,
+    response_chunk_size: int | None | DefaultPlaceholder,
+) -> Callable[
+    [Request, Any, SolvedDependency, EndpointContext], Coroutine[Any, Any, Response]
+]:
+    """
+    Create the function that creates the response for the value returned by a
+    (non generator) endpoint.
+
+    When the path operation doesn't negotiate the media type nor stream the
+    response in chunks, the function only serializes the content.
+    """
+    if isinstance(response_class, DefaultPlaceholder):
+        actual_response_class: type[Response] = response_class.value
+    else:
+        actual_response_class = response_class
+    json_bytes_response = _get_json_bytes_response(response_class)
+    json_array_chunk_serializer = _get_json_array_chunk_serializer(
+        response_field=response_field,
+        response_chunk_size=response_chunk_size,
+        response_class=response_class,
+        response_model_include=response_model_include,
+        response_model_exclude=response_model_exclude,
+        response_model_by_alias=response_model_by_alias,
+        response_model_exclude_unset=response_model_exclude_unset,
+        response_model_exclude_defaults=response_model_exclude_defaults,
+        response_model_exclude_none=response_model_exclude_none,
+    )
+    # Only negotiated for the default response class, a custom one decides the
+    # media type
+    if not isinstance(response_class, DefaultPlaceholder):
+        response_encoders = None
+    encoder_media_types = _get_encoder_media_types(response_encoders)
+    # Use the fast path (dump_json) when the response class accepts JSON bytes
+    # (the default one, or one with from_json_bytes()) and a response field with
+    # a TypeAdapter exists. Serializes directly to JSON bytes via Pydantic's Rust
+    # core, skipping the intermediate Python dict + json.dumps() step.
+    can_dump_json = response_field is not None and json_bytes_response is not None
+    serialize_content = functools.partial(
+        serialize_response,
+        field=response_field,
+        include=response_model_include,
+        exclude=response_model_exclude,
+        by_alias=response_model_by_alias,
+        exclude_unset=response_model_exclude_unset,
+        exclude_defaults=response_model_exclude_defaults,
+        exclude_none=response_model_exclude_none,
+        is_coroutine=is_coroutine,
+        is_trusted_instance=_get_trusted_instance_check(
+            response_field, response_validation
+        ),
+    )
+
+    async def build_response(
+        request: Request,
+        raw_response: Any,
+        solved_result: SolvedDependency,
+        endpoint_ctx: EndpointContext,
+    ) -> Response:
+        if isinstance(raw_response, Response):
+            if raw_response.background is None:
+                raw_response.background = solved_result.background_tasks
+            return raw_response
+        response_args = _build_response_args(
+            status_code=status_code, solved_result=solved_result
+        )
+        response_encoder = (
+            _get_response_encoder(request, response_encoders, encoder_media_types)
+            if response_encoders
+            else None
+        )
+        use_chunks = (
+            response_encoder is None
+            and json_array_chunk_serializer is not None
+            and _is_chunkable_response(raw_response, response_args)
+        )
+        response: Response
+        if use_chunks:
+            assert json_array_chunk_serializer is not None  # For types
+            response = await json_array_chunk_serializer.create_response(
+                raw_response,
+                is_coroutine=is_coroutine,
+                endpoint_ctx=endpoint_ctx,
+                response_args=response_args,
+            )
+        else:
+            use_dump_json = response_encoder is None and can_dump_json
+            content = await serialize_content(
+                response_content=raw_response,
+                endpoint_ctx=endpoint_ctx,
+                dump_json=use_dump_json,
+            )
+            if response_encoder is not None:
+                encoder_media_type, encode = response_encoder
+                response = Response(
+                    content=encode(content),
+                    media_type=encoder_media_type,
+                    **response_args,
+                )
+            elif use_dump_json:
+                assert json_bytes_response is not None  # For types
+                response = json_bytes_response(content, **response_args)
+            else:
+                response = actual_response_class(content, **response_args)
+        if response_encoders:
+            response.headers.add_vary_header("Accept")
+        if not is_body_allowed_for_status_code(response.status_code):
+            response.body = b""
+        response.headers.raw.extend(solved_result.response.headers.raw)
+        return response
+
+    async def build_serialized_response(
+        request: Request,
+        raw_response: Any,
+        solved_result: SolvedDependency,
+        endpoint_ctx: EndpointContext,
+    ) -> Response:
+        if isinstance(raw_response, Response):
+            if raw_response.background is None:
+                raw_response.background = solved_result.background_tasks
+            return raw_response
+        response_args = _build_response_args(
+            status_code=status_code, solved_result=solved_result
+        )
+        content = await serialize_content(
+            response_content=raw_response,
+            endpoint_ctx=endpoint_ctx,
+            dump_json=can_dump_json,
+        )
+        if json_bytes_response is not None and can_dump_json:
+            response = json_bytes_response(content, **response_args)
+        else:
+            response = actual_response_class(content, **response_args)
+        if not is_body_allowed_for_status_code(response.status_code):
+            response.body = b""
+        response.headers.raw.extend(solved_result.response.headers.raw)
+        return response
+
+    if response_encoders or json_array_chunk_serializer is not None:
+        return build_response
+    return build_serialized_response
+
+
+async def _read_form_body(request: Request, file_stack: AsyncExitStack) -> Any:
+    content_type_value = request.headers.get("content-type")
+    if content_type_value:
+        content_type_info = get_content_type_info(content_type_value)
+        if content_type_info.is_form or content_type_info.is_multipart:
+            body = await request.form()
+            file_stack.push_async_callback(body.close)
+            return body
+    # The same empty form as request.form() returns for other content types,
+    # without parsing the header again
+    return FormData()
+
+
+class _JSONBodyBytes:
+    """
+    The JSON body of a single body field (not embedded), to validate the bytes
+    directly after reading them.
+    """
+
+    __slots__ = ("field", "body")
+
+    def __init__(self, *, field: ModelField, body: bytes) -> None:
+        self.field = field
+        self.body = body
+
+
+async def _read_json_body(request: Request, json_body_field: ModelField | None) -> Any:
+    if json_body_field is None:
+        return await request.json()
+    return _JSONBodyBytes(field=json_body_field, body=await request.body())
+
+
+def _decode_validated_json_body(body: ValidatedJSONBody) -> Any:
+    # The same body as with request.json(), for the RequestValidationError
+    try:
+        return body.decode()
+    except Exception as e:
+        http_error = HTTPException(
+            status_code=400, detail="There was an error parsing the body"
+        )
+        raise http_error from e
+
+
+def _normalize_media_types(
+    callables: dict[str, _T] | None,
+) -> dict[str, _T]:
+    return {
+        media_type.lower(): value for media_type, value in (callables or {}).items()
+    }
+
+
+class _BodyDecodeError(Exception):
+    def __init__(self, body: bytes, error: Exception) -> None:
+        super().__init__(str(error))
+        self.body = body
+        self.error = error
+
+    def to_validation_error(
+        self, *, endpoint_ctx: EndpointContext
+    ) -> RequestValidationError:
+        return RequestValidationError(
+            [
+                {
+                    "type": "body_decode_error",
+                    "loc": ("body",),
+                    "msg": "Body decode error",
+                    "input": {},
+                    "ctx": {"error": str(self.error)},
+                }
+            ],
+            body=self.body,
+            endpoint_ctx=endpoint_ctx,
+        )
+
+
+def _get_body_decoder(
+    body_decoders: dict[str, BodyDecoder] | None, content_type_value: str | None
+) -> BodyDecoder | None:
+    if not body_decoders or not content_type_value:
+        return None
+    return body_decoders.get(get_content_type_info(content_type_value).media_type)
+
+
+def _decode_body(decoder: BodyDecoder, body_bytes: bytes) -> Any:
+    try:
+        return decoder(body_bytes)
+    except Exception as e:
+        raise _BodyDecodeError(body_bytes, e) from e
+
+
+def _get_json_body_reader(
+    strict_content_type: bool,
+    json_body_field: ModelField | None,
+    body_decoders: dict[str, BodyDecoder] | None = None,
+) -> Callable[[Request, AsyncExitStack], Coroutine[Any, Any, Any]]:
+    async def read_json_body(request: Request, file_stack: AsyncExitStack) -> Any:
+        body_bytes = await request.body()
+        if not body_bytes:
+            return None
+        content_type_value = request.headers.get("content-type")
+        decoder = _get_body_decoder(body_decoders, content_type_value)
+        if decoder is not None:
+            return _decode_body(decoder, body_bytes)
+        if not content_type_value:
+            if not strict_content_type:
+                return await _read_json_body(request, json_body_field)
+        elif get_content_type_info(content_type_value).is_json:
+            return await _read_json_body(request, json_body_field)
+        return body_bytes
+
+    return read_json_body
+
+
+def _get_request_body_reader(
+    *,
+    body_field: ModelField | None,
+    embed_body_fields: bool,
+    strict_content_type: bool | DefaultPlaceholder,
+    body_decoders: dict[str, BodyDecoder] | None,
+) -> Callable[[Request, AsyncExitStack], Coroutine[Any, Any, Any]] | None:
+    # None when the path operation doesn't have a body
+    if not body_field:
+        return None
+    if isinstance(body_field.field_info, params.Form):
+        return _read_form_body
+    if isinstance(strict_content_type, DefaultPlaceholder):
+        actual_strict_content_type: bool = strict_content_type.value
+    else:
+        actual_strict_content_type = strict_content_type
+    return _get_json_body_reader(
+        actual_strict_content_type,
+        body_field if not embed_body_fields else None,
+        body_decoders,
+    )
+
+
+async def _read_request_body(
+    request: Request,
+    *,
+    read_body: Callable[[Request, AsyncExitStack], Coroutine[Any, Any, Any]],
+    endpoint_ctx: EndpointContext,
+) -> Any:
+    file_stack = request.scope.get("fastapi_middleware_astack")
+    assert isinstance(file_stack, AsyncExitStack), (
+        "fastapi_middleware_astack not found in request scope"
+    )
+    with _handle_body_errors(endpoint_ctx):
+        body = await read_body(request, file_stack)
+    if not isinstance(body, _JSONBodyBytes):
+        return body
+    # Not inside of _handle_body_errors(), the exceptions raised by validators
+    # are not errors parsing the body
+    validated = validate_json_body(field=body.field, body=body.body)
+    if validated is not None:
+        return validated
+    with _handle_body_errors(endpoint_ctx):
+        # Not valid, parse it as with request.json() to raise the same
+        # JSONDecodeError, or to get the same validation errors later
+        return json.loads(body.body)
+
+
+@contextmanager
+def _handle_body_errors(endpoint_ctx: EndpointContext) -> Iterator[None]:
+    try:
+        yield
+    except json.JSONDecodeError as e:
+        validation_error = RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", e.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": e.msg},
+                }
+            ],
+            body=e.doc,
+            endpoint_ctx=endpoint_ctx,
+        )
+        raise validation_error from e
+    except _BodyDecodeError as e:
+        raise e.to_validation_error(endpoint_ctx=endpoint_ctx) from e.__cause__
+    except HTTPException:
+        # If a middleware raises an HTTPException, it should be raised again
+        raise
+    except Exception as e:
+        http_error = HTTPException(
+            status_code=400, detail="There was an error parsing the body"
+        )
+        raise http_error from e
+
+
+def get_specialized_request_handler(
+    dependant: Dependant,
+    body_field: ModelField | None = None,
+    status_code: int | None = None,
+    response_class: type[Response] | DefaultPlaceholder = Default(JSONResponse),
+    response_field: ModelField | None = None,
+    response_model_include: IncEx | None = None,
+    response_model_exclude: IncEx | None = None,
+    response_model_by_alias: bool = True,
+    response_model_exclude_unset: bool = False,
+    response_model_exclude_defaults: bool = False,
+    response_model_exclude_none: bool = False,
+    dependency_overrides_provider: Any | None = None,
+    embed_body_fields: bool = False,
+    strict_content_type: bool | DefaultPlaceholder = Default(True),
+    stream_item_field: ModelField | None = None,
+    is_json_stream: bool = False,
+    body_decoders: dict[str, BodyDecoder] | None = None,
+    response_encoders: dict[str, ResponseEncoder] | None = None,
+    response_validation: Literal["full", "trust_instances"]
+    | DefaultPlaceholder = Default("full"),
+    response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+    jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
+) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+    """
+    Same as `get_request_handler()`, but the request handler only includes the
+    steps the path operation can take, e.g. a path operation without a body
+    doesn't read it, and one that returns JSON serializes it directly.
+
+    Generator endpoints (JSON Lines, Server-Sent Events, and raw streaming) use
+    the handler from `get_request_handler()`.
+    """
+    if dependant.is_async_gen_callable or dependant.is_gen_callable:
+        return get_request_handler(
+            dependant=dependant,
+            body_field=body_field,
+            status_code=status_code,
+            response_class=response_class,
+            response_field=response_field,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+            dependency_overrides_provider=dependency_overrides_provider,
+            embed_body_fields=embed_body_fields,
+            strict_content_type=strict_content_type,
+            stream_item_field=stream_item_field,
+            is_json_stream=is_json_stream,
+            body_decoders=body_decoders,
+            response_encoders=response_encoders,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
+        )
+    assert dependant.call is not None, "dependant.call must be a function"
+    dependency_plan = get_dependency_plan(dependant)
+    is_coroutine = dependant.is_coroutine_callable
+    read_body = _get_request_body_reader(
+        body_field=body_field,
+        embed_body_fields=embed_body_fields,
+        strict_content_type=strict_content_type,
+        body_decoders=body_decoders,
+    )
+    build_response = _get_response_builder(
+        status_code=status_code,
+        response_class=response_class,
+        response_field=response_field,
+        response_model_include=response_model_include,
+        response_model_exclude=response_model_exclude,
+        response_model_by_alias=response_model_by_alias,
+        response_model_exclude_unset=response_model_exclude_unset,
+        response_model_exclude_defaults=response_model_exclude_defaults,
+        response_model_exclude_none=response_model_exclude_none,
+        is_coroutine=is_coroutine,
+        response_encoders=response_encoders,
+        response_validation=response_validation,
+        response_chunk_size=response_chunk_size,
+    )
+
+    async def solve(request: Request, body: Any) -> SolvedDependency:
+        async_exit_stack = request.scope.get("fastapi_inner_astack")
+        assert isinstance(async_exit_stack, AsyncExitStack), (
+            "fastapi_inner_astack not found in request scope"
+        )
+        return await solve_dependency_plan(
+            request=request,
+            plan=dependency_plan,
+            body=body,
+            dependency_overrides_provider=dependency_overrides_provider,
+            async_exit_stack=async_exit_stack,
+            embed_body_fields=embed_body_fields,
+        )
+
+    async def run(
+        request: Request,
+        body: Any,
+        solved_result: SolvedDependency,
+        endpoint_ctx: EndpointContext,
+    ) -> Response:
+        if solved_result.errors:
+            if isinstance(body, ValidatedJSONBody):
+                body = _decode_validated_json_body(body)
+            raise RequestValidationError(
+                solved_result.errors, body=body, endpoint_ctx=endpoint_ctx
+            )
+        raw_response = await run_endpoint_function(
+            dependant=dependant,
+            values=solved_result.values,
+            is_coroutine=is_coroutine,
+        )
+        return await build_response(request, raw_response, solved_result, endpoint_ctx)
+
+    def get_endpoint_context(request: Request) -> EndpointContext:
+        endpoint_ctx = _extract_endpoint_context(dependant.call)
+        if dependant.path:
+            # For mounted sub-apps, include the mount path prefix
+            mount_path = request.scope.get("root_path", "").rstrip("/")
+            endpoint_ctx["path"] = f"{request.method} {mount_path}{dependant.path}"
+        return endpoint_ctx
+
+    if read_body is None:
+
+        async def app_without_body(request: Request) -> Response:
+            endpoint_ctx = get_endpoint_context(request)
+            solved_result = await solve(request, None)
+            return await run(request, None, solved_result, endpoint_ctx)
+
+        return app_without_body
+
+    async def app(request: Request) -> Response:
+        endpoint_ctx = get_endpoint_context(request)
+        assert read_body is not None  # For types
+        body = await _read_request_body(
+            request, read_body=read_body, endpoint_ctx=endpoint_ctx
+        )
+        solved_result = await solve(request, body)
+        return await run(request, body, solved_result, endpoint_ctx)
+
+    return app
+
+
 def get_websocket_app(
     dependant: Dependant,
     dependency_overrides_provider: Any | None = None,
     embed_body_fields: bool = False,
 ) -> Callable[[WebSocket], Coroutine[Any, Any, Any]]:
+    dependency_plan = get_dependency_plan(dependant)
+
     async def app(websocket: WebSocket) -> None:
         endpoint_ctx = (
             _extract_endpoint_context(dependant.call)
@@ -748,9 +1763,9 @@ def get_websocket_app(
         assert isinstance(async_exit_stack, AsyncExitStack), (
             "fastapi_inner_astack not found in request scope"
         )
-        solved_result = await solve_dependencies(
+        solved_result = await solve_dependency_plan(
             request=websocket,
-            dependant=dependant,
+            plan=dependency_plan,
             dependency_overrides_provider=dependency_overrides_provider,
             async_exit_stack=async_exit_stack,
             embed_body_fields=embed_body_fields,
@@ -766,6 +1781,59 @@ def get_websocket_app(
     return app
 
 
+# The route being copied by APIRouter.include_router(), so that the new APIRoute
+# can re-use the artifacts (dependant, ModelFields) that don't change
+_included_route: ContextVar["APIRoute | None"] = ContextVar(
+    "_included_route", default=None
+)
+
+
+def _get_included_route_dependant(
+    *,
+    included_route: "APIRoute",
+    path_format: str,
+    dependencies: list[params.Depends],
+) -> Dependant | None:
+    # The path params are computed from the path, a prefix could add new ones
+    if get_path_param_names(path_format) != get_path_param_names(
+        included_route.path_format
+    ):
+        return None
+    # The dependencies of the included route have to be the last ones, after
+    # the extra ones added when including it
+    extra_count = len(dependencies) - len(included_route.dependencies)
+    if extra_count < 0 or any(
+        depends is not included_depends
+        for depends, included_depends in zip(
+            dependencies[extra_count:], included_route.dependencies, strict=True
+        )
+    ):
+        return None
+    dependant = copy_dependant(dependant=included_route.dependant, path=path_format)
+    dependant.dependencies[0:0] = [
+        get_parameterless_sub_dependant(depends=depends, path=path_format)
+        for depends in dependencies[:extra_count]
+    ]
+    return dependant
+
+
+# The attributes of an APIRoute set when it is compiled, see APIRoute.warmup()
+_COMPILED_ROUTE_ATTRIBUTES = frozenset(
+    {
+        "response_field",
+        "stream_item_field",
+        "response_fields",
+        "dependant",
+        "_flat_dependant",
+        "_embed_body_fields",
+        "body_field",
+        "is_sse_stream",
+        "is_json_stream",
+        "app",
+    }
+)
+
+
 class APIWebSocketRoute(routing.WebSocketRoute):
     def __init__(
         self,
@@ -840,9 +1908,20 @@ class APIRoute(routing.Route):
         generate_unique_id_function: Callable[["APIRoute"], str]
         | DefaultPlaceholder = Default(generate_unique_id),
         strict_content_type: bool | DefaultPlaceholder = Default(True),
+        lazy: bool = False,
+        specialized_handler: bool = False,
+        body_decoders: dict[str, BodyDecoder] | None = None,
+        response_encoders: dict[str, ResponseEncoder] | None = None,
+        response_validation: Literal["full", "trust_instances"]
+        | DefaultPlaceholder = Default("full"),
+        response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+        jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
     ) -> None:
         self.path = path
         self.endpoint = endpoint
+        included_route = _included_route.get()
+        if included_route is not None and included_route.endpoint is not endpoint:
+            included_route = None
         self.stream_item_type: Any | None = None
         if isinstance(response_model, DefaultPlaceholder):
             return_annotation = get_typed_return_annotation(endpoint)
@@ -854,13 +1933,16 @@ class APIRoute(routing.Route):
                     # Extract item type for JSONL or SSE streaming when
                     # response_class is DefaultPlaceholder (JSONL) or
                     # EventSourceResponse (SSE).
-                    # ServerSentEvent is excluded: it's a transport
-                    # wrapper, not a data model, so it shouldn't feed
-                    # into validation or OpenAPI schema generation.
+                    # ServerSentEvent (and EncodedServerSentEvent) is excluded:
+                    # it's a transport wrapper, not a data model, so it
+                    # shouldn't feed into validation or OpenAPI schema
+                    # generation.
                     if (
                         isinstance(response_class, DefaultPlaceholder)
                         or lenient_issubclass(response_class, EventSourceResponse)
-                    ) and not lenient_issubclass(stream_item, ServerSentEvent):
+                    ) and not lenient_issubclass(
+                        stream_item, (ServerSentEvent, EncodedServerSentEvent)
+                    ):
                         self.stream_item_type = stream_item
                     response_model = None
                 else:
@@ -883,6 +1965,12 @@ class APIRoute(routing.Route):
         self.openapi_extra = openapi_extra
         self.generate_unique_id_function = generate_unique_id_function
         self.strict_content_type = strict_content_type
+        self.specialized_handler = specialized_handler
+        self.body_decoders = _normalize_media_types(body_decoders)
+        self.response_encoders = _normalize_media_types(response_encoders)
+        self.response_validation = response_validation
+        self.response_chunk_size = response_chunk_size
+        self.jsonl_buffer = jsonl_buffer
         self.tags = tags or []
         self.responses = responses or {}
         self.name = get_name(endpoint) if name is None else name
@@ -905,55 +1993,149 @@ class APIRoute(routing.Route):
             assert is_body_allowed_for_status_code(status_code), (
                 f"Status code {status_code} must not have a response body"
             )
+        self.dependencies = list(dependencies or [])
+        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
+        # if a "form feed" character (page break) is found in the description text,
+        # truncate description text to the content preceding the first "form feed"
+        self.description = self.description.split("\f")[0].strip()
+        for additional_status_code, response in self.responses.items():
+            assert isinstance(response, dict), "An additional response must be a dict"
+            if response.get("model"):
+                assert is_body_allowed_for_status_code(additional_status_code), (
+                    f"Status code {additional_status_code} must not have a response body"
+                )
+        assert callable(endpoint), "An endpoint must be a callable"
+        self.lazy = lazy
+        self._compiled = False
+        # Each route has its own, compiling a route doesn't wait for the others
+        self._compile_lock = threading.RLock()
+        self._included_route = included_route
+        if not lazy:
+            self.warmup()
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # Only called for attributes that are not set, in lazy mode the route
+            # is compiled the first time one of the compiled attributes is used,
+            # e.g. self.app when handling the first request
+            if name in _COMPILED_ROUTE_ATTRIBUTES and not self.__dict__.get(
+                "_compiled", True
+            ):
+                self.warmup()
+                return object.__getattribute__(self, name)
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    def warmup(self) -> None:
+        """
+        Compile the route: create the response fields, the dependant, the body
+        field and the request handler.
+
+        This is done when creating the route, unless it was created with
+        `lazy=True`, then it's done the first time it's used. Calling it again
+        does nothing.
+        """
+        if self._compiled:
+            return
+        with self._compile_lock:
+            if self._compiled:
+                return
+            self._compile()
+            self._compiled = True
+
+    def _compile(self) -> None:
+        # Only re-use what is already compiled in the original included route
+        included_route = self._included_route
+        if included_route is not None and not included_route._compiled:
+            included_route = None
+        if self.response_model:
             response_name = "Response_" + self.unique_id
-            self.response_field = create_model_field(
-                name=response_name,
-                type_=self.response_model,
-                mode="serialization",
-            )
+            self.response_field: ModelField
+            if (
+                included_route is not None
+                and included_route.response_field is not None
+                and included_route.response_model is self.response_model
+            ):
+                self.response_field = copy_model_field(
+                    included_route.response_field, name=response_name
+                )
+            else:
+                self.response_field = create_model_field(
+                    name=response_name,
+                    type_=self.response_model,
+                    mode="serialization",
+                )
         else:
             self.response_field = None  # type: ignore  # ty: ignore[unused-ignore-comment]
         if self.stream_item_type:
             stream_item_name = "StreamItem_" + self.unique_id
-            self.stream_item_field: ModelField | None = create_model_field(
-                name=stream_item_name,
-                type_=self.stream_item_type,
-                mode="serialization",
-            )
+            self.stream_item_field: ModelField | None
+            if (
+                included_route is not None
+                and included_route.stream_item_field is not None
+                and included_route.stream_item_type is self.stream_item_type
+            ):
+                self.stream_item_field = copy_model_field(
+                    included_route.stream_item_field, name=stream_item_name
+                )
+            else:
+                self.stream_item_field = create_model_field(
+                    name=stream_item_name,
+                    type_=self.stream_item_type,
+                    mode="serialization",
+                )
         else:
             self.stream_item_field = None
-        self.dependencies = list(dependencies or [])
-        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
-        # if a "form feed" character (page break) is found in the description text,
-        # truncate description text to the content preceding the first "form feed"
-        self.description = self.description.split("\f")[0].strip()
         response_fields = {}
         for additional_status_code, response in self.responses.items():
-            assert isinstance(response, dict), "An additional response must be a dict"
             model = response.get("model")
             if model:
-                assert is_body_allowed_for_status_code(additional_status_code), (
-                    f"Status code {additional_status_code} must not have a response body"
-                )
                 response_name = f"Response_{additional_status_code}_{self.unique_id}"
-                response_field = create_model_field(
-                    name=response_name, type_=model, mode="serialization"
+                included_field = (
+                    included_route.response_fields.get(additional_status_code)
+                    if included_route is not None
+                    else None
                 )
+                if (
+                    included_field is not None
+                    and included_field.field_info.annotation is model
+                ):
+                    response_field = copy_model_field(
+                        included_field, name=response_name
+                    )
+                else:
+                    response_field = create_model_field(
+                        name=response_name, type_=model, mode="serialization"
+                    )
                 response_fields[additional_status_code] = response_field
         if response_fields:
             self.response_fields: dict[int | str, ModelField] = response_fields
         else:
             self.response_fields = {}
 
-        assert callable(endpoint), "An endpoint must be a callable"
-        self.dependant = get_dependant(
-            path=self.path_format, call=self.endpoint, scope="function"
+        dependant = (
+            _get_included_route_dependant(
+                included_route=included_route,
+                path_format=self.path_format,
+                dependencies=self.dependencies,
+            )
+            if included_route is not None
+            else None
         )
-        for depends in self.dependencies[::-1]:
-            self.dependant.dependencies.insert(
-                0,
-                get_parameterless_sub_dependant(depends=depends, path=self.path_format),
+        if dependant is None:
+            dependant = get_dependant(
+                path=self.path_format, call=self.endpoint, scope="function"
             )
+            for depends in self.dependencies[::-1]:
+                dependant.dependencies.insert(
+                    0,
+                    get_parameterless_sub_dependant(
+                        depends=depends, path=self.path_format
+                    ),
+                )
+        self.dependant = dependant
         self._flat_dependant = get_flat_dependant(self.dependant)
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
@@ -968,15 +2150,21 @@ class APIRoute(routing.Route):
             self.dependant.is_async_gen_callable or self.dependant.is_gen_callable
         )
         self.is_sse_stream = is_generator and lenient_issubclass(
-            response_class, EventSourceResponse
+            self.response_class, EventSourceResponse
         )
         self.is_json_stream = is_generator and isinstance(
-            response_class, DefaultPlaceholder
+            self.response_class, DefaultPlaceholder
         )
         self.app = request_response(self.get_route_handler())
+        self._included_route = None
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
-        return get_request_handler(
+        get_handler = (
+            get_specialized_request_handler
+            if self.specialized_handler
+            else get_request_handler
+        )
+        return get_handler(
             dependant=self.dependant,
             body_field=self.body_field,
             status_code=self.status_code,
@@ -993,6 +2181,11 @@ class APIRoute(routing.Route):
             strict_content_type=self.strict_content_type,
             stream_item_field=self.stream_item_field,
             is_json_stream=self.is_json_stream,
+            body_decoders=self.body_decoders,
+            response_encoders=self.response_encoders,
+            response_validation=self.response_validation,
+            response_chunk_size=self.response_chunk_size,
+            jsonl_buffer=self.jsonl_buffer,
         )
 
     def matches(self, scope: Scope) -> tuple[Match, Scope]:
@@ -1266,6 +2459,142 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(True),
+        radix_routing: Annotated[
+            bool,
+            Doc(
+                """
+                Find the route for each request using a prefix tree (radix tree) of
+                the route paths instead of checking every route one by one.
+
+                The tree is built from the routes the first time a request is
+                received (and rebuilt when routes are added), so finding a route
+                takes time proportional to the length of the path, not to the
+                number of routes. This is useful for applications with many
+                routes.
+
+                The behavior is the same as the default: the first matching route
+                wins, a route that matches the path but not the method still
+                produces a `405 Method Not Allowed`, and mounted applications
+                still work.
+                """
+            ),
+        ] = False,
+        lazy_routes: Annotated[
+            bool,
+            Doc(
+                """
+                Create the *path operations* without compiling them, they are
+                compiled the first time they are used (e.g. with the first request
+                or when generating the OpenAPI schema).
+
+                Compiling a *path operation* means analyzing its dependencies and
+                parameters and creating the validators and serializers for its
+                request body and response. Doing it lazily makes starting
+                applications with many *path operations* much faster.
+
+                Errors in the *path operations* declarations (e.g. an invalid
+                `response_model`) are only raised when they are compiled, call
+                `warmup()` (e.g. in your tests) to compile all of them at once.
+                """
+            ),
+        ] = False,
+        specialized_handlers: Annotated[
+            bool,
+            Doc(
+                """
+                Use a request handler specialized for each *path operation*.
+
+                By default, the same generic request handler checks on every request
+                if the *path operation* has a body, if it's a form, if it streams,
+                how to serialize the response, etc. With this option, those
+                decisions are taken once when the *path operation* is created, and
+                the request handler only includes the steps it needs.
+
+                The behavior is the same as with the default request handler.
+                """
+            ),
+        ] = False,
+        body_decoders: Annotated[
+            dict[str, BodyDecoder] | None,
+            Doc(
+                """
+                Functions to decode request bodies with other media types, for
+                example `{"application/msgpack": msgpack.unpackb}`.
+
+                Each function receives the body `bytes` and returns the decoded data,
+                that is then validated as with JSON. Errors raised while decoding
+                are returned as validation errors. A decoder for
+                `application/json` replaces the default JSON parsing.
+
+                They are used by the *path operations* added after this, and are
+                shown as the accepted media types of the request body in OpenAPI.
+                """
+            ),
+        ] = None,
+        response_encoders: Annotated[
+            dict[str, ResponseEncoder] | None,
+            Doc(
+                """
+                Functions to encode responses with other media types, for example
+                `{"application/msgpack": msgpack.packb}`, chosen with the `Accept`
+                header of each request.
+
+                Each function receives the JSON compatible data of the response,
+                serialized with the `response_model` (if any), and returns the
+                body `bytes`. JSON is still used when the client accepts it as much
+                as the other media types, or doesn't send an `Accept` header.
+
+                They are only used by the *path operations* that use the default
+                response class, added after this, and are shown as the response
+                media types in OpenAPI.
+                """
+            ),
+        ] = None,
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by the *path operations* with
+                their `response_model`: `"full"` (the default) or
+                `"trust_instances"`, to only serialize instances of exactly the
+                `response_model` class. They can override it.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses of the *path operations* in chunks of this
+                many items, they can override it.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of JSON Lines streams (*path operations* that use
+                `yield`), and send several of them in each chunk, instead of one
+                chunk per item, they can override it.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> None:
         # Determine the lifespan context to use
         if lifespan is None:
@@ -1285,6 +2614,8 @@ class APIRouter(routing.Router):
             default=default,
             lifespan=lifespan_context,
         )
+        # Counts its changes, to know when the route lookup tables are stale
+        self.routes = _RouteList(self.routes)
         if prefix:
             assert prefix.startswith("/"), "A path prefix must start with '/'"
             assert not prefix.endswith("/"), (
@@ -1313,6 +2644,121 @@ class APIRouter(routing.Router):
         self.default_response_class = default_response_class
         self.generate_unique_id_function = generate_unique_id_function
         self.strict_content_type = strict_content_type
+        self.radix_routing = radix_routing
+        self.lazy_routes = lazy_routes
+        self.specialized_handlers = specialized_handlers
+        self.body_decoders = _normalize_media_types(body_decoders)
+        self.response_encoders = _normalize_media_types(response_encoders)
+        self.response_validation = response_validation
+        self.response_chunk_size = response_chunk_size
+        self.jsonl_buffer = jsonl_buffer
+        self._static_route_table: _StaticRouteTable | None = None
+
+    def warmup(self) -> None:
+        """
+        Compile all the *path operations* in this router that were not compiled
+        yet, when using `lazy_routes=True`.
+
+        This is useful to pay the cost of compiling them before receiving
+        requests, e.g. after forking the worker processes.
+        """
+        for route in self.routes:
+            if isinstance(route, APIRoute):
+                route.warmup()
+
+    def _get_static_route_table(self) -> _StaticRouteTable:
+        static_route_table = self._static_route_table
+        if static_route_table is None or not static_route_table.is_current(self.routes):
+            static_route_table = self._static_route_table = _StaticRouteTable(
+                _RouteTree(self.routes)
+            )
+        return static_route_table
+
+    def _get_candidate_routes(self, route_path: str) -> Sequence[BaseRoute]:
+        if not self.radix_routing:
+            return self.routes
+        route_tree = self._get_static_route_table().route_tree
+        return route_tree.get_candidates(route_path)
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await super().app(scope, receive, send)
+            return
+        # Same as Starlette's Router.app, but first checking the static routes
+        # table, and with radix_routing, only checking the routes that could
+        # match the path, in the same order
+        if "router" not in scope:
+            scope["router"] = self
+        route_path = get_route_path(scope)
+        if scope["type"] == "http":
+            static_route_table = self._get_static_route_table()
+            for route in static_route_table.get_candidates(scope["method"], route_path):
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        partial = None
+        partial_scope: Scope = {}
+        for route in self._get_candidate_routes(route_path):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+        if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            for route in self._get_candidate_routes(get_route_path(redirect_scope)):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+        await self.default(scope, receive, send)
+
+    async def lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Copy of starlette.routing.Router.lifespan modified to close the
+        # dependencies with scope="app" on shutdown, after the lifespan context
+        started = False
+        app: Any = scope.get("app")
+        await receive()
+        try:
+            async with (
+                app_dependencies_lifespan(app or self),
+                _keepalive_scheduler_lifespan(app or self, _PING_INTERVAL),
+            ):
+                async with self.lifespan_context(app) as maybe_state:
+                    if maybe_state is not None:
+                        if "state" not in scope:
+                            raise RuntimeError(
+                                'The server does not support "state" in the '
+                                "lifespan scope."
+                            )
+                        scope["state"].update(maybe_state)
+                    await send({"type": "lifespan.startup.complete"})
+                    started = True
+                    await receive()
+        except BaseException:
+            exc_text = traceback.format_exc()
+            if started:
+                await send({"type": "lifespan.shutdown.failed", "message": exc_text})
+            else:
+                await send({"type": "lifespan.startup.failed", "message": exc_text})
+            raise
+        else:
+            await send({"type": "lifespan.shutdown.complete"})
 
     def route(
         self,
@@ -1364,6 +2810,12 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str]
         | DefaultPlaceholder = Default(generate_unique_id),
         strict_content_type: bool | DefaultPlaceholder = Default(True),
+        body_decoders: dict[str, BodyDecoder] | None = None,
+        response_encoders: dict[str, ResponseEncoder] | None = None,
+        response_validation: Literal["full", "trust_instances"]
+        | DefaultPlaceholder = Default("full"),
+        response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+        jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
     ) -> None:
         route_class = route_class_override or self.route_class
         responses = responses or {}
@@ -1383,6 +2835,30 @@ class APIRouter(routing.Router):
         current_generate_unique_id = get_value_or_default(
             generate_unique_id_function, self.generate_unique_id_function
         )
+        # Only the ones that are set, for route classes with their own __init__()
+        # that doesn't take them
+        route_options: dict[str, Any] = {}
+        if self.lazy_routes:
+            route_options["lazy"] = True
+        if self.specialized_handlers:
+            route_options["specialized_handler"] = True
+        current_body_decoders = {**self.body_decoders, **(body_decoders or {})}
+        if current_body_decoders:
+            route_options["body_decoders"] = current_body_decoders
+        current_response_encoders = {
+            **self.response_encoders,
+            **(response_encoders or {}),
+        }
+        if current_response_encoders:
+            route_options["response_encoders"] = current_response_encoders
+        for option_name, value in (
+            ("response_validation", response_validation),
+            ("response_chunk_size", response_chunk_size),
+            ("jsonl_buffer", jsonl_buffer),
+        ):
+            current_value = get_value_or_default(value, getattr(self, option_name))
+            if not isinstance(current_value, DefaultPlaceholder):
+                route_options[option_name] = current_value
         route = route_class(
             self.prefix + path,
             endpoint=endpoint,
@@ -1413,6 +2889,7 @@ class APIRouter(routing.Router):
             strict_content_type=get_value_or_default(
                 strict_content_type, self.strict_content_type
             ),
+            **route_options,
         )
         self.routes.append(route)
 
@@ -1445,6 +2922,10 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
+        response_validation: Literal["full", "trust_instances"]
+        | DefaultPlaceholder = Default("full"),
+        response_chunk_size: int | None | DefaultPlaceholder = Default(None),
+        jsonl_buffer: JSONLBuffer | None | DefaultPlaceholder = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_route(
@@ -1473,6 +2954,9 @@ class APIRouter(routing.Router):
                 callbacks=callbacks,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                response_validation=response_validation,
+                response_chunk_size=response_chunk_size,
+                jsonl_buffer=jsonl_buffer,
             )
             return func
 
@@ -1759,41 +3243,63 @@ class APIRouter(routing.Router):
                     generate_unique_id_function,
                     self.generate_unique_id_function,
                 )
-                self.add_api_route(
-                    prefix + route.path,
-                    route.endpoint,
-                    response_model=route.response_model,
-                    status_code=route.status_code,
-                    tags=current_tags,
-                    dependencies=current_dependencies,
-                    summary=route.summary,
-                    description=route.description,
-                    response_description=route.response_description,
-                    responses=combined_responses,
-                    deprecated=route.deprecated or deprecated or self.deprecated,
-                    methods=route.methods,
-                    operation_id=route.operation_id,
-                    response_model_include=route.response_model_include,
-                    response_model_exclude=route.response_model_exclude,
-                    response_model_by_alias=route.response_model_by_alias,
-                    response_model_exclude_unset=route.response_model_exclude_unset,
-                    response_model_exclude_defaults=route.response_model_exclude_defaults,
-                    response_model_exclude_none=route.response_model_exclude_none,
-                    include_in_schema=route.include_in_schema
-                    and self.include_in_schema
-                    and include_in_schema,
-                    response_class=use_response_class,
-                    name=route.name,
-                    route_class_override=type(route),
-                    callbacks=current_callbacks,
-                    openapi_extra=route.openapi_extra,
-                    generate_unique_id_function=current_generate_unique_id,
-                    strict_content_type=get_value_or_default(
-                        route.strict_content_type,
-                        router.strict_content_type,
-                        self.strict_content_type,
-                    ),
-                )
+                # Let the new route re-use what doesn't change from this one
+                included_route_token = _included_route.set(route)
+                try:
+                    self.add_api_route(
+                        prefix + route.path,
+                        route.endpoint,
+                        response_model=route.response_model,
+                        status_code=route.status_code,
+                        tags=current_tags,
+                        dependencies=current_dependencies,
+                        summary=route.summary,
+                        description=route.description,
+                        response_description=route.response_description,
+                        responses=combined_responses,
+                        deprecated=route.deprecated or deprecated or self.deprecated,
+                        methods=route.methods,
+                        operation_id=route.operation_id,
+                        response_model_include=route.response_model_include,
+                        response_model_exclude=route.response_model_exclude,
+                        response_model_by_alias=route.response_model_by_alias,
+                        response_model_exclude_unset=route.response_model_exclude_unset,
+                        response_model_exclude_defaults=route.response_model_exclude_defaults,
+                        response_model_exclude_none=route.response_model_exclude_none,
+                        include_in_schema=route.include_in_schema
+                        and self.include_in_schema
+                        and include_in_schema,
+                        response_class=use_response_class,
+                        name=route.name,
+                        route_class_override=type(route),
+                        callbacks=current_callbacks,
+                        openapi_extra=route.openapi_extra,
+                        generate_unique_id_function=current_generate_unique_id,
+                        strict_content_type=get_value_or_default(
+                            route.strict_content_type,
+                            router.strict_content_type,
+                            self.strict_content_type,
+                        ),
+                        body_decoders=route.body_decoders,
+                        response_encoders=route.response_encoders,
+                        response_validation=get_value_or_default(
+                            route.response_validation,
+                            router.response_validation,
+                            self.response_validation,
+                        ),
+                        response_chunk_size=get_value_or_default(
+                            route.response_chunk_size,
+                            router.response_chunk_size,
+                            self.response_chunk_size,
+                        ),
+                        jsonl_buffer=get_value_or_default(
+                            route.jsonl_buffer,
+                            router.jsonl_buffer,
+                            self.jsonl_buffer,
+                        ),
+                    )
+                finally:
+                    _included_route.reset(included_route_token)
             elif isinstance(route, routing.Route):
                 methods = list(route.methods or [])
                 self.add_route(
@@ -2159,6 +3665,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -2203,6 +3752,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def put(
@@ -2536,6 +4088,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2585,6 +4180,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def post(
@@ -2918,6 +4516,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2967,6 +4608,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def delete(
@@ -3300,6 +4944,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -3344,6 +5031,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def options(
@@ -3677,6 +5367,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3721,6 +5454,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def head(
@@ -4054,6 +5790,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -4103,6 +5882,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def patch(
@@ -4436,6 +6218,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4485,6 +6310,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     def trace(
@@ -4818,6 +6646,49 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        response_validation: Annotated[
+            Literal["full", "trust_instances"],
+            Doc(
+                """
+                How to validate the data returned by this *path operation* with the
+                `response_model`: `"full"` (the default) or `"trust_instances"`, to
+                only serialize instances of exactly the `response_model` class.
+                """
+            ),
+        ] = Default("full"),
+        response_chunk_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Stream list responses in chunks of this many items.
+
+                When set, and the `response_model` is a `list` (e.g. `list[Item]`),
+                the returned items are validated and serialized to JSON one chunk
+                at a time and sent in a streaming response, instead of creating all
+                the JSON at once. This keeps the memory used by large responses
+                bounded by the chunk size.
+
+                A validation error in the first chunk is raised as usual. An error in
+                a later chunk is raised after the status code, the headers and the
+                previous chunks were sent, so the client gets a `200` response with
+                an incomplete JSON array.
+                """
+            ),
+        ] = Default(None),
+        jsonl_buffer: Annotated[
+            JSONLBuffer | None,
+            Doc(
+                """
+                Buffer the items of the JSON Lines stream (when the *path
+                operation* uses `yield`), and send several of them in each chunk,
+                instead of one chunk per item.
+
+                Use a `fastapi.streaming.JSONLBuffer` to set the size and delay
+                limits, and optionally validate the items in batches. By default
+                (`None`), each item is sent as soon as it's yielded.
+                """
+            ),
+        ] = Default(None),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4867,6 +6738,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            response_validation=response_validation,
+            response_chunk_size=response_chunk_size,
+            jsonl_buffer=jsonl_buffer,
         )
 
     # TODO: remove this once the lifespan (or alternative) interface is improved
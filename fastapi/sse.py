@@ -1,8 +1,20 @@
-from typing import Annotated, Any
-
+import itertools
+import json
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Annotated, Any, Literal
+from weakref import WeakKeyDictionary
+
+import anyio
 from annotated_doc import Doc
+from anyio.streams.memory import MemoryObjectSendStream
+from fastapi.encoders import jsonable_encoder
 from pydantic import AfterValidator, BaseModel, Field, model_validator
 from starlette.responses import StreamingResponse
+from typing_extensions import Self
 
 # Canonical SSE event schema matching the OpenAPI 3.2 spec
 # (Section 4.14.4 "Special Considerations for Server-Sent Events")
@@ -220,3 +232,480 @@ KEEPALIVE_COMMENT = b": ping\n\n"
 # Seconds between keep-alive pings when a generator is idle.
 # Private but importable so tests can monkeypatch it.
 _PING_INTERVAL: float = 15.0
+
+
+class _KeepaliveScheduler:
+    """Send keep-alive pings to the idle SSE streams of an app from a single task.
+
+    The streams are kept in the order of their next ping, as they all use the
+    same interval, and a stream moves to the end each time it sends something.
+    So, the task only sleeps until the ping of the first stream, instead of each
+    stream having its own timer.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        # The time of the next ping of each stream
+        self._deadlines: OrderedDict[MemoryObjectSendStream[bytes], float] = (
+            OrderedDict()
+        )
+        self._wakeup = anyio.Event()
+
+    def register(self, stream: MemoryObjectSendStream[bytes]) -> None:
+        self._deadlines[stream] = anyio.current_time() + self.interval
+        self._wakeup.set()
+
+    def touch(self, stream: MemoryObjectSendStream[bytes]) -> None:
+        """Postpone the next ping, after sending data to the stream."""
+        if stream in self._deadlines:
+            self._deadlines[stream] = anyio.current_time() + self.interval
+            self._deadlines.move_to_end(stream)
+
+    def unregister(self, stream: MemoryObjectSendStream[bytes]) -> None:
+        self._deadlines.pop(stream, None)
+
+    async def run(self) -> None:
+        while True:
+            if not self._deadlines:
+                self._wakeup = anyio.Event()
+                await self._wakeup.wait()
+                continue
+            stream, deadline = next(iter(self._deadlines.items()))
+            delay = deadline - anyio.current_time()
+            if delay > 0:
+                await anyio.sleep(delay)
+                continue
+            try:
+                stream.send_nowait(KEEPALIVE_COMMENT)
+            except anyio.WouldBlock:
+                # There's data waiting to be sent, it's not idle
+                pass
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                self.unregister(stream)
+                continue
+            self.touch(stream)
+
+
+# By application (or router, when used without an application), only while its
+# lifespan is running
+_keepalive_schedulers: "WeakKeyDictionary[Any, _KeepaliveScheduler]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_keepalive_scheduler(app: Any) -> _KeepaliveScheduler | None:
+    return _keepalive_schedulers.get(app) if app is not None else None
+
+
+@asynccontextmanager
+async def _keepalive_scheduler_lifespan(
+    app: Any, interval: float
+) -> AsyncIterator[None]:
+    """Run the keep-alive pings of the SSE streams of `app` during its lifespan."""
+    scheduler = _KeepaliveScheduler(interval)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(scheduler.run)
+        _keepalive_schedulers[app] = scheduler
+        try:
+            yield
+        finally:
+            _keepalive_schedulers.pop(app, None)
+            tg.cancel_scope.cancel()
+
+
+def _encode_server_sent_event(event: ServerSentEvent) -> bytes:
+    """Encode a `ServerSentEvent` to SSE wire-format bytes."""
+    if event.raw_data is not None:
+        data_str: str | None = event.raw_data
+    elif event.data is not None:
+        if hasattr(event.data, "model_dump_json"):
+            data_str = event.data.model_dump_json()
+        else:
+            data_str = json.dumps(jsonable_encoder(event.data))
+    else:
+        data_str = None
+    return format_sse_event(
+        data_str=data_str,
+        event=event.event,
+        id=event.id,
+        retry=event.retry,
+        comment=event.comment,
+    )
+
+
+class EncodedServerSentEvent:
+    """A Server-Sent Event already encoded in the SSE wire format.
+
+    Created by `EventBroadcaster.publish()`. When `yield`ed from a *path
+    operation function* that uses `response_class=EventSourceResponse`, its
+    bytes are sent as is, the same instance can be sent to many clients.
+    """
+
+    __slots__ = ("id", "content")
+
+    def __init__(
+        self,
+        content: Annotated[
+            bytes,
+            Doc(
+                """
+                The encoded event, ending with `\\n\\n`.
+                """
+            ),
+        ],
+        *,
+        id: Annotated[
+            str | None,
+            Doc(
+                """
+                The event ID, if any.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        self.content = content
+        self.id = id
+
+    @classmethod
+    def from_event(
+        cls,
+        event: Annotated[
+            Any,
+            Doc(
+                """
+                A `ServerSentEvent`, or the data of the event, that is serialized
+                to JSON as when it's `yield`ed.
+                """
+            ),
+        ],
+    ) -> Self:
+        """Serialize and encode an event once, to send it to many clients."""
+        if not isinstance(event, ServerSentEvent):
+            if hasattr(event, "model_dump_json"):
+                data_str = event.model_dump_json()
+            else:
+                data_str = json.dumps(jsonable_encoder(event))
+            return cls(format_sse_event(data_str=data_str))
+        return cls(_encode_server_sent_event(event), id=event.id)
+
+
+class EventSubscription:
+    """The events published to a channel of an `EventBroadcaster`.
+
+    Created by `EventBroadcaster.subscribe()`. Iterate over it to receive the
+    `EncodedServerSentEvent`s, and `yield` them from a *path operation
+    function*. Use it with `async with` to stop receiving events when done.
+
+    The iteration ends when the broadcaster closes the channel, or with the
+    `"disconnect"` overflow policy, when the subscriber falls behind.
+
+    With a `last_event_id`, the events published after it that the broadcaster
+    kept for replay are received first, and `replayed` is `True`. When that
+    event is no longer kept (or it never existed), nothing is replayed and
+    `replayed` is `False`, so the client could need the full state instead.
+    """
+
+    def __init__(
+        self,
+        broadcaster: "EventBroadcaster",
+        channel: str,
+        max_queue_size: int,
+        overflow: Literal["drop_oldest", "drop_newest", "disconnect"],
+    ) -> None:
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.overflow = overflow
+        self._max_queue_size = max_queue_size
+        self._queue: deque[EncodedServerSentEvent] = deque(
+            maxlen=max_queue_size if overflow == "drop_oldest" else None
+        )
+        # Sent before the queue, not limited by max_queue_size
+        self._replay: deque[EncodedServerSentEvent] = deque()
+        self._waiter: anyio.Event | None = None
+        self.closed = False
+        self.dropped = 0
+        self.replayed = False
+
+    def _put(self, event: EncodedServerSentEvent) -> None:
+        if self.closed:
+            return
+        if len(self._queue) >= self._max_queue_size:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            if self.overflow == "disconnect":
+                self._replay.clear()
+                self._queue.clear()
+                self.close()
+                return
+        # With "drop_oldest", the deque discards the oldest event
+        self._queue.append(event)
+        if self._waiter is not None:
+            self._waiter.set()
+
+    def close(self) -> None:
+        """Stop receiving events, the iteration ends after the queued ones."""
+        if self.closed:
+            return
+        self.closed = True
+        self.broadcaster._unsubscribe(self)
+        if self._waiter is not None:
+            self._waiter.set()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> EncodedServerSentEvent:
+        if self._replay:
+            return self._replay.popleft()
+        while not self._queue:
+            if self.closed:
+                raise StopAsyncIteration
+            self._waiter = anyio.Event()
+            try:
+                await self._waiter.wait()
+            finally:
+                self._waiter = None
+        return self._queue.popleft()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+
+# The Last-Event-ID header of the request, for the task that iterates the generator
+# of a Server-Sent Events path operation
+_request_last_event_id: ContextVar[str | None] = ContextVar(
+    "_request_last_event_id", default=None
+)
+
+
+class EventBroadcaster:
+    """Send the same Server-Sent Events to many clients.
+
+    Each published event is serialized and encoded once, and the same bytes are
+    added to the queue of each subscriber of the channel.
+
+    Call `publish()` from the event loop (e.g. from an `async` function). From a
+    thread, use `anyio.from_thread.run_sync(broadcaster.publish, event)`.
+
+    ## Example
+
+    ```python
+    from collections.abc import AsyncIterable
+
+    from fastapi import FastAPI
+    from fastapi.sse import EncodedServerSentEvent, EventBroadcaster, EventSourceResponse
+
+    app = FastAPI()
+    broadcaster = EventBroadcaster()
+
+
+    @app.get("/ticks", response_class=EventSourceResponse)
+    async def stream_ticks() -> AsyncIterable[EncodedServerSentEvent]:
+        async with broadcaster.subscribe("ticks") as events:
+            async for event in events:
+                yield event
+
+
+    @app.post("/ticks")
+    async def create_tick(tick: Tick):
+        broadcaster.publish(tick, channel="ticks")
+    ```
+
+    ## Replay
+
+    With `replay_size` or `replay_max_age`, the broadcaster keeps the recent
+    encoded events of each channel. A client that reconnects sends the ID of the
+    last event it received in the `Last-Event-ID` header. When `subscribe()` is
+    called in a *path operation* with `response_class=EventSourceResponse`, it
+    reads that header and sends the events the client missed before the new
+    ones:
+
+    ```python
+    broadcaster = EventBroadcaster(replay_size=1000, replay_max_age=60)
+
+
+    @app.get("/ticks", response_class=EventSourceResponse)
+    async def stream_ticks() -> AsyncIterable[EncodedServerSentEvent]:
+        async with broadcaster.subscribe("ticks") as events:
+            async for event in events:
+                yield event
+    ```
+
+    Only the events published with an `id` (e.g. a `ServerSentEvent` with an
+    `id`) can be used to resume, the events after it are replayed with or without
+    an `id`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue_size: Annotated[
+            int,
+            Doc(
+                """
+                The maximum number of events waiting to be sent to each
+                subscriber.
+                """
+            ),
+        ] = 100,
+        overflow: Annotated[
+            Literal["drop_oldest", "drop_newest", "disconnect"],
+            Doc(
+                """
+                What to do when the queue of a subscriber is full.
+
+                * `"drop_oldest"`: discard the oldest queued event to add the new one.
+                * `"drop_newest"`: discard the new event.
+                * `"disconnect"`: discard the queued events and close the
+                    subscription, ending the response. The client can reconnect.
+                """
+            ),
+        ] = "drop_oldest",
+        replay_size: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of recent events to keep for each channel, to
+                replay them to the clients that reconnect with a
+                `Last-Event-ID`.
+
+                By default (when `replay_max_age` is also `None`), no events are
+                kept.
+                """
+            ),
+        ] = None,
+        replay_max_age: Annotated[
+            float | None,
+            Doc(
+                """
+                The maximum number of seconds to keep the recent events of each
+                channel for replay.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.replay_size = replay_size
+        self.replay_max_age = replay_max_age
+        self._channels: dict[str, dict[EventSubscription, None]] = {}
+        # The recent events of each channel, with the time they were published
+        self._history: dict[str, deque[tuple[float, EncodedServerSentEvent]]] = {}
+
+    def subscribe(
+        self,
+        channel: Annotated[
+            str,
+            Doc(
+                """
+                The channel to receive the events from.
+                """
+            ),
+        ] = "default",
+        last_event_id: Annotated[
+            str | None,
+            Doc(
+                """
+                The value of the `Last-Event-ID` header sent by a reconnecting
+                client, to first receive the kept events published after it.
+
+                By default, the `Last-Event-ID` header of the request, when
+                called in a *path operation* that streams Server-Sent Events.
+                """
+            ),
+        ] = None,
+    ) -> EventSubscription:
+        """Receive the events published to `channel` from now on."""
+        if last_event_id is None:
+            last_event_id = _request_last_event_id.get()
+        subscription = EventSubscription(
+            self,
+            channel,
+            max_queue_size=self.max_queue_size,
+            overflow=self.overflow,
+        )
+        if last_event_id is not None:
+            history = self._get_history(channel)
+            # The newest event with that ID, as IDs are not required to be unique
+            for index in range(len(history) - 1, -1, -1):
+                if history[index][1].id == last_event_id:
+                    subscription._replay.extend(
+                        event for _, event in itertools.islice(history, index + 1, None)
+                    )
+                    subscription.replayed = True
+                    break
+        self._channels.setdefault(channel, {})[subscription] = None
+        return subscription
+
+    def _get_history(self, channel: str) -> deque[tuple[float, EncodedServerSentEvent]]:
+        history = self._history.get(channel)
+        if history is None:
+            return deque()
+        if self.replay_max_age is not None:
+            expired = time.monotonic() - self.replay_max_age
+            while history and history[0][0] < expired:
+                history.popleft()
+        return history
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        subscriptions = self._channels.get(subscription.channel)
+        if subscriptions is not None:
+            subscriptions.pop(subscription, None)
+            if not subscriptions:
+                del self._channels[subscription.channel]
+
+    def publish(
+        self,
+        event: Annotated[
+            Any,
+            Doc(
+                """
+                A `ServerSentEvent`, an `EncodedServerSentEvent`, or the data of
+                the event, that is serialized to JSON as when it's `yield`ed.
+                """
+            ),
+        ],
+        channel: Annotated[
+            str,
+            Doc(
+                """
+                The channel to send the event to.
+                """
+            ),
+        ] = "default",
+    ) -> EncodedServerSentEvent:
+        """Send an event to the current subscribers of `channel`."""
+        encoded = (
+            event
+            if isinstance(event, EncodedServerSentEvent)
+            else EncodedServerSentEvent.from_event(event)
+        )
+        if self.replay_size is not None or self.replay_max_age is not None:
+            history = self._history.get(channel)
+            if history is None:
+                history = self._history[channel] = deque(maxlen=self.replay_size)
+            history.append((time.monotonic(), encoded))
+            # Discard the expired events
+            self._get_history(channel)
+        # Copied, as the "disconnect" policy can remove subscriptions
+        for subscription in list(self._channels.get(channel, ())):
+            subscription._put(encoded)
+        return encoded
+
+    def subscriber_count(self, channel: str = "default") -> int:
+        """The number of current subscribers of `channel`."""
+        return len(self._channels.get(channel, ()))
+
+    def close(self, channel: str | None = None) -> None:
+        """Close the subscriptions to `channel`, or to all the channels.
+
+        Their iterations end after the queued events are sent.
+        """
+        channels = [channel] if channel is not None else list(self._channels)
+        for name in channels:
+            for subscription in list(self._channels.get(name, ())):
+                subscription.close()
@@ -0,0 +1,233 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
+
+import anyio
+from annotated_doc import Doc
+from anyio.abc import ObjectReceiveStream
+
+
+class JSONLBuffer:
+    """
+    Buffer the items of a JSON Lines stream (a *path operation* that uses `yield`)
+    and send them together in a single chunk, instead of one chunk per item.
+
+    Pass it to `jsonl_buffer` in the *path operation* decorator, the `APIRouter`,
+    or the `FastAPI` app.
+
+    The buffered items are sent when they reach `max_bytes`, when the first of
+    them has been waiting for `max_delay` seconds, and when the stream ends.
+
+    ## Example
+
+    ```python
+    from collections.abc import AsyncIterable
+
+    from fastapi import FastAPI
+    from fastapi.streaming import JSONLBuffer
+    from pydantic import BaseModel
+
+    app = FastAPI()
+
+
+    class Item(BaseModel):
+        name: str
+
+
+    @app.get("/items", jsonl_buffer=JSONLBuffer(max_bytes=64 * 1024, max_delay=0.05))
+    async def stream_items() -> AsyncIterable[Item]:
+        async for item in read_items():
+            yield item
+    ```
+    """
+
+    def __init__(
+        self,
+        max_bytes: Annotated[
+            int,
+            Doc(
+                """
+                Send the buffered items when their JSON Lines reach this number of
+                bytes. Use `0` to send each item as soon as it's serialized.
+                """
+            ),
+        ] = 64 * 1024,
+        max_delay: Annotated[
+            float | None,
+            Doc(
+                """
+                The maximum number of seconds an item waits in the buffer before
+                it's sent, even if `max_bytes` wasn't reached. `None` means no
+                limit, the items are only sent when reaching `max_bytes` or at the
+                end of the stream.
+                """
+            ),
+        ] = 0.05,
+        batch_size: Annotated[
+            int | None,
+            Doc(
+                """
+                Validate the items with the stream item type in batches of this
+                many items (using a `list` of the item type), instead of one by
+                one. A batch with fewer items is validated when `max_delay` is
+                reached or the stream ends.
+
+                By default, each item is validated and serialized when it's
+                yielded.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+
+
+class _JSONLBufferState:
+    """
+    The items waiting to be sent, serialized in `data`, or in `pending` when
+    they are validated in batches.
+    """
+
+    def __init__(
+        self,
+        buffer: JSONLBuffer,
+        serialize_items: Callable[[list[Any]], bytes],
+    ) -> None:
+        self.buffer = buffer
+        self.serialize_items = serialize_items
+        self.pending: list[Any] = []
+        self.data = bytearray()
+        self.deadline: float | None = None
+
+    def add(self, item: Any) -> bytes | None:
+        """
+        Add an item, return the buffered chunk if it's ready to be sent.
+        """
+        self.pending.append(item)
+        batch_size = self.buffer.batch_size
+        if batch_size is None or len(self.pending) >= batch_size:
+            self.data += self.serialize_items(self.pending)
+            self.pending.clear()
+        if self.data and len(self.data) >= self.buffer.max_bytes:
+            chunk = bytes(self.data)
+            self.data.clear()
+            if not self.pending:
+                self.deadline = None
+            return chunk
+        return None
+
+    def take(self) -> bytes:
+        """
+        Return all the buffered items, validating a partial batch.
+        """
+        if self.pending:
+            self.data += self.serialize_items(self.pending)
+            self.pending.clear()
+        chunk = bytes(self.data)
+        self.data.clear()
+        self.deadline = None
+        return chunk
+
+
+async def _iter_buffered(
+    items: AsyncIterator[Any], state: _JSONLBufferState
+) -> AsyncIterator[bytes]:
+    async for item in items:
+        chunk = state.add(item)
+        if chunk is not None:
+            yield chunk
+            # To allow for cancellation to trigger
+            await anyio.sleep(0)
+    chunk = state.take()
+    if chunk:
+        yield chunk
+
+
+# Sent by the producer when the first item is buffered, to start the timer
+_STARTED = b""
+
+
+async def _iter_buffered_with_delay(
+    receive_stream: ObjectReceiveStream[bytes],
+    state: _JSONLBufferState,
+    errors: list[Exception],
+) -> AsyncIterator[bytes]:
+    while True:
+        timeout = (
+            None if state.deadline is None else state.deadline - anyio.current_time()
+        )
+        with anyio.move_on_after(timeout) as scope:
+            try:
+                chunk = await receive_stream.receive()
+            except anyio.EndOfStream:
+                break
+        if scope.cancelled_caught:
+            # max_delay was reached
+            chunk = state.take()
+        if chunk:
+            yield chunk
+            # To allow for cancellation to trigger
+            await anyio.sleep(0)
+    if errors:
+        raise errors[0]
+    chunk = state.take()
+    if chunk:
+        yield chunk
+
+
+@asynccontextmanager
+async def buffered_jsonl_stream(
+    items: AsyncIterator[Any],
+    *,
+    buffer: JSONLBuffer,
+    serialize_items: Callable[[list[Any]], bytes],
+) -> AsyncIterator[AsyncIterator[bytes]]:
+    """
+    Yield an async iterator of the JSON Lines of `items`, buffered as configured
+    by `buffer`, `serialize_items()` receives a list of the items to serialize.
+
+    With a `max_delay`, the items are read and buffered by a separate task, that
+    only sends the chunks that reached `max_bytes`, so that waiting for them can
+    time out (and send what was buffered so far) without cancelling the
+    iteration of `items`, that would finalize an async generator. Enter it in an
+    exit stack that outlives the streaming response, as with Server-Sent Events.
+    """
+    state = _JSONLBufferState(buffer, serialize_items)
+    if buffer.max_delay is None:
+        yield _iter_buffered(items, state)
+        return
+    max_delay = buffer.max_delay
+    send_stream, receive_stream = anyio.create_memory_object_stream[bytes](
+        max_buffer_size=1
+    )
+    # Raised by the consumer, to be handled as the errors of an unbuffered stream
+    errors: list[Exception] = []
+
+    async def _producer() -> None:
+        async with send_stream:
+            try:
+                async for item in items:
+                    started = state.deadline is None
+                    if started:
+                        state.deadline = anyio.current_time() + max_delay
+                    chunk = state.add(item)
+                    if chunk is not None:
+                        await send_stream.send(chunk)
+                    elif started:
+                        await send_stream.send(_STARTED)
+            except Exception as e:
+                errors.append(e)
+
+    error: Exception | None = None
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_producer)
+        async with receive_stream:
+            try:
+                yield _iter_buffered_with_delay(receive_stream, state, errors)
+            except Exception as e:
+                # Raised after the task group, not wrapped in an exception group
+                error = e
+        tg.cancel_scope.cancel()
+    if error is not None:
+        raise error
@@ -10,3 +10,5 @@ DecoratedCallable = TypeVar("DecoratedCallable", bound=Callable[..., Any])
 UnionType = getattr(types, "UnionType", Union)
 ModelNameMap = dict[type[BaseModel] | type[Enum], str]
 DependencyCacheKey = tuple[Callable[..., Any] | None, tuple[str, ...], str]
+BodyDecoder = Callable[[bytes], Any]
+ResponseEncoder = Callable[[Any], bytes]
@@ -1,9 +1,12 @@
 import re
 import warnings
+from copy import copy
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    NamedTuple,
 )
 
 import fastapi
@@ -77,6 +80,101 @@ def create_model_field(
         ) from None
 
 
+def copy_model_field(field: ModelField, *, name: str) -> ModelField:
+    # A shallow copy shares the already built TypeAdapter (validator and
+    # serializer), only the name (used e.g. for the OpenAPI title) is changed
+    new_field = copy(field)
+    new_field.name = name
+    return new_field
+
+
+class ContentTypeInfo(NamedTuple):
+    # The lowercase media type without parameters, e.g. "application/json"
+    media_type: str
+    # application/json or application/*+json
+    is_json: bool
+    # application/x-www-form-urlencoded
+    is_form: bool
+    # multipart/form-data
+    is_multipart: bool
+
+
+# Each request with a body checks its content type, and an app receives only a few
+# different values, parse each one once. Bounded, as the values come from clients
+@lru_cache(maxsize=256)
+def get_content_type_info(content_type: str) -> ContentTypeInfo:
+    # Same as email.message.Message().get_content_type(), an invalid media type
+    # is handled as "text/plain"
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type.count("/") != 1:
+        media_type = "text/plain"
+    maintype, _, subtype = media_type.partition("/")
+    return ContentTypeInfo(
+        media_type=media_type,
+        is_json=maintype == "application"
+        and (subtype == "json" or subtype.endswith("+json")),
+        is_form=media_type == "application/x-www-form-urlencoded",
+        is_multipart=media_type == "multipart/form-data",
+    )
+
+
+def _get_accept_quality(media_type: str, accepted: list[tuple[str, float]]) -> float:
+    # The quality of the most specific media range that matches the media type
+    maintype = media_type.partition("/")[0]
+    best_specificity = -1
+    quality = 0.0
+    for media_range, range_quality in accepted:
+        if media_range == media_type:
+            specificity = 2
+        elif media_range == f"{maintype}/*":
+            specificity = 1
+        elif media_range == "*/*":
+            specificity = 0
+        else:
+            continue
+        if specificity > best_specificity:
+            best_specificity = specificity
+            quality = range_quality
+    return quality
+
+
+# Same as get_content_type_info(), the Accept header of a client doesn't change
+# between requests, negotiate each one once
+@lru_cache(maxsize=256)
+def get_accepted_media_type(accept: str, media_types: tuple[str, ...]) -> str | None:
+    """
+    Return the media type in `media_types` preferred by the `Accept` header, the
+    first one wins between media types with the same quality. `None` when none of
+    them is accepted.
+    """
+    accepted: list[tuple[str, float]] = []
+    for media_range in accept.split(","):
+        media_range, _, parameters = media_range.partition(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+                break
+        accepted.append((media_range, quality))
+    if not accepted:
+        return media_types[0] if media_types else None
+    best_media_type = None
+    best_quality = 0.0
+    for media_type in media_types:
+        quality = _get_accept_quality(media_type, accepted)
+        if quality > best_quality:
+            best_media_type = media_type
+            best_quality = quality
+    return best_media_type
+
+
 def generate_operation_id_for_path(
     *, name: str, path: str, method: str
 ) -> str:  # pragma: nocover
@@ -0,0 +1,25 @@
+import sys
+
+import pytest
+from fastapi.utils import get_content_type_info
+
+if "--codspeed" not in sys.argv:
+    pytest.skip(
+        "Benchmark tests are skipped by default; run with --codspeed.",
+        allow_module_level=True,
+    )
+
+CONTENT_TYPES = [
+    "application/json",
+    "application/json; charset=utf-8",
+    "application/vnd.api+json",
+    "multipart/form-data; boundary=----WebKitFormBoundary7MA4YWxkTrZu0gW",
+    "text/plain",
+]
+
+
+def test_content_type_info(benchmark) -> None:
+    def classify() -> list[bool]:
+        return [get_content_type_info(value).is_json for value in CONTENT_TYPES]
+
+    assert benchmark(classify) == [True, True, True, False, False]
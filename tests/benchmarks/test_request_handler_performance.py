@@ -0,0 +1,77 @@
+import sys
+from collections.abc import Iterator
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+if "--codspeed" not in sys.argv:
+    pytest.skip(
+        "Benchmark tests are skipped by default; run with --codspeed.",
+        allow_module_level=True,
+    )
+
+
+class ItemIn(BaseModel):
+    name: str
+    value: int
+
+
+class ItemOut(BaseModel):
+    name: str
+    value: int
+    dep: int
+
+
+def get_dep() -> int:
+    return 42
+
+
+def create_app(specialized_handlers: bool) -> FastAPI:
+    app = FastAPI(specialized_handlers=specialized_handlers)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    @app.get("/validated/{item_id}", response_model=ItemOut)
+    async def read_validated(item_id: int, dep: Annotated[int, Depends(get_dep)]):
+        return {"name": "foo", "value": item_id, "dep": dep}
+
+    @app.post("/items/", response_model=ItemOut)
+    async def create_item(item: ItemIn, dep: Annotated[int, Depends(get_dep)]):
+        return ItemOut(name=item.name, value=item.value, dep=dep)
+
+    return app
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["generic", "specialized"])
+def client(request: pytest.FixtureRequest) -> Iterator[TestClient]:
+    with TestClient(create_app(specialized_handlers=request.param)) as client:
+        yield client
+
+
+def test_get_without_body(benchmark, client: TestClient) -> None:
+    def do_request() -> tuple[int, bytes]:
+        response = client.get("/items/3")
+        return response.status_code, response.content
+
+    assert benchmark(do_request) == (200, b'{"item_id":3}')
+
+
+def test_get_with_response_model(benchmark, client: TestClient) -> None:
+    def do_request() -> tuple[int, bytes]:
+        response = client.get("/validated/3")
+        return response.status_code, response.content
+
+    assert benchmark(do_request) == (200, b'{"name":"foo","value":3,"dep":42}')
+
+
+def test_post_json_body(benchmark, client: TestClient) -> None:
+    def do_request() -> tuple[int, bytes]:
+        response = client.post("/items/", json={"name": "foo", "value": 5})
+        return response.status_code, response.content
+
+    assert benchmark(do_request) == (200, b'{"name":"foo","value":5,"dep":42}')
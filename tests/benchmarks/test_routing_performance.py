@@ -0,0 +1,86 @@
+import sys
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+if "--codspeed" not in sys.argv:
+    pytest.skip(
+        "Benchmark tests are skipped by default; run with --codspeed.",
+        allow_module_level=True,
+    )
+
+ROUTE_COUNTS = [10, 100, 1000, 2000]
+
+
+def create_app(route_count: int, radix_routing: bool) -> FastAPI:
+    app = FastAPI(radix_routing=radix_routing)
+    for i in range(route_count):
+        if i % 2:
+
+            async def read_resource() -> dict[str, str]:
+                return {"kind": "static"}
+
+            app.add_api_route(f"/v1/resource-{i}/search", read_resource)
+        else:
+
+            async def read_resource_item(item_id: int) -> dict[str, int]:
+                return {"item_id": item_id}
+
+            app.add_api_route(f"/v1/resource-{i}/items/{{item_id}}", read_resource_item)
+    return app
+
+
+@pytest.fixture(scope="module", params=ROUTE_COUNTS)
+def route_count(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["linear", "radix"])
+def client(request: pytest.FixtureRequest, route_count: int) -> Iterator[TestClient]:
+    app = create_app(route_count, radix_routing=request.param)
+    with TestClient(app) as client:
+        yield client
+
+
+def _bench_get(benchmark, client: TestClient, path: str) -> tuple[int, bytes]:
+    warmup = client.get(path)
+    assert warmup.status_code == 200
+
+    def do_request() -> tuple[int, bytes]:
+        response = client.get(path)
+        return response.status_code, response.content
+
+    return benchmark(do_request)
+
+
+def test_first_route_lookup(benchmark, client: TestClient) -> None:
+    status_code, body = _bench_get(benchmark, client, "/v1/resource-0/items/42")
+    assert status_code == 200
+    assert body == b'{"item_id":42}'
+
+
+def test_last_static_route_lookup(
+    benchmark, client: TestClient, route_count: int
+) -> None:
+    path = f"/v1/resource-{route_count - 1}/search"
+    status_code, body = _bench_get(benchmark, client, path)
+    assert status_code == 200
+    assert body == b'{"kind":"static"}'
+
+
+def test_last_param_route_lookup(
+    benchmark, client: TestClient, route_count: int
+) -> None:
+    path = f"/v1/resource-{route_count - 2}/items/42"
+    status_code, body = _bench_get(benchmark, client, path)
+    assert status_code == 200
+    assert body == b'{"item_id":42}'
+
+
+def test_not_found_lookup(benchmark, client: TestClient) -> None:
+    def do_request() -> int:
+        return client.get("/v1/missing/items/42").status_code
+
+    assert benchmark(do_request) == 404
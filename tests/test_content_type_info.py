@@ -0,0 +1,99 @@
+import email.message
+from typing import Annotated
+
+import pytest
+from fastapi import FastAPI, Form
+from fastapi.testclient import TestClient
+from fastapi.utils import ContentTypeInfo, get_content_type_info
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [
+        "application/json",
+        "Application/JSON",
+        " application/json ; charset=utf-8",
+        "application/vnd.api+json",
+        "application/geo+json-seq",
+        "application/jsonx",
+        "application/json/extra",
+        "application",
+        "text/plain",
+        "text/json",
+        "application/x-www-form-urlencoded",
+        "multipart/form-data; boundary=something",
+        ";application/json",
+    ],
+)
+def test_same_as_email_message(content_type: str):
+    message = email.message.Message()
+    message["content-type"] = content_type
+    info = get_content_type_info(content_type)
+    assert info.media_type == message.get_content_type()
+    subtype = message.get_content_subtype()
+    assert info.is_json == (
+        message.get_content_maintype() == "application"
+        and (subtype == "json" or subtype.endswith("+json"))
+    )
+
+
+def test_content_type_info():
+    assert get_content_type_info(
+        'application/json; boundary=x; Charset="UTF-8"'
+    ) == ContentTypeInfo(
+        media_type="application/json",
+        is_json=True,
+        is_form=False,
+        is_multipart=False,
+    )
+    assert get_content_type_info(
+        "application/x-www-form-urlencoded"
+    ) == ContentTypeInfo(
+        media_type="application/x-www-form-urlencoded",
+        is_json=False,
+        is_form=True,
+        is_multipart=False,
+    )
+    assert get_content_type_info(
+        "multipart/form-data; boundary=something"
+    ) == ContentTypeInfo(
+        media_type="multipart/form-data",
+        is_json=False,
+        is_form=False,
+        is_multipart=True,
+    )
+    assert get_content_type_info("multipart/mixed").is_multipart is False
+
+
+app = FastAPI()
+
+
+@app.post("/login/")
+def login(username: Annotated[str, Form()]):
+    return {"username": username}
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [
+        "application/x-www-form-urlencoded",
+        "application/x-www-form-urlencoded; charset=utf-8",
+    ],
+)
+def test_form_content_type(content_type: str):
+    response = client.post(
+        "/login/", content=b"username=foo", headers={"content-type": content_type}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"username": "foo"}
+
+
+@pytest.mark.parametrize("content_type", [None, "application/json", "text/plain"])
+def test_form_other_content_type(content_type: str | None):
+    headers = {"content-type": content_type} if content_type else {}
+    response = client.post("/login/", content=b"username=foo", headers=headers)
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", "username"]
@@ -0,0 +1,300 @@
+from typing import Annotated, Any
+
+import anyio
+import httpx
+import pytest
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    Request,
+    Response,
+    WebSocket,
+)
+from fastapi.exceptions import DependencyScopeError, FastAPIError
+from fastapi.security import SecurityScopes
+from fastapi.testclient import TestClient
+
+
+def test_app_scope_called_once():
+    calls: list[str] = []
+
+    def get_settings():
+        calls.append("settings")
+        return {"name": "app"}
+
+    async def get_client(
+        settings: Annotated[dict[str, str], Depends(get_settings, scope="app")],
+    ):
+        calls.append("client")
+        return f"client for {settings['name']}"
+
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root(
+        client: Annotated[str, Depends(get_client, scope="app")],
+        settings: Annotated[dict[str, str], Depends(get_settings, scope="app")],
+    ):
+        return {"client": client, "settings": settings}
+
+    @app.get("/other")
+    async def read_other(client: Annotated[str, Depends(get_client, scope="app")]):
+        return client
+
+    client = TestClient(app)
+    response = client.get("/")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"client": "client for app", "settings": {"name": "app"}}
+    assert client.get("/").json() == response.json()
+    assert client.get("/other").json() == "client for app"
+    assert calls == ["settings", "client"]
+
+
+def test_app_scope_yield_closed_on_shutdown():
+    state: dict[str, Any] = {"opened": 0, "closed": 0}
+
+    def get_pool():
+        state["opened"] += 1
+        yield "pool"
+        state["closed"] += 1
+
+    router = APIRouter()
+
+    @router.get("/")
+    def read_root(pool: Annotated[str, Depends(get_pool, scope="app")]):
+        assert state["closed"] == state["opened"] - 1
+        return pool
+
+    @router.websocket("/ws")
+    async def websocket_endpoint(
+        websocket: WebSocket, pool: Annotated[str, Depends(get_pool, scope="app")]
+    ):
+        await websocket.accept()
+        await websocket.send_text(pool)
+        await websocket.close()
+
+    app = FastAPI()
+    app.include_router(router)
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == "pool"
+        assert client.get("/").json() == "pool"
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_text() == "pool"
+        assert state == {"opened": 1, "closed": 0}
+    assert state == {"opened": 1, "closed": 1}
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == "pool"
+    assert state == {"opened": 2, "closed": 2}
+
+
+def test_app_scope_yield_closed_after_lifespan():
+    events: list[str] = []
+
+    async def get_pool():
+        events.append("open pool")
+        yield "pool"
+        events.append("close pool")
+
+    async def lifespan(app: FastAPI):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/")
+    async def read_root(pool: Annotated[str, Depends(get_pool, scope="app")]):
+        return pool
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == "pool"
+    assert events == ["startup", "open pool", "shutdown", "close pool"]
+
+
+def test_app_scope_yield_requires_lifespan():
+    def get_pool():
+        yield "pool"  # pragma: no cover
+
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root(pool: Annotated[str, Depends(get_pool, scope="app")]):
+        return pool  # pragma: no cover
+
+    client = TestClient(app)
+    with pytest.raises(FastAPIError, match="lifespan"):
+        client.get("/")
+
+
+def test_app_scope_with_overrides():
+    def get_settings():
+        return "settings"
+
+    def get_test_settings():
+        return "test settings"
+
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root(settings: Annotated[str, Depends(get_settings, scope="app")]):
+        return settings
+
+    client = TestClient(app)
+    assert client.get("/").json() == "settings"
+    app.dependency_overrides[get_settings] = get_test_settings
+    assert client.get("/").json() == "test settings"
+    app.dependency_overrides.clear()
+    assert client.get("/").json() == "settings"
+
+
+def test_app_scope_cannot_depend_on_request_scope():
+    def get_token():
+        pass  # pragma: no cover
+
+    def get_client(token: Annotated[str, Depends(get_token)]):
+        pass  # pragma: no cover
+
+    app = FastAPI()
+
+    with pytest.raises(DependencyScopeError) as exc_info:
+
+        @app.get("/")
+        def read_root(client: Annotated[str, Depends(get_client, scope="app")]):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == (
+        'The dependency "get_client" has a scope of "app", it can only depend on '
+        'dependencies with scope "app".'
+    )
+
+
+def test_app_scope_concurrent_requests():
+    calls: list[str] = []
+
+    async def get_client():
+        calls.append("client")
+        await anyio.sleep(0.01)
+        return "client"
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def read_root(client: Annotated[str, Depends(get_client, scope="app")]):
+        return client
+
+    async def main() -> list[str]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            results: list[str] = []
+
+            async def get() -> None:
+                results.append((await ac.get("/")).json())
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(get)
+        return results
+
+    assert anyio.run(main) == ["client"] * 3
+    assert calls == ["client"]
+
+
+def test_app_scope_concurrent_requests_first_fails():
+    calls: list[str] = []
+
+    async def get_client():
+        calls.append("client")
+        await anyio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError("Connection failed")
+        return "client"
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def read_root(client: Annotated[str, Depends(get_client, scope="app")]):
+        return client
+
+    async def main() -> list[int]:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            status_codes: list[int] = []
+
+            async def get() -> None:
+                status_codes.append((await ac.get("/")).status_code)
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(4):
+                    tg.start_soon(get)
+        return status_codes
+
+    # The next request calls it again, the others wait for it
+    assert sorted(anyio.run(main)) == [200, 200, 200, 500]
+    assert calls == ["client", "client"]
+
+
+def get_user_from_header(x_token: Annotated[str, Header()]):
+    pass  # pragma: no cover
+
+
+def get_user_from_query(token: str):
+    pass  # pragma: no cover
+
+
+def get_user_from_request(request: Request):
+    pass  # pragma: no cover
+
+
+def get_user_with_response(response: Response, background_tasks: BackgroundTasks):
+    pass  # pragma: no cover
+
+
+def get_user_with_scopes(security_scopes: SecurityScopes):
+    pass  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    "dependency,names",
+    [
+        (get_user_from_header, "x_token"),
+        (get_user_from_query, "token"),
+        (get_user_from_request, "request"),
+        (get_user_with_response, "response, background_tasks"),
+        (get_user_with_scopes, "security_scopes"),
+    ],
+)
+def test_app_scope_cannot_use_request_values(dependency, names: str):
+    app = FastAPI()
+
+    with pytest.raises(DependencyScopeError) as exc_info:
+
+        @app.get("/")
+        def read_root(user: Annotated[str, Depends(dependency, scope="app")]):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == (
+        f'The dependency "{dependency.__name__}" has a scope of "app", it cannot '
+        "use values from the request, as its value is shared by all the requests: "
+        f"{names}."
+    )
+
+
+def test_app_scope_sub_dependency_cannot_use_request_values():
+    def get_token(x_token: Annotated[str, Header()]):
+        pass  # pragma: no cover
+
+    def get_current_user(token: Annotated[str, Depends(get_token, scope="app")]):
+        pass  # pragma: no cover
+
+    app = FastAPI()
+
+    with pytest.raises(DependencyScopeError, match='"get_token"'):
+
+        @app.get("/")
+        def read_root(user: Annotated[str, Depends(get_current_user, scope="app")]):
+            pass  # pragma: no cover
@@ -0,0 +1,328 @@
+from typing import Annotated
+
+import anyio
+import pytest
+from fastapi import Depends, FastAPI, Header, Request, Security
+from fastapi.cache import CacheInfo, TTLCache
+from fastapi.exceptions import FastAPIError
+from fastapi.security import SecurityScopes
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_lru_and_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" was the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    timer.now = 10
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_single_flight():
+    cache = TTLCache()
+    calls: list[str] = []
+
+    async def create() -> str:
+        calls.append("create")
+        await anyio.sleep(0.01)
+        return "value"
+
+    async def main() -> list[str]:
+        results: list[str] = []
+
+        async def get() -> None:
+            results.append(await cache.get_or_call("key", create))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(get)
+        return results
+
+    assert anyio.run(main) == ["value"] * 5
+    assert calls == ["create"]
+    assert cache.cache_info() == CacheInfo(hits=4, misses=1, maxsize=128, currsize=1)
+
+
+def test_ttl_cache_single_flight_error():
+    cache = TTLCache()
+    calls: list[str] = []
+
+    async def create() -> str:
+        calls.append("create")
+        await anyio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError("Failed")
+        return "value"
+
+    async def main() -> list[str]:
+        results: list[str] = []
+
+        async def get() -> None:
+            try:
+                results.append(await cache.get_or_call("key", create))
+            except ValueError as e:
+                results.append(str(e))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(get)
+        return results
+
+    assert sorted(anyio.run(main)) == ["Failed", "value", "value"]
+    assert calls == ["create", "create"]
+
+
+tenant_cache = TTLCache(maxsize=10, ttl=60)
+calls: list[str] = []
+
+
+def get_tenant_config(x_tenant: Annotated[str, Header()]):
+    calls.append(x_tenant)
+    return {"tenant": x_tenant}
+
+
+async def get_permissions(
+    config: Annotated[dict[str, str], Depends(get_tenant_config, cache=tenant_cache)],
+    token: Annotated[str, Header()],
+):
+    calls.append(token)
+    return [config["tenant"], token]
+
+
+class Item(BaseModel):
+    name: str
+
+
+def get_item_name(item: Item):
+    calls.append(item.name)
+    return item.name
+
+
+def get_scoped_tenant(
+    security_scopes: SecurityScopes, x_tenant: Annotated[str, Header()]
+):
+    calls.append(x_tenant)
+    return [x_tenant, *security_scopes.scopes]
+
+
+def get_read_tenant(
+    tenant: Annotated[list[str], Depends(get_scoped_tenant, cache=tenant_cache)],
+):
+    return tenant
+
+
+app = FastAPI()
+
+
+@app.get("/config")
+def read_config(
+    config: Annotated[dict[str, str], Depends(get_tenant_config, cache=tenant_cache)],
+):
+    return config
+
+
+@app.get("/permissions")
+def read_permissions(
+    permissions: Annotated[
+        list[str], Depends(get_permissions, cache=tenant_cache, parallel=True)
+    ],
+):
+    return permissions
+
+
+@app.post("/items")
+def create_item(name: Annotated[str, Depends(get_item_name, cache=tenant_cache)]):
+    return name
+
+
+@app.get("/scoped")
+def read_scoped(
+    tenant: Annotated[list[str], Security(get_read_tenant, scopes=["read"])],
+):
+    return tenant
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    tenant_cache.clear()
+    calls.clear()
+
+
+def test_cached_by_resolved_inputs():
+    assert client.get("/config", headers={"x-tenant": "a"}).json() == {"tenant": "a"}
+    assert client.get("/config", headers={"x-tenant": "a"}).json() == {"tenant": "a"}
+    assert client.get("/config", headers={"x-tenant": "b"}).json() == {"tenant": "b"}
+    assert calls == ["a", "b"]
+    assert tenant_cache.cache_info() == CacheInfo(
+        hits=1, misses=2, maxsize=10, currsize=2
+    )
+
+
+def test_cached_sub_dependencies():
+    headers = {"x-tenant": "a", "token": "t1"}
+    response = client.get("/permissions", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == ["a", "t1"]
+    response = client.get("/permissions", headers=headers)
+    assert response.json() == ["a", "t1"]
+    response = client.get("/permissions", headers={"x-tenant": "a", "token": "t2"})
+    assert response.json() == ["a", "t2"]
+    assert calls == ["a", "t1", "t2"]
+
+
+def test_cached_with_security_scopes():
+    for _ in range(2):
+        response = client.get("/scoped", headers={"x-tenant": "a"})
+        assert response.status_code == 200, response.text
+        assert response.json() == ["a", "read"]
+    assert calls == ["a"]
+    assert tenant_cache.cache_info().hits == 1
+
+
+def test_not_hashable_inputs():
+    for _ in range(2):
+        response = client.post("/items", json={"name": "foo"})
+        assert response.status_code == 200, response.text
+        assert response.json() == "foo"
+    assert calls == ["foo", "foo"]
+    assert tenant_cache.cache_info().currsize == 0
+
+
+def test_cached_validation_error():
+    response = client.get("/config")
+    assert response.status_code == 422, response.text
+    assert calls == []
+    assert tenant_cache.cache_info().misses == 0
+
+
+def test_cache_overridden():
+    app.dependency_overrides[get_tenant_config] = lambda: {"tenant": "override"}
+    try:
+        for _ in range(2):
+            response = client.get("/permissions", headers={"token": "t1"})
+            assert response.json() == ["override", "t1"]
+    finally:
+        app.dependency_overrides.clear()
+    assert calls == ["t1"]
+
+
+def test_cache_with_yield():
+    def get_db():
+        yield "db"  # pragma: no cover
+
+    new_app = FastAPI()
+
+    with pytest.raises(FastAPIError) as exc_info:
+
+        @new_app.get("/")
+        def read_root(db: Annotated[str, Depends(get_db, cache=TTLCache())]):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == (
+        'The dependency "get_db" uses yield, it cannot have a cache.'
+    )
+
+
+def test_cache_with_request():
+    def get_client_host(request: Request):
+        return request.client  # pragma: no cover
+
+    new_app = FastAPI()
+
+    with pytest.raises(FastAPIError) as exc_info:
+
+        @new_app.get("/")
+        def read_root(
+            host: Annotated[str, Depends(get_client_host, cache=TTLCache())],
+        ):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == (
+        'The dependency "get_client_host" has a cache, it cannot use the objects '
+        "created for each request, as its value is stored for the values of its "
+        "inputs: request."
+    )
+
+
+def test_cache_with_request_sub_dependency():
+    class Session:
+        pass
+
+    def get_session():
+        # A new object for each request
+        return Session()  # pragma: no cover
+
+    def get_settings(session: Annotated[Session, Depends(get_session)]):
+        return {"session": id(session)}  # pragma: no cover
+
+    new_app = FastAPI()
+
+    with pytest.raises(FastAPIError) as exc_info:
+
+        @new_app.get("/")
+        def read_root(
+            settings: Annotated[dict, Depends(get_settings, cache=TTLCache())],
+        ):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == (
+        'The dependency "get_settings" has a cache, its sub-dependencies need a '
+        'cache or a scope of "app" too, as its value is stored for the values of '
+        "its inputs: get_session."
+    )
+
+
+def test_cache_with_app_scope_sub_dependency():
+    app_calls: list[str] = []
+
+    class Client:
+        pass
+
+    def get_client():
+        app_calls.append("client")
+        return Client()
+
+    def get_settings(
+        client: Annotated[Client, Depends(get_client, scope="app")],
+        x_tenant: Annotated[str, Header()],
+    ):
+        app_calls.append(x_tenant)
+        return {"tenant": x_tenant}
+
+    cache = TTLCache()
+    new_app = FastAPI()
+
+    @new_app.get("/")
+    def read_root(
+        settings: Annotated[dict, Depends(get_settings, cache=cache)],
+    ):
+        return settings
+
+    with TestClient(new_app) as new_client:
+        for _ in range(3):
+            response = new_client.get("/", headers={"x-tenant": "a"})
+            assert response.json() == {"tenant": "a"}
+    assert app_calls == ["client", "a"]
+    assert cache.cache_info().hits == 2
@@ -0,0 +1,106 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, Security
+from fastapi.dependencies import utils
+from fastapi.testclient import TestClient
+
+
+def get_db():
+    return "db"
+
+
+def get_user(db: Annotated[str, Depends(get_db)]):
+    return f"user from {db}"
+
+
+def get_scoped(user: Annotated[str, Security(get_user, scopes=["me"])]):
+    return user
+
+
+app = FastAPI()
+
+
+@app.get("/users/me")
+def read_me(user: Annotated[str, Depends(get_user)]):
+    return user
+
+
+@app.get("/users/{user_id}/items")
+def read_items(user_id: int, user: Annotated[str, Depends(get_scoped)]):
+    return {"user_id": user_id, "user": user}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def get_dependant_calls(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    calls: list[object] = []
+    original_get_dependant = utils.get_dependant
+
+    def get_dependant(**kwargs):
+        calls.append(kwargs["call"])
+        return original_get_dependant(**kwargs)
+
+    monkeypatch.setattr(utils, "get_dependant", get_dependant)
+    yield calls
+    app.dependency_overrides.clear()
+
+
+def test_overridden_dependants_are_cached(get_dependant_calls: list[object]):
+    def override_db():
+        return "test db"
+
+    app.dependency_overrides[get_db] = override_db
+    for _ in range(3):
+        response = client.get("/users/me")
+        assert response.status_code == 200, response.text
+        assert response.json() == "user from test db"
+    # get_user (and its sub-dependency get_db) and override_db, only once
+    assert get_dependant_calls == [get_user, get_db, override_db]
+
+
+def test_cache_invalidated_when_overrides_change(get_dependant_calls: list[object]):
+    app.dependency_overrides[get_db] = lambda: "first db"
+    assert client.get("/users/me").json() == "user from first db"
+    app.dependency_overrides[get_db] = lambda: "second db"
+    assert client.get("/users/me").json() == "user from second db"
+    app.dependency_overrides[get_user] = lambda: "overridden user"
+    assert client.get("/users/me").json() == "overridden user"
+    del app.dependency_overrides[get_user]
+    assert client.get("/users/me").json() == "user from second db"
+    # Each change creates the dependants again: 3 + 3 + 1 + 3
+    assert len(get_dependant_calls) == 10
+
+
+def test_cached_per_path_and_scopes():
+    app.dependency_overrides[get_db] = lambda: "test db"
+    try:
+        response = client.get("/users/3/items")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"user_id": 3, "user": "user from test db"}
+        assert client.get("/users/me").json() == "user from test db"
+        response = client.get("/users/4/items")
+        assert response.json() == {"user_id": 4, "user": "user from test db"}
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_provider_without_weakref():
+    class Provider:
+        __slots__ = ("dependency_overrides",)
+
+        def __init__(self) -> None:
+            self.dependency_overrides = {get_db: lambda: "slots db"}
+
+    route = next(route for route in app.routes if route.path == "/users/me")
+    sub_dependant = route.dependant.dependencies[0]
+    provider = Provider()
+    dependant = utils.get_overridden_dependant(
+        dependency_overrides_provider=provider, dependant=sub_dependant
+    )
+    assert dependant.call is get_user
+    assert dependant is not utils.get_overridden_dependant(
+        dependency_overrides_provider=provider, dependant=sub_dependant
+    )
@@ -0,0 +1,243 @@
+from typing import Annotated
+
+import anyio
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.dependencies.utils import get_dependency_plan
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+events: list[str] = []
+
+
+class Rendezvous:
+    def __init__(self) -> None:
+        self.user = anyio.Event()
+        self.flags = anyio.Event()
+
+
+rendezvous = Rendezvous()
+
+
+async def get_connection():
+    events.append("connection")
+    await anyio.sleep(0)
+    return "connection"
+
+
+async def get_user(connection: Annotated[str, Depends(get_connection)]):
+    # Only finishes if get_flags runs at the same time
+    rendezvous.user.set()
+    with anyio.fail_after(1):
+        await rendezvous.flags.wait()
+    return "user"
+
+
+async def get_flags(connection: Annotated[str, Depends(get_connection)]):
+    rendezvous.flags.set()
+    with anyio.fail_after(1):
+        await rendezvous.user.wait()
+    return ["flag"]
+
+
+async def get_first_resource():
+    events.append("first start")
+    yield "first"
+    events.append("first end")
+
+
+async def get_second_resource():
+    events.append("second start")
+    await anyio.sleep(0.01)
+    yield "second"
+    events.append("second end")
+
+
+async def get_closed_resource():
+    events.append("closed start")
+    try:
+        yield "closed"
+    finally:
+        events.append("closed end")
+
+
+def get_query_a(a: int):
+    return a  # pragma: no cover
+
+
+def get_query_b(b: int):
+    return b  # pragma: no cover
+
+
+async def get_timed_resource():
+    # Holds a cancel scope across yield, it has to be exited in the same task
+    with anyio.fail_after(10):
+        events.append("timed start")
+        try:
+            yield "timed"
+        except HTTPException:
+            events.append("timed handled")
+            raise
+        events.append("timed end")
+
+
+async def get_grouped_resource():
+    async with anyio.create_task_group():
+        events.append("grouped start")
+        yield "grouped"
+        events.append("grouped end")
+
+
+async def get_forbidden():
+    await anyio.sleep(0)
+    raise HTTPException(status_code=403, detail="Forbidden")
+
+
+app = FastAPI()
+
+
+@app.get("/me")
+async def read_me(
+    user: Annotated[str, Depends(get_user, parallel=True)],
+    flags: Annotated[list[str], Depends(get_flags, parallel=True)],
+):
+    return {"user": user, "flags": flags}
+
+
+@app.get("/resources")
+async def read_resources(
+    first: Annotated[str, Depends(get_first_resource, parallel=True)],
+    second: Annotated[str, Depends(get_second_resource, parallel=True)],
+):
+    events.append("endpoint")
+    return [first, second]
+
+
+@app.get("/scoped")
+async def read_scoped(
+    timed: Annotated[str, Depends(get_timed_resource, parallel=True)],
+    grouped: Annotated[str, Depends(get_grouped_resource, parallel=True)],
+):
+    events.append("endpoint")
+    return [timed, grouped]
+
+
+@app.get("/scoped-teapot")
+async def read_scoped_teapot(
+    timed: Annotated[str, Depends(get_timed_resource, parallel=True)],
+    closed: Annotated[str, Depends(get_closed_resource, parallel=True)],
+):
+    raise HTTPException(status_code=418, detail="Teapot")
+
+
+@app.get("/errors")
+def read_errors(
+    a: Annotated[int, Depends(get_query_a, parallel=True)],
+    b: Annotated[int, Depends(get_query_b, parallel=True)],
+    c: int,
+):
+    return [a, b, c]  # pragma: no cover
+
+
+@app.get(
+    "/forbidden",
+    dependencies=[
+        Depends(get_forbidden, parallel=True),
+        Depends(get_closed_resource, parallel=True),
+    ],
+)
+def read_forbidden():
+    return "never"  # pragma: no cover
+
+
+async def get_profile(
+    user: Annotated[str, Depends(get_user, parallel=True)],
+    flags: Annotated[list[str], Depends(get_flags, parallel=True)],
+):
+    return {"user": user, "flags": flags}
+
+
+@app.get("/nested")
+async def read_nested(
+    profile: Annotated[dict, Depends(get_profile, parallel=True)],
+    resource: Annotated[str, Depends(get_first_resource, parallel=True)],
+):
+    return {"profile": profile, "resource": resource}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    global rendezvous
+    events.clear()
+    rendezvous = Rendezvous()
+
+
+def test_concurrent_dependencies_with_shared_cache():
+    response = client.get("/me")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"user": "user", "flags": ["flag"]}
+    assert events == ["connection"]
+
+
+def test_exit_order():
+    response = client.get("/resources")
+    assert response.status_code == 200, response.text
+    assert response.json() == ["first", "second"]
+    assert events[-3:] == ["endpoint", "second end", "first end"]
+
+
+def test_exit_in_the_task_that_entered():
+    response = client.get("/scoped")
+    assert response.status_code == 200, response.text
+    assert response.json() == ["timed", "grouped"]
+    assert events[-3:] == ["endpoint", "grouped end", "timed end"]
+
+
+def test_exception_raised_in_dependency():
+    response = client.get("/scoped-teapot")
+    assert response.status_code == 418, response.text
+    assert response.json() == {"detail": "Teapot"}
+    assert events[-2:] == ["closed end", "timed handled"]
+
+
+def test_errors_in_declaration_order():
+    response = client.get("/errors")
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "a"],
+        ["query", "b"],
+        ["query", "c"],
+    ]
+
+
+def test_exception_is_raised():
+    response = client.get("/forbidden")
+    assert response.status_code == 403, response.text
+    assert response.json() == {"detail": "Forbidden"}
+    # The other dependency finished, and was closed
+    assert events == ["closed start", "closed end"]
+
+
+def test_nested_groups():
+    response = client.get("/nested")
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "profile": {"user": "user", "flags": ["flag"]},
+        "resource": "first",
+    }
+    routes = {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+    plan = get_dependency_plan(routes["/nested"].dependant)
+    assert plan.parallel_groups == {
+        0: [[(0, 4), (5, 5)], [(0, 1), (2, 3)]],
+    }
+
+
+def test_plan_parallel_groups():
+    routes = {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+    plan = get_dependency_plan(routes["/me"].dependant)
+    assert plan.parallel_groups == {0: [[(0, 1), (2, 3)]]}
+    plan = get_dependency_plan(routes["/errors"].dependant)
+    assert plan.parallel_groups == {0: [[(0, 0), (1, 1)]]}
@@ -0,0 +1,134 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, Header, Query
+from fastapi.dependencies.utils import RequestParamsExtractor, request_params_to_args
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.datastructures import Headers, QueryParams
+
+
+class FilterParams(BaseModel):
+    limit: int = 10
+    tags: list[str] = []
+
+
+class CommonHeaders(BaseModel):
+    x_token: str
+    user_agent: str | None = None
+
+
+def get_common(
+    tags: Annotated[list[str], Query()] = [],  # noqa: B006
+    x_request_id: Annotated[str | None, Header()] = None,
+):
+    # Mutating the default must not change it for the next requests
+    tags.append("common")
+    return {"tags": tags, "x_request_id": x_request_id}
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def read_items(
+    item_id: int,
+    common: Annotated[dict, Depends(get_common)],
+    q: str | None = None,
+    extra: Annotated[dict[str, str], Query()] = {},  # noqa: B006
+):
+    return {"item_id": item_id, "q": q, "common": common, "extra": extra}
+
+
+@app.get("/filter")
+def read_filter(filters: Annotated[FilterParams, Query()]):
+    return filters
+
+
+@app.get("/headers")
+def read_headers(headers: Annotated[CommonHeaders, Header()]):
+    return headers
+
+
+@app.get("/raw-headers")
+def read_raw_headers(
+    headers: Annotated[CommonHeaders, Header(convert_underscores=False)],
+):
+    return headers
+
+
+client = TestClient(app)
+
+
+def test_params_from_each_source():
+    for _ in range(2):
+        response = client.get(
+            "/items/3?q=foo&tags=a&tags=b", headers={"x-request-id": "r1"}
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == {
+            "item_id": 3,
+            "q": "foo",
+            "common": {"tags": ["a", "b", "common"], "x_request_id": "r1"},
+            # Without the values of the other query parameters
+            "extra": {"tags": "b"},
+        }
+
+
+def test_defaults_copied_for_each_request():
+    for _ in range(2):
+        response = client.get("/items/3")
+        assert response.status_code == 200, response.text
+        assert response.json()["common"] == {"tags": ["common"], "x_request_id": None}
+
+
+def test_params_errors():
+    response = client.get("/items/foo")
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["path", "item_id"]
+    ]
+
+
+def test_query_model():
+    response = client.get("/filter?limit=5&tags=a&tags=b&other=c")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"limit": 5, "tags": ["a", "b"]}
+    response = client.get("/filter?limit=foo")
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["query", "limit"]
+
+
+@pytest.mark.parametrize(
+    "path,headers",
+    [
+        ("/headers", {"x-token": "t", "user-agent": "a"}),
+        ("/raw-headers", {"x_token": "t", "user_agent": "a"}),
+    ],
+)
+def test_header_model(path: str, headers: dict[str, str]):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"x_token": "t", "user_agent": "a"}
+
+
+def test_same_as_request_params_to_args():
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == "/items/{item_id}"
+    )
+    fields = route.dependant.query_params
+    extractor = RequestParamsExtractor(fields)
+    for query_string in ["q=foo&extra=1", "", "q=foo&q=bar&tags=a"]:
+        query_params = QueryParams(query_string)
+        assert extractor.extract(query_params) == request_params_to_args(
+            fields, query_params
+        )
+    header_fields = route.dependant.dependencies[0].header_params
+    headers = Headers({"x-request-id": "r1"})
+    assert RequestParamsExtractor(header_fields).extract(headers) == (
+        {"x_request_id": "r1"},
+        [],
+    )
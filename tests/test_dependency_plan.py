@@ -0,0 +1,130 @@
+from typing import Annotated
+
+from fastapi import BackgroundTasks, Depends, FastAPI, Request, Security
+from fastapi.dependencies.utils import get_dependency_plan
+from fastapi.routing import APIRoute
+from fastapi.security import SecurityScopes
+from fastapi.testclient import TestClient
+
+calls: list[str] = []
+
+
+def get_leaf(q: str):
+    calls.append("leaf")
+    return q
+
+
+def get_uncached(q: str):
+    calls.append("uncached")
+    return f"uncached-{q}"
+
+
+def get_branch(
+    leaf: Annotated[str, Depends(get_leaf)],
+    uncached: Annotated[str, Depends(get_uncached, use_cache=False)],
+):
+    calls.append("branch")
+    return f"{leaf}-{uncached}"
+
+
+def get_tasks(background_tasks: BackgroundTasks, request: Request):
+    return request.url.path
+
+
+def get_scopes(security_scopes: SecurityScopes):
+    return security_scopes.scopes
+
+
+app = FastAPI()
+
+
+@app.get("/branches/", dependencies=[Depends(get_leaf)])
+def read_branches(
+    first: Annotated[str, Depends(get_branch)],
+    second: Annotated[str, Depends(get_branch)],
+    path: Annotated[str, Depends(get_tasks)],
+    scopes: Annotated[list[str], Security(get_scopes, scopes=["items"])],
+):
+    return {"first": first, "second": second, "path": path, "scopes": scopes}
+
+
+@app.get("/missing/")
+def read_missing(
+    first: Annotated[str, Depends(get_branch)],
+    second: Annotated[str, Depends(get_branch)],
+    x: int,
+):
+    return {"first": first, "second": second}  # pragma: no cover
+
+
+client = TestClient(app)
+
+
+def get_route(path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path:
+            return route
+    raise AssertionError(path)  # pragma: no cover
+
+
+def test_plan_order():
+    plan = get_dependency_plan(get_route("/branches/").dependant)
+    assert [step.call for step in plan.steps] == [
+        get_leaf,
+        get_leaf,
+        get_uncached,
+        get_branch,
+        get_leaf,
+        get_uncached,
+        get_branch,
+        get_tasks,
+        get_scopes,
+        read_branches,
+    ]
+    branch_step = plan.steps[3]
+    assert branch_step.first_index == 1
+    assert branch_step.sub_dependencies == [("leaf", 1), ("uncached", 2)]
+    assert branch_step.request_params == []
+    assert [
+        extractor.fields[0].name for extractor, _ in plan.steps[0].request_params
+    ] == ["q"]
+    assert plan.steps[7].has_special_params
+    assert not plan.steps[3].has_special_params
+
+
+def test_cached_and_uncached_calls():
+    calls.clear()
+    response = client.get("/branches/", params={"q": "foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "first": "foo-uncached-foo",
+        "second": "foo-uncached-foo",
+        "path": "/branches/",
+        "scopes": ["items"],
+    }
+    # The second branch is cached, but its uncached sub-dependency is called again
+    assert calls == ["leaf", "uncached", "branch", "uncached"]
+
+
+def test_errors_in_order():
+    calls.clear()
+    response = client.get("/missing/")
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "q"],
+        ["query", "q"],
+        ["query", "q"],
+        ["query", "q"],
+        ["query", "x"],
+    ]
+    assert calls == []
+
+
+def test_overrides_use_solve_dependencies():
+    app.dependency_overrides[get_leaf] = lambda: "override"
+    try:
+        response = client.get("/branches/", params={"q": "foo"})
+        assert response.status_code == 200, response.text
+        assert response.json()["first"] == "override-uncached-foo"
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,133 @@
+from fastapi import APIRouter, Depends, FastAPI, Header
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Message(BaseModel):
+    message: str
+
+
+def get_token(x_token: str = Header()):
+    return x_token
+
+
+def get_included_route(app: FastAPI, path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path:
+            return route
+    raise AssertionError(f"Route {path} not found")  # pragma: no cover
+
+
+def create_router() -> APIRouter:
+    router = APIRouter(dependencies=[Depends(get_token)])
+
+    @router.post(
+        "/items/{item_id}",
+        response_model=Item,
+        responses={404: {"model": Message}},
+    )
+    def create_item(item_id: int, item: Item, q: str | None = None):
+        return item
+
+    return router
+
+
+def test_included_route_reuses_fields():
+    router = create_router()
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    source = router.routes[0]
+    assert isinstance(source, APIRoute)
+    route = get_included_route(app, "/api/items/{item_id}")
+    assert route.response_field is not source.response_field
+    assert route.response_field._type_adapter is source.response_field._type_adapter
+    assert route.response_field.name == "Response_" + route.unique_id
+    assert (
+        route.response_fields[404]._type_adapter
+        is source.response_fields[404]._type_adapter
+    )
+    assert route.dependant is not source.dependant
+    assert route.dependant.path == "/api/items/{item_id}"
+    assert route.dependant.query_params[0] is source.dependant.query_params[0]
+    assert route.dependant.path_params[0] is source.dependant.path_params[0]
+
+
+def test_included_route_with_extra_dependencies():
+    router = create_router()
+    app = FastAPI()
+
+    def get_extra(x_extra: str = Header()):
+        return x_extra
+
+    app.include_router(router, prefix="/api", dependencies=[Depends(get_extra)])
+    route = get_included_route(app, "/api/items/{item_id}")
+    assert [dep.call for dep in route.dependant.dependencies[:2]] == [
+        get_extra,
+        get_token,
+    ]
+    client = TestClient(app)
+    response = client.post(
+        "/api/items/1", json={"name": "foo"}, headers={"x-token": "token"}
+    )
+    assert response.status_code == 422, response.text
+    response = client.post(
+        "/api/items/1",
+        json={"name": "foo"},
+        headers={"x-token": "token", "x-extra": "extra"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo"}
+
+
+def test_included_route_with_new_path_param():
+    router = APIRouter()
+
+    @router.get("/items")
+    def read_items(tenant: str = "default"):
+        return tenant
+
+    app = FastAPI()
+    app.include_router(router, prefix="/{tenant}")
+    source = router.routes[0]
+    assert isinstance(source, APIRoute)
+    route = get_included_route(app, "/{tenant}/items")
+    assert [param.name for param in source.dependant.query_params] == ["tenant"]
+    assert route.dependant.query_params == []
+    assert [param.name for param in route.dependant.path_params] == ["tenant"]
+    client = TestClient(app)
+    response = client.get("/acme/items")
+    assert response.status_code == 200, response.text
+    assert response.json() == "acme"
+
+
+def test_included_route_openapi():
+    router = create_router()
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.include_router(router, prefix="/v2")
+    client = TestClient(app)
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    paths = response.json()["paths"]
+    schemas = response.json()["components"]["schemas"]
+    for prefix in ("api", "v2"):
+        operation = paths[f"/{prefix}/items/{{item_id}}"]["post"]
+        assert operation["operationId"] == (
+            f"create_item_{prefix}_items__item_id__post"
+        )
+        assert [param["name"] for param in operation["parameters"]] == [
+            "item_id",
+            "q",
+            "x-token",
+        ]
+    assert set(schemas) == {"HTTPValidationError", "Item", "Message", "ValidationError"}
+    response = client.post(
+        "/v2/items/1", json={"name": "bar"}, headers={"x-token": "token"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "bar"}
@@ -0,0 +1,212 @@
+import json
+import time
+from collections.abc import AsyncIterable, Iterable
+from typing import Any
+
+import anyio
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import ResponseValidationError
+from fastapi.streaming import JSONLBuffer
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float | None = None
+
+
+app = FastAPI(
+    jsonl_buffer=JSONLBuffer(max_bytes=40, max_delay=None),
+)
+
+
+@app.get("/items")
+async def stream_items() -> AsyncIterable[Item]:
+    for i in range(5):
+        yield Item(name=f"item{i}")
+
+
+@app.get("/sync-items")
+def stream_sync_items() -> Iterable[Item]:
+    for i in range(5):
+        yield Item(name=f"item{i}")
+
+
+@app.get("/no-annotation")
+async def stream_no_annotation():
+    for i in range(3):
+        yield {"name": f"item{i}"}
+
+
+@app.get(
+    "/delayed",
+    jsonl_buffer=JSONLBuffer(max_bytes=1024 * 1024, max_delay=0.05),
+)
+async def stream_delayed() -> AsyncIterable[Item]:
+    yield Item(name="item0")
+    yield Item(name="item1")
+    await anyio.sleep(0.2)
+    yield Item(name="item2")
+
+
+@app.get(
+    "/sync-delayed",
+    jsonl_buffer=JSONLBuffer(max_bytes=1024 * 1024, max_delay=0.05),
+)
+def stream_sync_delayed() -> Iterable[Item]:
+    yield Item(name="item0")
+    time.sleep(0.2)
+    yield Item(name="item1")
+
+
+@app.get(
+    "/batch",
+    jsonl_buffer=JSONLBuffer(max_bytes=0, max_delay=None, batch_size=2),
+)
+async def stream_batch() -> AsyncIterable[Item]:
+    for i in range(5):
+        yield {"name": f"item{i}", "price": i}  # type: ignore[misc]
+
+
+@app.get(
+    "/batch-invalid",
+    jsonl_buffer=JSONLBuffer(max_bytes=0, max_delay=None, batch_size=2),
+)
+async def stream_batch_invalid() -> AsyncIterable[Item]:
+    yield {"name": "item0"}  # type: ignore[misc]
+    yield {"title": "item1"}  # type: ignore[misc]
+
+
+@app.get(
+    "/delayed-invalid",
+    jsonl_buffer=JSONLBuffer(max_delay=0.05, batch_size=2),
+)
+async def stream_delayed_invalid() -> AsyncIterable[Item]:
+    yield {"name": "item0"}  # type: ignore[misc]
+    yield {"title": "item1"}  # type: ignore[misc]
+
+
+@app.get("/per-item", jsonl_buffer=None)
+async def stream_per_item() -> AsyncIterable[Item]:
+    for i in range(3):
+        yield Item(name=f"item{i}")
+
+
+router = APIRouter(jsonl_buffer=JSONLBuffer(max_bytes=1024, max_delay=None))
+
+
+@router.get("/router/items")
+async def stream_router_items() -> AsyncIterable[Item]:
+    for i in range(3):
+        yield Item(name=f"item{i}")
+
+
+app.include_router(router)
+
+
+def get_chunks(app: FastAPI, path: str) -> list[bytes]:
+    """
+    Return the body chunks sent by the app, the TestClient would join them.
+    """
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        await anyio.sleep(float("inf"))
+        return {"type": "http.disconnect"}  # pragma: no cover
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+        elif message["type"] == "http.response.body" and message.get("body"):
+            chunks.append(message["body"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("test", 80),
+    }
+
+    async def main() -> None:
+        await app(scope, receive, send)
+
+    anyio.run(main)
+    return chunks
+
+
+def parse_chunks(chunks: list[bytes]) -> list[list[dict[str, Any]]]:
+    return [[json.loads(line) for line in chunk.splitlines()] for chunk in chunks]
+
+
+@pytest.mark.parametrize("path", ["/items", "/sync-items"])
+def test_flush_by_size(path: str):
+    chunks = get_chunks(app, path)
+    # Each line has 30 bytes, a chunk is sent when reaching 40 bytes
+    assert parse_chunks(chunks) == [
+        [{"name": "item0", "price": None}, {"name": "item1", "price": None}],
+        [{"name": "item2", "price": None}, {"name": "item3", "price": None}],
+        [{"name": "item4", "price": None}],
+    ]
+
+
+def test_no_annotation():
+    chunks = get_chunks(app, "/no-annotation")
+    # Each line has 18 bytes
+    assert parse_chunks(chunks) == [
+        [{"name": "item0"}, {"name": "item1"}, {"name": "item2"}],
+    ]
+
+
+@pytest.mark.parametrize(
+    "path,sizes", [("/delayed", [2, 1]), ("/sync-delayed", [1, 1])]
+)
+def test_flush_by_delay(path: str, sizes: list[int]):
+    chunks = get_chunks(app, path)
+    assert [len(lines) for lines in parse_chunks(chunks)] == sizes
+
+
+def test_batch_validation():
+    chunks = get_chunks(app, "/batch")
+    assert parse_chunks(chunks) == [
+        [{"name": "item0", "price": 0.0}, {"name": "item1", "price": 1.0}],
+        [{"name": "item2", "price": 2.0}, {"name": "item3", "price": 3.0}],
+        [{"name": "item4", "price": 4.0}],
+    ]
+
+
+@pytest.mark.parametrize("path", ["/batch-invalid", "/delayed-invalid"])
+def test_batch_validation_error(path: str):
+    client = TestClient(app)
+    with pytest.raises(ResponseValidationError) as exc_info:
+        client.get(path)
+    assert [error["loc"] for error in exc_info.value.errors()] == [("response", "name")]
+
+
+def test_per_item():
+    chunks = get_chunks(app, "/per-item")
+    assert len(chunks) == 3
+
+
+def test_router_buffer():
+    chunks = get_chunks(app, "/router/items")
+    assert len(chunks) == 1
+    assert len(chunks[0].splitlines()) == 3
+
+
+def test_per_item_by_default():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def stream_items() -> AsyncIterable[Item]:
+        for i in range(3):
+            yield Item(name=f"item{i}")
+
+    chunks = get_chunks(app, "/items")
+    assert len(chunks) == 3
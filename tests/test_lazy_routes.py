@@ -0,0 +1,201 @@
+import threading
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+def get_api_routes(app: FastAPI) -> dict[str, APIRoute]:
+    return {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+
+
+def create_app(lazy_routes: bool = True) -> FastAPI:
+    app = FastAPI(lazy_routes=lazy_routes)
+    router = APIRouter(prefix="/router")
+
+    @app.post("/items/", response_model=Item)
+    def create_item(item: Item):
+        return item
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, q: str | None = None):
+        return {"item_id": item_id, "q": q}
+
+    def get_user():
+        return "user"
+
+    @router.get("/users/me")
+    def read_me(user: str = Depends(get_user)):
+        return user
+
+    app.include_router(router)
+    return app
+
+
+def test_routes_are_not_compiled():
+    app = create_app()
+    route = get_api_routes(app)["/items/"]
+    assert route.lazy
+    assert "dependant" not in route.__dict__
+    assert "app" not in route.__dict__
+    assert "response_field" not in route.__dict__
+
+
+def test_compiled_on_first_request():
+    app = create_app()
+    routes = get_api_routes(app)
+    client = TestClient(app)
+    response = client.post("/items/", json={"name": "Foo", "price": 3})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Foo", "price": 3.0}
+    assert "dependant" in routes["/items/"].__dict__
+    assert "dependant" not in routes["/items/{item_id}"].__dict__
+    response = client.get("/items/3", params={"q": "foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item_id": 3, "q": "foo"}
+    response = client.get("/router/users/me")
+    assert response.status_code == 200, response.text
+    assert response.json() == "user"
+
+
+def test_compiled_on_attribute_access():
+    app = create_app()
+    route = get_api_routes(app)["/items/{item_id}"]
+    assert [param.name for param in route.dependant.query_params] == ["q"]
+    assert "app" in route.__dict__
+    with pytest.raises(AttributeError):
+        route.not_an_attribute  # noqa: B018
+
+
+def test_warmup():
+    app = create_app()
+    app.warmup()
+    for route in get_api_routes(app).values():
+        assert "app" in route.__dict__
+    app.warmup()
+
+
+def test_openapi_same_as_eager():
+    lazy_app = create_app()
+    lazy_openapi = TestClient(lazy_app).get("/openapi.json").json()
+    eager_app = create_app(lazy_routes=False)
+    assert lazy_openapi == TestClient(eager_app).get("/openapi.json").json()
+
+
+def test_error_raised_when_compiled():
+    app = FastAPI(lazy_routes=True)
+
+    @app.get("/invalid", response_model=threading.Lock)
+    def read_invalid():
+        pass  # pragma: no cover
+
+    with pytest.raises(FastAPIError):
+        app.warmup()
+    route = get_api_routes(app)["/invalid"]
+    assert not route._compiled
+    with pytest.raises(FastAPIError):
+        route.dependant  # noqa: B018
+
+
+def test_compiled_once_with_threads():
+    app = create_app()
+    route = get_api_routes(app)["/items/"]
+    barrier = threading.Barrier(4)
+    handlers = []
+
+    def get_handler():
+        barrier.wait()
+        handlers.append(route.app)
+
+    threads = [threading.Thread(target=get_handler) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(handlers) == 4
+    assert all(handler is handlers[0] for handler in handlers)
+
+
+def test_routes_have_their_own_compile_lock():
+    app = create_app()
+    routes = get_api_routes(app)
+    assert (
+        routes["/items/"]._compile_lock is not routes["/items/{item_id}"]._compile_lock
+    )
+
+
+class CustomRoute(APIRoute):
+    def __init__(self, path, endpoint, *, methods=None, **kwargs):
+        self.custom = True
+        super().__init__(path, endpoint, methods=methods, **kwargs)
+
+
+route_options = (
+    "lazy",
+    "specialized_handler",
+    "body_decoders",
+    "response_encoders",
+    "response_validation",
+    "response_chunk_size",
+    "jsonl_buffer",
+)
+
+
+class RecordingRoute(APIRoute):
+    received: list[set[str]] = []
+
+    def __init__(self, path, endpoint, **kwargs):
+        self.received.append(set(kwargs))
+        super().__init__(path, endpoint, **kwargs)
+
+
+def test_route_options_only_passed_when_set():
+    RecordingRoute.received = []
+    router = APIRouter(route_class=RecordingRoute)
+
+    @router.get("/default")
+    def default():
+        return {}
+
+    lazy_router = APIRouter(
+        route_class=RecordingRoute, lazy_routes=True, response_validation="none"
+    )
+
+    @lazy_router.get("/lazy", jsonl_buffer=8)
+    def lazy():
+        return {}
+
+    default_options, lazy_options = RecordingRoute.received
+    assert not default_options.intersection(route_options)
+    assert lazy_options.intersection(route_options) == {
+        "lazy",
+        "response_validation",
+        "jsonl_buffer",
+    }
+
+
+def test_custom_route_class_lazy():
+    app = FastAPI(lazy_routes=True)
+    router = APIRouter(route_class=CustomRoute)
+
+    @router.get("/custom")
+    def custom():
+        return {"route": "custom"}
+
+    app.include_router(router)
+    route = get_api_routes(app)["/custom"]
+    assert isinstance(route, CustomRoute)
+    assert route.custom
+    assert not route._compiled
+    client = TestClient(app)
+    response = client.get("/custom")
+    assert response.json() == {"route": "custom"}
+    assert route._compiled
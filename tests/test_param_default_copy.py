@@ -0,0 +1,69 @@
+from enum import Enum
+from typing import Annotated
+
+from fastapi import FastAPI, Header, Query
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+from pydantic import Field
+
+
+class Color(Enum):
+    red = "red"
+
+
+def test_copy_default_kinds():
+    text = "some long default text"
+    field = create_model_field("q", str, default=text)
+    assert field.copy_default() is text
+    field = create_model_field("color", Color, default=Color.red)
+    assert field.copy_default() is Color.red
+    default_list = ["a"]
+    field = create_model_field("tags", list[str], default=default_list)
+    copied = field.copy_default()
+    assert copied == default_list
+    assert copied is not default_list
+    field = create_model_field(
+        "tags", list[str], field_info=Field(default_factory=lambda: ["b"])
+    )
+    assert field.copy_default() == ["b"]
+    assert field.copy_default() is not field.copy_default()
+
+
+app = FastAPI()
+
+factory_calls: list[str] = []
+
+
+def make_tags() -> list[str]:
+    factory_calls.append("tags")
+    return ["factory"]
+
+
+@app.get("/items/")
+def read_items(
+    labels: Annotated[list[str], Query(default_factory=make_tags)],
+    q: str | None = None,
+    limit: int = 10,
+    tags: Annotated[list[str], Query()] = ["default"],  # noqa: B006
+    x_token: Annotated[str | None, Header()] = None,
+):
+    tags.append("changed")
+    labels.append("changed")
+    return {"q": q, "limit": limit, "tags": tags, "labels": labels, "x_token": x_token}
+
+
+client = TestClient(app)
+
+
+def test_mutable_defaults_not_shared():
+    for _ in range(2):
+        response = client.get("/items/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {
+            "q": None,
+            "limit": 10,
+            "tags": ["default", "changed"],
+            "labels": ["factory", "changed"],
+            "x_token": None,
+        }
+    assert factory_calls == ["tags", "tags"]
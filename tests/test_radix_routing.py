@@ -0,0 +1,234 @@
+import pytest
+from fastapi import APIRouter, FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.convertors import StringConvertor, register_url_convertor
+from starlette.responses import PlainTextResponse
+from starlette.routing import Host, Mount
+
+
+def create_app(radix_routing: bool) -> FastAPI:
+    app = FastAPI(radix_routing=radix_routing)
+    router = APIRouter(prefix="/router")
+
+    @app.get("/")
+    def root():
+        return "root"
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        return {"route": "item", "item_id": item_id}
+
+    @app.get("/items/special")
+    def read_special_item():
+        return {"route": "special"}  # pragma: no cover
+
+    @app.post("/items/special")
+    def create_special_item():
+        return {"route": "create-special"}
+
+    @app.get("/numbers/{number:int}")
+    def read_number(number: int):
+        return {"route": "int", "number": number}
+
+    @app.get("/numbers/{name}")
+    def read_number_name(name: str):
+        return {"route": "name", "name": name}
+
+    @app.get("/files/{file_path:path}")
+    def read_file(file_path: str):
+        return {"route": "file", "file_path": file_path}
+
+    @app.get("/reports/{year}-{month}")
+    def read_report(year: str, month: str):
+        return {"route": "report", "year": year, "month": month}
+
+    @app.get("/trailing/")
+    def read_trailing():
+        return "trailing"
+
+    @app.get("/{catch_all:path}/end")
+    def read_catch_all_end(catch_all: str):
+        return {"route": "catch-all-end", "catch_all": catch_all}
+
+    @router.get("/users/{user_id}")
+    def read_user(user_id: int):
+        return {"route": "user", "user_id": user_id}
+
+    @app.websocket("/ws/{name}")
+    async def websocket_endpoint(websocket: WebSocket, name: str):
+        await websocket.accept()
+        await websocket.send_text(f"Hello {name}")
+        await websocket.close()
+
+    app.include_router(router)
+
+    sub_app = FastAPI()
+
+    @sub_app.get("/sub")
+    def read_sub():
+        return "sub"
+
+    app.mount("/mounted", sub_app)
+    app.router.routes.append(
+        Host("api.example.com", app=PlainTextResponse("host"), name="host")
+    )
+    return app
+
+
+requests = [
+    ("GET", "/"),
+    ("GET", "/items/foo"),
+    ("GET", "/items/special"),
+    ("POST", "/items/special"),
+    ("PUT", "/items/special"),
+    ("DELETE", "/items/foo"),
+    ("GET", "/items"),
+    ("GET", "/items/"),
+    ("GET", "/numbers/42"),
+    ("GET", "/numbers/forty-two"),
+    ("GET", "/files/"),
+    ("GET", "/files"),
+    ("GET", "/files/a/b/c.txt"),
+    ("GET", "/reports/2024-05"),
+    ("GET", "/reports/2024"),
+    ("GET", "/trailing"),
+    ("GET", "/trailing/"),
+    ("GET", "/a/b/end"),
+    ("GET", "/router/users/3"),
+    ("GET", "/router/users/abc"),
+    ("GET", "/mounted/sub"),
+    ("GET", "/mounted/nope"),
+    ("GET", "/not-found"),
+    ("GET", "/not/found/at/all/"),
+]
+
+
+@pytest.mark.parametrize("method,path", requests)
+def test_same_as_linear_routing(method: str, path: str):
+    linear_client = TestClient(create_app(radix_routing=False))
+    radix_client = TestClient(create_app(radix_routing=True))
+    linear_response = linear_client.request(method, path, follow_redirects=False)
+    radix_response = radix_client.request(method, path, follow_redirects=False)
+    assert radix_response.status_code == linear_response.status_code
+    assert radix_response.content == linear_response.content
+    assert radix_response.headers.get("location") == linear_response.headers.get(
+        "location"
+    )
+
+
+def test_first_match_wins():
+    client = TestClient(create_app(radix_routing=True))
+    response = client.get("/items/special")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"route": "item", "item_id": "special"}
+
+
+def test_method_not_allowed():
+    client = TestClient(create_app(radix_routing=True))
+    response = client.put("/items/special")
+    assert response.status_code == 405, response.text
+    assert response.headers["allow"] == "GET"
+
+
+def test_path_convertor():
+    client = TestClient(create_app(radix_routing=True))
+    response = client.get("/numbers/42")
+    assert response.json() == {"route": "int", "number": 42}
+    response = client.get("/files/a/b/c.txt")
+    assert response.json() == {"route": "file", "file_path": "a/b/c.txt"}
+
+
+def test_mount():
+    client = TestClient(create_app(radix_routing=True))
+    response = client.get("/mounted/sub")
+    assert response.status_code == 200, response.text
+    assert response.json() == "sub"
+
+
+def test_host():
+    client = TestClient(
+        create_app(radix_routing=True), base_url="http://api.example.com"
+    )
+    response = client.get("/not-found")
+    assert response.status_code == 200, response.text
+    assert response.text == "host"
+
+
+def test_redirect_slashes():
+    client = TestClient(create_app(radix_routing=True))
+    response = client.get("/trailing", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://testserver/trailing/"
+
+
+def test_websocket():
+    client = TestClient(create_app(radix_routing=True))
+    with client.websocket_connect("/ws/foo") as websocket:
+        assert websocket.receive_text() == "Hello foo"
+
+
+def test_routes_added_after_first_request():
+    app = create_app(radix_routing=True)
+    client = TestClient(app)
+    assert client.get("/late").status_code == 404
+
+    @app.get("/late")
+    def read_late():
+        return "late"
+
+    response = client.get("/late")
+    assert response.status_code == 200, response.text
+    assert response.json() == "late"
+
+
+def test_routes_replaced():
+    app = create_app(radix_routing=True)
+    client = TestClient(app)
+    assert client.get("/").status_code == 200
+    app.router.routes = []
+    assert client.get("/").status_code == 404
+
+
+def test_mount_root_path():
+    app = FastAPI(radix_routing=True)
+    sub_app = FastAPI(radix_routing=True)
+
+    @sub_app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        return {"item_id": item_id}
+
+    app.mount("", Mount("/api", app=sub_app))
+    client = TestClient(app)
+    response = client.get("/api/items/foo")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item_id": "foo"}
+
+
+def test_custom_convertor():
+    class UpperConvertor(StringConvertor):
+        regex = "[A-Z/]+"
+
+    register_url_convertor("radix_upper", UpperConvertor())
+    app = FastAPI(radix_routing=True)
+
+    @app.get("/upper/{value:radix_upper}")
+    def read_upper(value: str):
+        return value
+
+    client = TestClient(app)
+    response = client.get("/upper/A/B")
+    assert response.status_code == 200, response.text
+    assert response.json() == "A/B"
+
+
+def test_path_equal_to_root_path():
+    app = FastAPI(radix_routing=True, root_path="/api")
+
+    @app.get("/")
+    def root():
+        return "root"  # pragma: no cover
+
+    client = TestClient(app)
+    response = client.get("/api", follow_redirects=False)
+    assert response.status_code == 307, response.text
+    assert response.headers["location"] == "http://testserver/api/"
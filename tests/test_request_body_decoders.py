@@ -0,0 +1,152 @@
+from typing import Annotated, Any
+
+import orjson
+import pytest
+from fastapi import APIRouter, Body, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+def decode_pairs(body: bytes) -> dict[str, str]:
+    # A minimal binary-ish format for the tests: "key=value;key=value"
+    return dict(pair.split("=", 1) for pair in body.decode().split(";"))
+
+
+json_calls: list[bytes] = []
+
+
+def decode_json(body: bytes) -> Any:
+    json_calls.append(body)
+    return orjson.loads(body)
+
+
+app = FastAPI(
+    body_decoders={"Application/X-Pairs": decode_pairs},
+)
+
+
+@app.post("/items/")
+def create_item(item: Item):
+    return item
+
+
+@app.post("/embedded/")
+def create_embedded(item: Annotated[Item, Body(embed=True)]):
+    return item
+
+
+router = APIRouter(body_decoders={"application/json": decode_json})
+
+
+@router.post("/router/items/")
+def create_router_item(item: Item):
+    return item
+
+
+app.include_router(router)
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_json_calls():
+    json_calls.clear()
+
+
+def test_decoded_body():
+    response = client.post(
+        "/items/",
+        content=b"name=foo;price=4.2",
+        headers={"content-type": "application/x-pairs; charset=utf-8"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 4.2}
+
+
+def test_decoded_embedded_body():
+    response = client.post(
+        "/embedded/",
+        content=b"item=foo",
+        headers={"content-type": "application/x-pairs"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", "item"]
+
+
+def test_decoded_body_validation_error():
+    response = client.post(
+        "/items/",
+        content=b"name=foo;price=high",
+        headers={"content-type": "application/x-pairs"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "float_parsing",
+                "loc": ["body", "price"],
+                "msg": "Input should be a valid number, unable to parse string as a number",
+                "input": "high",
+            }
+        ]
+    }
+
+
+def test_decode_error():
+    response = client.post(
+        "/items/",
+        content=b"name",
+        headers={"content-type": "application/x-pairs"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "body_decode_error",
+                "loc": ["body"],
+                "msg": "Body decode error",
+                "input": {},
+                "ctx": {
+                    "error": "dictionary update sequence element #0 has length 1; 2 is required"
+                },
+            }
+        ]
+    }
+
+
+def test_json_decoder_override():
+    response = client.post("/router/items/", json={"name": "foo", "price": 1})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 1.0}
+    response = client.post("/items/", json={"name": "bar", "price": 2})
+    assert response.status_code == 200, response.text
+    assert json_calls == [b'{"name":"foo","price":1}']
+
+
+def test_router_inherits_app_decoders():
+    response = client.post(
+        "/router/items/",
+        content=b"name=foo;price=1",
+        headers={"content-type": "application/x-pairs"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 1.0}
+
+
+def test_openapi_request_body_content():
+    paths = client.get("/openapi.json").json()["paths"]
+    schema = {"$ref": "#/components/schemas/Item"}
+    assert paths["/items/"]["post"]["requestBody"]["content"] == {
+        "application/json": {"schema": schema},
+        "application/x-pairs": {"schema": schema},
+    }
+    assert paths["/router/items/"]["post"]["requestBody"]["content"] == {
+        "application/json": {"schema": schema},
+        "application/x-pairs": {"schema": schema},
+    }
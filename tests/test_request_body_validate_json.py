@@ -0,0 +1,207 @@
+import json
+from typing import Annotated, Any
+
+import pytest
+from fastapi import Body, Depends, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+
+class Item(BaseModel):
+    name: str
+    tags: list[str] = []
+
+
+class OtherItem(BaseModel):
+    title: str
+
+
+class CheckedItem(BaseModel):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def check_name(cls, value: str) -> str:
+        if value == "missing":
+            raise LookupError("Unknown name")
+        return value
+
+
+def get_item(item: Item):
+    return item
+
+
+app = FastAPI()
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    return JSONResponse(
+        status_code=422, content={"detail": exc.errors(), "body": exc.body}
+    )
+
+
+@app.post("/items/")
+def create_item(item: Item, q: int | None = None):
+    return item
+
+
+@app.post("/dependency/")
+def create_item_dependency(item: Annotated[Item, Depends(get_item)]):
+    return item
+
+
+@app.post("/optional/")
+def create_optional(item: Item | None = None):
+    return item
+
+
+@app.post("/embedded/")
+def create_embedded(item: Annotated[Item, Body(embed=True)]):
+    return item
+
+
+@app.post("/checked/")
+def create_checked(item: CheckedItem):
+    return item
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/items/", "/dependency/", "/embedded/"])
+def test_valid_body(path: str):
+    body: dict[str, Any] = {"name": "foo", "tags": ["a"]}
+    if path == "/embedded/":
+        body = {"item": body}
+    response = client.post(path, json=body)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "tags": ["a"]}
+
+
+def test_valid_body_not_parsed_with_json_loads(monkeypatch: pytest.MonkeyPatch):
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("json.loads() should not be called")  # pragma: no cover
+
+    monkeypatch.setattr(json, "loads", fail)
+    response = client.post(
+        "/items/",
+        content=b'{"name": "foo"}',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 200, response.text
+    monkeypatch.undo()
+    assert response.json() == {"name": "foo", "tags": []}
+
+
+def test_invalid_json():
+    response = client.post(
+        "/items/",
+        content=b'{"name": "foo",}',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "json_invalid",
+                "loc": ["body", 15],
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": "Expecting property name enclosed in double quotes"},
+            }
+        ],
+        "body": '{"name": "foo",}',
+    }
+
+
+def test_invalid_body():
+    response = client.post("/items/", json={"name": "foo", "tags": "a"})
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "list_type",
+                "loc": ["body", "tags"],
+                "msg": "Input should be a valid list",
+                "input": "a",
+            }
+        ],
+        "body": {"name": "foo", "tags": "a"},
+    }
+
+
+def test_valid_body_other_errors():
+    response = client.post("/items/?q=foo", json={"name": "foo"})
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["query", "q"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "foo",
+            }
+        ],
+        "body": {"name": "foo"},
+    }
+
+
+def test_null_body():
+    response = client.post(
+        "/items/", content=b"null", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+        ],
+        "body": None,
+    }
+
+
+def test_null_optional_body():
+    response = client.post(
+        "/optional/", content=b" null ", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() is None
+
+
+def test_decode_error_with_other_errors(monkeypatch: pytest.MonkeyPatch):
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise ValueError("Not supported")
+
+    monkeypatch.setattr(json, "loads", fail)
+    response = client.post(
+        "/items/?q=foo",
+        content=b'{"name": "foo"}',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 400, response.text
+    monkeypatch.undo()
+    assert response.json() == {"detail": "There was an error parsing the body"}
+
+
+def test_validator_exception_not_parse_error():
+    # Not a validation error, it's raised unchanged instead of a 400
+    with pytest.raises(LookupError, match="Unknown name"):
+        client.post("/checked/", json={"name": "missing"})
+    response = client.post("/checked/", json={"name": "foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo"}
+
+
+def test_dependency_override_with_other_body():
+    def get_other_item(other: OtherItem):
+        return Item(name=other.title)
+
+    app.dependency_overrides[get_item] = get_other_item
+    try:
+        response = client.post("/dependency/", json={"title": "foo"})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "tags": []}
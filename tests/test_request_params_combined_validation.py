@@ -0,0 +1,131 @@
+from enum import Enum
+from typing import Annotated, Any, Literal
+
+import pytest
+from fastapi import FastAPI, Header, Query
+from fastapi._compat import v2
+from fastapi.dependencies.utils import RequestParamsExtractor, get_dependant
+from fastapi.testclient import TestClient
+from pydantic_core import SchemaError
+from starlette.datastructures import Headers, QueryParams
+
+
+class Color(str, Enum):
+    red = "red"
+    blue = "blue"
+
+
+def search(
+    q: str,
+    page: Annotated[int, Query(ge=1)] = 1,
+    size: int | None = None,
+    color: Color | None = None,
+    background: Color = Color.blue,
+    tags: Annotated[list[Color], Query()] = [],  # noqa: B006
+    order: Literal["asc", "desc"] = "asc",
+    exact: bool = False,
+    user_agent: Annotated[str | None, Header()] = None,
+    x_token: Annotated[str, Header(max_length=3)] = "abc",
+):
+    pass  # pragma: no cover
+
+
+dependant = get_dependant(path="/search", call=search)
+
+
+def extract_each_field(
+    extractor: RequestParamsExtractor, received_params: Any
+) -> tuple[dict[str, Any], list[Any]]:
+    validator = extractor.validator
+    extractor.validator = None
+    try:
+        return extractor.extract(received_params)
+    finally:
+        extractor.validator = validator
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "q=foo",
+        "q=foo&page=2&size=10&color=red&tags=red&tags=blue&order=desc&exact=true",
+        "page=0&size=ten&color=green&tags=red&tags=green&order=up&exact=maybe",
+        "q=foo&background=red&tags=blue&other=value",
+        "",
+    ],
+)
+def test_combined_query_validation(query: str):
+    extractor = RequestParamsExtractor(dependant.query_params)
+    assert extractor.validator is not None
+    received_params = QueryParams(query)
+    assert extractor.extract(received_params) == extract_each_field(
+        extractor, received_params
+    )
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"user-agent": "test", "x-token": "abcd"}, {"x-token": "ab"}],
+)
+def test_combined_header_validation(headers: dict[str, str]):
+    extractor = RequestParamsExtractor(dependant.header_params)
+    assert extractor.validator is not None
+    received_params = Headers(headers)
+    assert extractor.extract(received_params) == extract_each_field(
+        extractor, received_params
+    )
+
+
+def test_not_combined_schema(monkeypatch: pytest.MonkeyPatch):
+    class FailingSchemaValidator:
+        def __init__(self, schema: Any) -> None:
+            raise SchemaError("Not supported")
+
+    monkeypatch.setattr(v2, "SchemaValidator", FailingSchemaValidator)
+    extractor = RequestParamsExtractor(dependant.query_params)
+    assert extractor.validator is None
+    values, errors = extractor.extract(QueryParams("q=foo&page=2"))
+    assert errors == []
+    assert values["q"] == "foo"
+    assert values["page"] == 2
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def read_item(item_id: int, q: str, limit: Annotated[int, Query(le=100)] = 10):
+    return {"item_id": item_id, "q": q, "limit": limit}
+
+
+client = TestClient(app)
+
+
+def test_combined_validation_errors():
+    response = client.get("/items/foo?limit=1000")
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["path", "item_id"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "foo",
+            },
+            {
+                "type": "missing",
+                "loc": ["query", "q"],
+                "msg": "Field required",
+                "input": None,
+            },
+            {
+                "type": "less_than_equal",
+                "loc": ["query", "limit"],
+                "msg": "Input should be less than or equal to 100",
+                "input": "1000",
+                "ctx": {"le": 100},
+            },
+        ]
+    }
+    response = client.get("/items/1?q=foo&limit=5")
+    assert response.json() == {"item_id": 1, "q": "foo", "limit": 5}
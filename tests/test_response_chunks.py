@@ -0,0 +1,171 @@
+import anyio
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import ResponseValidationError
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.types import Message
+
+
+class Item(BaseModel):
+    name: str
+    description: str | None = None
+
+
+app = FastAPI(response_chunk_size=2)
+
+
+@app.get("/items", response_model=list[Item], response_model_exclude_none=True)
+def read_items():
+    return [{"name": f"item{i}"} for i in range(5)]
+
+
+@app.get("/generator", response_model=list[Item])
+async def read_generator():
+    return (Item(name=f"item{i}", description="desc") for i in range(3))
+
+
+@app.get("/empty", response_model=list[Item])
+def read_empty():
+    return []
+
+
+@app.get("/invalid-first", response_model=list[Item])
+async def read_invalid_first():
+    return [{"name": "item0"}, {"title": "item1"}]
+
+
+@app.get("/invalid-later", response_model=list[Item])
+def read_invalid_later():
+    return [{"name": "item0"}, {"name": "item1"}, {"title": "item2"}]
+
+
+@app.get(
+    "/include",
+    response_model=list[Item],
+    response_model_include={"__all__": {"name"}},
+)
+def read_include():
+    return [{"name": "item0", "description": "desc"}]
+
+
+@app.get("/not-chunked", response_model=list[Item], response_chunk_size=None)
+def read_not_chunked():
+    return [{"name": "item0"}]
+
+
+@app.get("/item", response_model=Item)
+def read_item():
+    return {"name": "item0"}
+
+
+router = APIRouter()
+
+
+@router.get("/router/items")
+def read_router_items() -> list[Item]:
+    return [Item(name="item0"), Item(name="item1"), Item(name="item2")]
+
+
+app.include_router(router)
+
+
+client = TestClient(app)
+
+
+def test_chunked_list():
+    response = client.get("/items")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert "content-length" not in response.headers
+    assert response.json() == [{"name": f"item{i}"} for i in range(5)]
+
+
+def test_chunked_generator():
+    response = client.get("/generator")
+    assert response.status_code == 200, response.text
+    assert response.json() == [
+        {"name": f"item{i}", "description": "desc"} for i in range(3)
+    ]
+
+
+def test_chunked_router():
+    response = client.get("/router/items")
+    assert response.status_code == 200, response.text
+    assert "content-length" not in response.headers
+    assert response.json() == [
+        {"name": f"item{i}", "description": None} for i in range(3)
+    ]
+
+
+def test_chunked_empty():
+    response = client.get("/empty")
+    assert response.status_code == 200, response.text
+    assert response.content == b"[]"
+
+
+def test_invalid_first_chunk():
+    with pytest.raises(ResponseValidationError) as exc_info:
+        client.get("/invalid-first")
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("response", 1, "name")
+    ]
+
+
+def test_invalid_later_chunk():
+    with pytest.raises(ResponseValidationError) as exc_info:
+        client.get("/invalid-later")
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("response", 2, "name")
+    ]
+
+
+def test_invalid_later_chunk_response():
+    messages: list[Message] = []
+
+    requests: list[Message] = [{"type": "http.request", "body": b""}]
+
+    async def receive() -> Message:
+        if requests:
+            return requests.pop()
+        # The client doesn't disconnect
+        await anyio.sleep_forever()
+        raise AssertionError("Not reached")  # pragma: no cover
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def main() -> None:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/invalid-later",
+            "raw_path": b"/invalid-later",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+        }
+        with pytest.raises(ResponseValidationError):
+            await app(scope, receive, send)
+
+    anyio.run(main)
+    # The status code, the headers, and the first chunk were already sent, the
+    # client gets an incomplete JSON array
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 200
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    assert body == (
+        b'[{"name":"item0","description":null},{"name":"item1","description":null}'
+    )
+    assert messages[-1].get("more_body", False)
+
+
+@pytest.mark.parametrize("path", ["/include", "/not-chunked", "/item"])
+def test_not_chunked(path: str):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert "content-length" in response.headers
@@ -0,0 +1,142 @@
+import json
+from typing import Any
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from fastapi.utils import get_accepted_media_type
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    secret: str = "hidden"
+
+
+class PublicItem(BaseModel):
+    name: str
+    price: float
+
+
+def encode_ndjson(data: Any) -> bytes:
+    return b"".join(json.dumps(item).encode() + b"\n" for item in data)
+
+
+def encode_pairs(data: Any) -> bytes:
+    return ";".join(f"{key}={value}" for key, value in data.items()).encode()
+
+
+app = FastAPI(
+    response_encoders={"application/x-ndjson": encode_ndjson},
+)
+
+
+@app.get("/items/", response_model=list[PublicItem])
+def read_items():
+    return [Item(name="foo", price=1), Item(name="bar", price=2.5)]
+
+
+@app.get("/plain/", response_class=PlainTextResponse)
+def read_plain():
+    return "plain"
+
+
+router = APIRouter(response_encoders={"application/x-pairs": encode_pairs})
+
+
+@router.get("/items/{name}", response_model=PublicItem)
+def read_item(name: str):
+    return Item(name=name, price=1)
+
+
+@router.get("/raw/")
+def read_raw():
+    return {"name": "raw"}
+
+
+app.include_router(router)
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept,media_type",
+    [
+        ("application/msgpack, application/json", "application/json"),
+        ("application/msgpack;q=1, application/json;q=0.5", "application/msgpack"),
+        ("application/*;q=0.2, application/msgpack", "application/msgpack"),
+        ("*/*", "application/json"),
+        ("text/html", None),
+        ("application/*, application/json;q=0", "application/msgpack"),
+        ("application/msgpack;q=bad", None),
+        (" , ", "application/json"),
+    ],
+)
+def test_get_accepted_media_type(accept: str, media_type: str | None):
+    assert (
+        get_accepted_media_type(accept, ("application/json", "application/msgpack"))
+        == media_type
+    )
+
+
+def test_default_json():
+    for headers in [{}, {"accept": "application/json"}, {"accept": "*/*"}]:
+        response = client.get("/items/", headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["vary"] == "Accept"
+        assert response.json() == [
+            {"name": "foo", "price": 1.0},
+            {"name": "bar", "price": 2.5},
+        ]
+
+
+def test_encoded_response():
+    response = client.get(
+        "/items/", headers={"accept": "application/x-ndjson, application/json;q=0.9"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["vary"] == "Accept"
+    assert response.content == (
+        b'{"name": "foo", "price": 1.0}\n{"name": "bar", "price": 2.5}\n'
+    )
+
+
+def test_router_encoders():
+    headers = {"accept": "application/x-pairs"}
+    response = client.get("/items/foo", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-pairs"
+    assert response.content == b"name=foo;price=1.0"
+    response = client.get("/raw/", headers=headers)
+    assert response.content == b"name=raw"
+
+
+def test_not_accepted_uses_json():
+    response = client.get("/items/foo", headers={"accept": "text/html"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 1.0}
+
+
+def test_custom_response_class_not_negotiated():
+    response = client.get("/plain/", headers={"accept": "application/x-ndjson"})
+    assert response.status_code == 200, response.text
+    assert response.text == "plain"
+    assert "vary" not in response.headers
+
+
+def test_openapi_response_content():
+    paths = client.get("/openapi.json").json()["paths"]
+    schema = {"$ref": "#/components/schemas/PublicItem"}
+    assert paths["/items/{name}"]["get"]["responses"]["200"]["content"] == {
+        "application/json": {"schema": schema},
+        "application/x-ndjson": {"schema": schema},
+        "application/x-pairs": {"schema": schema},
+    }
+    assert paths["/plain/"]["get"]["responses"]["200"]["content"] == {
+        "text/plain": {"schema": {"type": "string"}}
+    }
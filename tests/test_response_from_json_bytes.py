@@ -0,0 +1,131 @@
+import warnings
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    response_from_json_bytes,
+)
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from typing_extensions import Self
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+class CustomJSONResponse(JSONResponse):
+    media_type = "application/vnd.custom+json"
+
+    def render(self, content: Any) -> bytes:
+        return b'{"rendered": true}'
+
+    @classmethod
+    def from_json_bytes(cls, content: bytes, **kwargs: Any) -> Self:
+        response = response_from_json_bytes(cls, content, **kwargs)
+        response.headers["x-from-json-bytes"] = "yes"
+        return response
+
+
+class InitJSONResponse(CustomJSONResponse):
+    def __init__(self, content: Any, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.headers["x-init"] = "yes"
+
+
+class RenderedJSONResponse(CustomJSONResponse):
+    from_json_bytes = None  # type: ignore[assignment]
+
+
+class OverriddenRenderJSONResponse(CustomJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return b'{"overridden": true}'
+
+
+app = FastAPI(
+    default_response_class=CustomJSONResponse,
+)
+
+
+@app.get("/item", status_code=201)
+def read_item() -> Item:
+    return Item(name="foo", price=1)
+
+
+@app.get("/no-model")
+def read_no_model():
+    return {"name": "foo"}
+
+
+@app.get("/init", response_class=InitJSONResponse)
+def read_init() -> Item:
+    return Item(name="foo", price=1)
+
+
+@app.get("/rendered", response_class=RenderedJSONResponse)
+def read_rendered() -> Item:
+    return Item(name="foo", price=1)
+
+
+@app.get("/overridden-render", response_class=OverriddenRenderJSONResponse)
+def read_overridden_render() -> Item:
+    return Item(name="foo", price=1)
+
+
+client = TestClient(app)
+
+
+def test_from_json_bytes():
+    response = client.get("/item")
+    assert response.status_code == 201, response.text
+    assert response.headers["content-type"] == "application/vnd.custom+json"
+    assert response.headers["x-from-json-bytes"] == "yes"
+    assert response.headers["content-length"] == str(len(response.content))
+    assert response.json() == {"name": "foo", "price": 1.0}
+
+
+def test_from_json_bytes_calls_init():
+    response = client.get("/init")
+    assert response.status_code == 200, response.text
+    assert response.headers["x-init"] == "yes"
+    assert response.headers["x-from-json-bytes"] == "yes"
+    assert response.headers["content-length"] == str(len(response.content))
+    assert response.json() == {"name": "foo", "price": 1.0}
+
+
+def test_rendered_without_response_model():
+    response = client.get("/no-model")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"rendered": True}
+
+
+def test_rendered_without_from_json_bytes():
+    response = client.get("/rendered")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"rendered": True}
+
+
+def test_subclass_overriding_render():
+    response = client.get("/overridden-render")
+    assert response.status_code == 200, response.text
+    assert "x-from-json-bytes" not in response.headers
+    assert response.json() == {"overridden": True}
+
+
+def test_orjson_response_from_json_bytes():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FastAPIDeprecationWarning)
+        response = ORJSONResponse.from_json_bytes(
+            b'{"name":"foo"}', status_code=202, headers={"x-custom": "value"}
+        )
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == 202
+    assert response.body == b'{"name":"foo"}'
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-custom"] == "value"
+    assert response.headers["content-length"] == "14"
+    assert "render" not in vars(response)
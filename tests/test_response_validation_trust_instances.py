@@ -0,0 +1,174 @@
+from typing import Any
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import ResponseValidationError
+from fastapi.testclient import TestClient
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    ModelWrapValidatorHandler,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Self
+
+validated: list[str] = []
+
+
+class Item(BaseModel):
+    model_config = ConfigDict(revalidate_instances="always")
+
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def track_validation(cls, value: str) -> str:
+        validated.append(value)
+        return value
+
+
+class PrivateItem(Item):
+    secret: str
+
+
+app = FastAPI(
+    response_validation="trust_instances",
+)
+
+
+@app.get("/item")
+def read_item() -> Item:
+    return Item(name="item")
+
+
+@app.get("/items")
+def read_items() -> list[Item]:
+    return [Item(name="a"), Item(name="b")]
+
+
+@app.get("/dict")
+def read_dict() -> Item:
+    return {"name": "dict"}  # type: ignore[return-value]
+
+
+@app.get("/invalid")
+def read_invalid() -> Item:
+    return {"title": "invalid"}  # type: ignore[return-value]
+
+
+@app.get("/subclass")
+def read_subclass() -> Item:
+    return PrivateItem(name="subclass", secret="hidden")
+
+
+@app.get("/mixed")
+def read_mixed() -> list[Item]:
+    return [Item(name="c"), {"name": "d"}]  # type: ignore[list-item]
+
+
+@app.get("/full", response_validation="full")
+def read_full() -> Item:
+    return Item(name="full")
+
+
+router = APIRouter()
+
+
+@router.get("/router/item")
+def read_router_item() -> Item:
+    return Item(name="router")
+
+
+app.include_router(router)
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_validated():
+    validated.clear()
+
+
+@pytest.mark.parametrize(
+    "path,expected,validations",
+    [
+        ("/item", {"name": "item"}, ["item"]),
+        ("/items", [{"name": "a"}, {"name": "b"}], ["a", "b"]),
+        ("/router/item", {"name": "router"}, ["router"]),
+    ],
+)
+def test_trusted_instances_not_validated(path: str, expected, validations: list[str]):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected
+    # Only validated when created in the endpoint
+    assert validated == validations
+
+
+@pytest.mark.parametrize(
+    "path,expected,validations",
+    [
+        ("/dict", {"name": "dict"}, ["dict"]),
+        ("/subclass", {"name": "subclass"}, ["subclass", "subclass"]),
+        ("/mixed", [{"name": "c"}, {"name": "d"}], ["c", "c", "d"]),
+        ("/full", {"name": "full"}, ["full", "full"]),
+    ],
+)
+def test_other_values_validated(path: str, expected, validations: list[str]):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected
+    assert validated == validations
+
+
+def test_invalid_value():
+    with pytest.raises(ResponseValidationError):
+        client.get("/invalid")
+
+
+def test_full_validation_by_default():
+    app = FastAPI()
+
+    @app.get("/item")
+    def read_item() -> Item:
+        return Item(name="item")
+
+    client = TestClient(app)
+    validated.clear()
+    response = client.get("/item")
+    assert response.json() == {"name": "item"}
+    assert validated == ["item", "item"]
+
+
+class DefaultConfigItem(BaseModel):
+    # With the default revalidate_instances="never", Pydantic still calls the
+    # model validators for instances
+    name: str
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def track_validation(cls, data: Any, handler: ModelWrapValidatorHandler[Self]):
+        validated.append(type(data).__name__)
+        return handler(data)
+
+
+@pytest.mark.parametrize(
+    "response_validation,validations",
+    [("trust_instances", []), ("full", ["DefaultConfigItem"])],
+)
+def test_default_revalidate_instances(response_validation: str, validations):
+    app = FastAPI(response_validation=response_validation)  # type: ignore[arg-type]
+
+    @app.get("/item")
+    def read_item() -> DefaultConfigItem:
+        item = DefaultConfigItem(name="item")
+        validated.clear()
+        return item
+
+    client = TestClient(app)
+    response = client.get("/item")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "item"}
+    assert validated == validations
@@ -0,0 +1,231 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from starlette.endpoints import HTTPEndpoint
+from starlette.responses import PlainTextResponse
+from starlette.routing import Host, Route
+
+
+def test_static_route():
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return "ok"
+
+    @app.post("/health")
+    def post_health():
+        return "posted"
+
+    client = TestClient(app)
+    response = client.get("/health")
+    assert response.status_code == 200, response.text
+    assert response.json() == "ok"
+    response = client.post("/health")
+    assert response.status_code == 200, response.text
+    assert response.json() == "posted"
+    response = client.put("/health")
+    assert response.status_code == 405, response.text
+
+
+def test_static_route_shadowed_by_dynamic_route():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        return {"item_id": item_id}
+
+    @app.get("/items/special")
+    def read_special():
+        return "special"  # pragma: no cover
+
+    @app.post("/items/special")
+    def create_special():
+        return "created"
+
+    client = TestClient(app)
+    response = client.get("/items/special")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item_id": "special"}
+    response = client.post("/items/special")
+    assert response.status_code == 200, response.text
+    assert response.json() == "created"
+
+
+def test_static_route_after_dynamic_route_with_other_method():
+    app = FastAPI()
+
+    @app.post("/items/{item_id}")
+    def create_item(item_id: str):
+        return {"item_id": item_id}  # pragma: no cover
+
+    @app.get("/items/special")
+    def read_special():
+        return "special"
+
+    client = TestClient(app)
+    response = client.get("/items/special")
+    assert response.status_code == 200, response.text
+    assert response.json() == "special"
+
+
+def test_static_route_shadowed_by_mount():
+    app = FastAPI()
+    sub_app = FastAPI()
+
+    @sub_app.get("/special")
+    def read_sub_special():
+        return "mounted"
+
+    app.mount("/items", sub_app)
+
+    @app.get("/items/special")
+    def read_special():
+        return "special"  # pragma: no cover
+
+    client = TestClient(app)
+    response = client.get("/items/special")
+    assert response.status_code == 200, response.text
+    assert response.json() == "mounted"
+
+
+def test_static_route_shadowed_by_host():
+    app = FastAPI()
+    app.router.routes.append(
+        Host("api.example.com", app=PlainTextResponse("host"), name="host")
+    )
+
+    @app.get("/health")
+    def health():
+        return "ok"
+
+    client = TestClient(app)
+    response = client.get("/health")
+    assert response.status_code == 200, response.text
+    assert response.json() == "ok"
+    host_client = TestClient(app, base_url="http://api.example.com")
+    response = host_client.get("/health")
+    assert response.status_code == 200, response.text
+    assert response.text == "host"
+
+
+def test_static_route_with_starlette_route():
+    class Endpoint(HTTPEndpoint):
+        async def get(self, request):
+            return PlainTextResponse("class")
+
+    async def plain(request):
+        return PlainTextResponse("plain")
+
+    app = FastAPI(
+        routes=[Route("/class", Endpoint), Route("/plain", plain, methods=["GET"])]
+    )
+    client = TestClient(app)
+    response = client.get("/class")
+    assert response.status_code == 200, response.text
+    assert response.text == "class"
+    response = client.head("/plain")
+    assert response.status_code == 200, response.text
+    response = client.get("/plain")
+    assert response.text == "plain"
+
+
+def test_static_route_added_after_first_request():
+    app = FastAPI()
+
+    @app.get("/first")
+    def first():
+        return "first"
+
+    client = TestClient(app)
+    assert client.get("/first").json() == "first"
+    assert client.get("/second").status_code == 404
+
+    @app.get("/second")
+    def second():
+        return "second"
+
+    response = client.get("/second")
+    assert response.status_code == 200, response.text
+    assert response.json() == "second"
+
+
+def test_static_route_with_radix_routing():
+    app = FastAPI(radix_routing=True)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        return {"item_id": item_id}
+
+    @app.get("/items/special")
+    def read_special():
+        return "special"  # pragma: no cover
+
+    @app.get("/other")
+    def read_other():
+        return "other"
+
+    client = TestClient(app)
+    response = client.get("/items/special")
+    assert response.json() == {"item_id": "special"}
+    response = client.get("/other")
+    assert response.json() == "other"
+
+
+def create_app_with_routes(radix_routing: bool) -> FastAPI:
+    app = FastAPI(radix_routing=radix_routing)
+
+    @app.get("/old")
+    def read_old():
+        return "old"
+
+    @app.get("/other")
+    def read_other():
+        return "other"
+
+    return app
+
+
+def replace_route(routes: list, path: str, new_path: str) -> None:
+    def read_new():
+        return "new"
+
+    index = next(i for i, route in enumerate(routes) if route.path == path)
+    routes[index] = APIRoute(new_path, read_new)
+
+
+@pytest.mark.parametrize("radix_routing", [False, True])
+def test_route_replaced_in_place(radix_routing: bool):
+    app = create_app_with_routes(radix_routing)
+    client = TestClient(app)
+    assert client.get("/old").json() == "old"
+    replace_route(app.router.routes, "/old", "/old")
+    assert client.get("/old").json() == "new"
+
+
+@pytest.mark.parametrize("radix_routing", [False, True])
+def test_route_removed_and_appended(radix_routing: bool):
+    app = create_app_with_routes(radix_routing)
+    client = TestClient(app)
+    assert client.get("/old").json() == "old"
+    routes = app.router.routes
+    route = next(route for route in routes if getattr(route, "path", None) == "/old")
+    routes.remove(route)
+
+    @app.get("/new")
+    def read_new():
+        return "new"
+
+    assert client.get("/old").status_code == 404
+    assert client.get("/new").json() == "new"
+    assert client.get("/other").json() == "other"
+
+
+def test_plain_list_route_replaced_in_place():
+    app = create_app_with_routes(radix_routing=False)
+    app.router.routes = list(app.router.routes)
+    client = TestClient(app)
+    assert client.get("/old").json() == "old"
+    replace_route(app.router.routes, "/old", "/old")
+    assert client.get("/old").json() == "new"
@@ -0,0 +1,138 @@
+from typing import Annotated, Any
+
+import pytest
+from fastapi import BackgroundTasks, Depends, FastAPI, Form, Response, routing
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+def get_token(response: Response):
+    response.headers["x-token"] = "token"
+    return "token"
+
+
+def encode_text(content: Any) -> bytes:
+    return str(content).encode()
+
+
+def create_app(specialized_handlers: bool) -> FastAPI:
+    app = FastAPI(
+        specialized_handlers=specialized_handlers,
+        response_encoders={"text/x-python": encode_text},
+    )
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, q: str | None = None):
+        return {"item_id": item_id, "q": q}
+
+    @app.post("/items/", response_model=Item, status_code=201)
+    async def create_item(item: Item, token: Annotated[str, Depends(get_token)]):
+        return item
+
+    @app.post("/login/")
+    async def login(username: Annotated[str, Form()]):
+        return {"username": username}
+
+    @app.get("/text/", response_class=PlainTextResponse)
+    def read_text():
+        return "text"
+
+    @app.get("/custom/", response_class=JSONResponse, response_model=Item)
+    def read_custom():
+        return {"name": "custom", "extra": "ignored"}
+
+    @app.get("/response/")
+    def read_response(background_tasks: BackgroundTasks):
+        return Response(content=b"raw", media_type="text/plain")
+
+    @app.get("/no-content/", status_code=204)
+    def read_no_content():
+        return None
+
+    @app.get("/invalid-response/", response_model=Item)
+    async def read_invalid_response():
+        return {"price": "free"}
+
+    @app.get("/chunks/", response_model=list[Item], response_chunk_size=2)
+    def read_chunks():
+        return [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+    @app.get("/stream/")
+    async def stream_items():
+        yield {"name": "a"}
+        yield {"name": "b"}
+
+    return app
+
+
+requests = [
+    ("GET", "/items/3", {"params": {"q": "foo"}}),
+    ("GET", "/items/foo", {}),
+    ("POST", "/items/", {"json": {"name": "Foo", "price": 3}}),
+    ("POST", "/items/", {"json": {"price": 3}}),
+    (
+        "POST",
+        "/items/",
+        {"content": b"{invalid", "headers": {"content-type": "application/json"}},
+    ),
+    ("POST", "/items/", {"content": b'{"name": "Foo"}'}),
+    ("POST", "/items/", {}),
+    ("POST", "/login/", {"data": {"username": "foo"}}),
+    ("POST", "/login/", {}),
+    ("GET", "/text/", {}),
+    ("GET", "/custom/", {}),
+    ("GET", "/response/", {}),
+    ("GET", "/no-content/", {}),
+    ("GET", "/items/3", {"headers": {"accept": "text/x-python"}}),
+    ("GET", "/chunks/", {}),
+    ("GET", "/stream/", {}),
+]
+
+
+@pytest.mark.parametrize("method,path,kwargs", requests)
+def test_same_as_generic_handler(method: str, path: str, kwargs: dict):
+    generic_client = TestClient(create_app(specialized_handlers=False))
+    specialized_client = TestClient(create_app(specialized_handlers=True))
+    generic_response = generic_client.request(method, path, **kwargs)
+    specialized_response = specialized_client.request(method, path, **kwargs)
+    assert specialized_response.status_code == generic_response.status_code
+    assert specialized_response.content == generic_response.content
+    assert specialized_response.headers == generic_response.headers
+
+
+def test_routes_use_specialized_handler():
+    app = create_app(specialized_handlers=True)
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert all(route.specialized_handler for route in routes)
+
+
+def test_response_validation_error():
+    client = TestClient(create_app(specialized_handlers=True))
+    with pytest.raises(ResponseValidationError) as exc_info:
+        client.get("/invalid-response/")
+    assert "GET /invalid-response/" in str(exc_info.value)
+
+
+def test_endpoint_called_with_run_endpoint_function(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    run_endpoint_function = routing.run_endpoint_function
+
+    async def record_run(*, dependant, values, is_coroutine):
+        calls.append(dependant.call.__name__)
+        return await run_endpoint_function(
+            dependant=dependant, values=values, is_coroutine=is_coroutine
+        )
+
+    monkeypatch.setattr(routing, "run_endpoint_function", record_run)
+    client = TestClient(create_app(specialized_handlers=True))
+    response = client.get("/items/3")
+    assert response.json() == {"item_id": 3, "q": None}
+    assert calls == ["read_item"]
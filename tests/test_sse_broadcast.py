@@ -0,0 +1,239 @@
+from collections.abc import AsyncIterable, Iterable
+from typing import Annotated
+
+import anyio
+import fastapi.sse
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.responses import EventSourceResponse
+from fastapi.sse import (
+    EncodedServerSentEvent,
+    EventBroadcaster,
+    ServerSentEvent,
+)
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Tick(BaseModel):
+    symbol: str
+    price: float
+
+
+def test_publish_encodes_once():
+    broadcaster = EventBroadcaster()
+    first = broadcaster.subscribe("ticks")
+    second = broadcaster.subscribe("ticks")
+    other = broadcaster.subscribe("other")
+    event = broadcaster.publish(Tick(symbol="ABC", price=1.5), channel="ticks")
+    assert event.content == b'data: {"symbol":"ABC","price":1.5}\n\n'
+    assert list(first._queue) == [event]
+    assert list(second._queue) == [event]
+    # The same instance is sent to all the subscribers
+    assert first._queue[0] is second._queue[0]
+    assert list(other._queue) == []
+
+
+@pytest.mark.parametrize(
+    "event,content,id",
+    [
+        ({"n": 1}, b'data: {"n": 1}\n\n', None),
+        (
+            ServerSentEvent(data="hi", event="greeting", id="5"),
+            b'event: greeting\ndata: "hi"\nid: 5\n\n',
+            "5",
+        ),
+        (ServerSentEvent(raw_data="raw"), b"data: raw\n\n", None),
+    ],
+)
+def test_from_event(event, content: bytes, id: str | None):
+    encoded = EncodedServerSentEvent.from_event(event)
+    assert encoded.content == content
+    assert encoded.id == id
+
+
+@pytest.mark.parametrize(
+    "overflow,expected,dropped,closed",
+    [
+        ("drop_oldest", [b"data: 2\n\n", b"data: 3\n\n"], 2, False),
+        ("drop_newest", [b"data: 0\n\n", b"data: 1\n\n"], 2, False),
+        # Unsubscribed after the first dropped event
+        ("disconnect", [], 1, True),
+    ],
+)
+def test_overflow(overflow, expected: list[bytes], dropped: int, closed: bool):
+    broadcaster = EventBroadcaster(max_queue_size=2, overflow=overflow)
+    subscription = broadcaster.subscribe()
+    for i in range(4):
+        broadcaster.publish(i)
+    assert [event.content for event in subscription._queue] == expected
+    assert subscription.dropped == dropped
+    assert subscription.closed is closed
+    assert broadcaster.subscriber_count() == (0 if closed else 1)
+
+
+@pytest.mark.anyio
+async def test_subscription_iteration():
+    broadcaster = EventBroadcaster()
+    received: list[bytes] = []
+
+    async def consume() -> None:
+        async with broadcaster.subscribe() as subscription:
+            async for event in subscription:
+                received.append(event.content)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(consume)
+        await anyio.wait_all_tasks_blocked()
+        assert broadcaster.subscriber_count() == 1
+        broadcaster.publish(1)
+        broadcaster.publish(2)
+        await anyio.wait_all_tasks_blocked()
+        broadcaster.close()
+    assert received == [b"data: 1\n\n", b"data: 2\n\n"]
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.anyio
+async def test_exit_unsubscribes():
+    broadcaster = EventBroadcaster()
+    async with broadcaster.subscribe("ticks"):
+        assert broadcaster.subscriber_count("ticks") == 1
+    assert broadcaster.subscriber_count("ticks") == 0
+    # No subscribers, nothing to do
+    broadcaster.publish(1, channel="ticks")
+
+
+def test_event_source_response():
+    app = FastAPI()
+    broadcaster = EventBroadcaster()
+
+    @app.get("/ticks", response_class=EventSourceResponse)
+    async def stream_ticks() -> AsyncIterable[EncodedServerSentEvent]:
+        async with broadcaster.subscribe("ticks") as subscription:
+            broadcaster.publish(Tick(symbol="ABC", price=1), channel="ticks")
+            broadcaster.publish(
+                ServerSentEvent(data={"n": 2}, event="count", id="2"),
+                channel="ticks",
+            )
+            broadcaster.close("ticks")
+            async for event in subscription:
+                yield event
+
+    client = TestClient(app)
+    response = client.get("/ticks")
+    assert response.status_code == 200, response.text
+    assert response.text == (
+        'data: {"symbol":"ABC","price":1.0}\n\nevent: count\ndata: {"n": 2}\nid: 2\n\n'
+    )
+    openapi = client.get("/openapi.json").json()
+    assert "components" not in openapi
+
+
+def publish_events(broadcaster: EventBroadcaster, count: int) -> None:
+    for i in range(count):
+        broadcaster.publish(ServerSentEvent(data=i, id=str(i)), channel="ticks")
+
+
+def get_replay(subscription) -> list[str | None]:
+    return [event.id for event in subscription._replay]
+
+
+def test_replay_after_last_event_id():
+    broadcaster = EventBroadcaster(replay_size=3)
+    publish_events(broadcaster, 5)
+    subscription = broadcaster.subscribe("ticks", last_event_id="2")
+    assert subscription.replayed is True
+    assert get_replay(subscription) == ["3", "4"]
+    latest = broadcaster.subscribe("ticks", last_event_id="4")
+    assert latest.replayed is True
+    assert get_replay(latest) == []
+    # Only the last 3 events are kept
+    missing = broadcaster.subscribe("ticks", last_event_id="1")
+    assert missing.replayed is False
+    assert get_replay(missing) == []
+    other = broadcaster.subscribe("other", last_event_id="2")
+    assert other.replayed is False
+
+
+def test_replay_max_age(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(fastapi.sse.time, "monotonic", lambda: now)
+    broadcaster = EventBroadcaster(replay_max_age=10)
+    publish_events(broadcaster, 2)
+    now += 5
+    broadcaster.publish(ServerSentEvent(data=2, id="2"), channel="ticks")
+    assert get_replay(broadcaster.subscribe("ticks", last_event_id="0")) == [
+        "1",
+        "2",
+    ]
+    now += 6
+    # The first two events expired
+    assert broadcaster.subscribe("ticks", last_event_id="0").replayed is False
+    assert get_replay(broadcaster.subscribe("ticks", last_event_id="1")) == []
+    assert get_replay(broadcaster.subscribe("ticks", last_event_id="2")) == []
+
+
+def test_no_replay_by_default():
+    broadcaster = EventBroadcaster()
+    publish_events(broadcaster, 3)
+    subscription = broadcaster.subscribe("ticks", last_event_id="0")
+    assert subscription.replayed is False
+    assert broadcaster._history == {}
+
+
+def test_replay_before_live_events():
+    app = FastAPI()
+    broadcaster = EventBroadcaster(max_queue_size=1, replay_size=10)
+    publish_events(broadcaster, 3)
+
+    @app.get("/ticks", response_class=EventSourceResponse)
+    async def stream_ticks(
+        last_event_id: Annotated[str | None, Header()] = None,
+    ) -> AsyncIterable[EncodedServerSentEvent]:
+        async with broadcaster.subscribe("ticks", last_event_id) as subscription:
+            broadcaster.publish(ServerSentEvent(data=3, id="3"), channel="ticks")
+            broadcaster.close("ticks")
+            async for event in subscription:
+                yield event
+
+    client = TestClient(app)
+    response = client.get("/ticks", headers={"last-event-id": "0"})
+    assert response.status_code == 200, response.text
+    # The replayed events are not limited by max_queue_size
+    assert response.text == ("data: 1\nid: 1\n\ndata: 2\nid: 2\n\ndata: 3\nid: 3\n\n")
+    response = client.get("/ticks")
+    assert response.text == "data: 3\nid: 3\n\n"
+
+
+def test_replay_with_last_event_id_header():
+    app = FastAPI()
+    broadcaster = EventBroadcaster(replay_size=10)
+
+    @app.get("/ticks", response_class=EventSourceResponse)
+    async def stream_ticks() -> AsyncIterable[EncodedServerSentEvent]:
+        async with broadcaster.subscribe("ticks") as subscription:
+            broadcaster.close("ticks")
+            async for event in subscription:
+                yield event
+
+    @app.get("/sync-ticks", response_class=EventSourceResponse)
+    def stream_sync_ticks() -> Iterable[list[str | None]]:
+        subscription = broadcaster.subscribe("ticks")
+        broadcaster._unsubscribe(subscription)
+        yield get_replay(subscription)
+
+    client = TestClient(app)
+    publish_events(broadcaster, 3)
+    # The first connection, nothing to replay
+    response = client.get("/ticks")
+    assert response.status_code == 200, response.text
+    assert response.text == ""
+    # The client reconnects with the ID of the last event it received
+    response = client.get("/ticks", headers={"last-event-id": "1"})
+    assert response.status_code == 200, response.text
+    assert response.text == "data: 2\nid: 2\n\n"
+    response = client.get("/sync-ticks", headers={"last-event-id": "0"})
+    assert response.text == 'data: ["1","2"]\n\n'
+    # Not set outside of the request
+    assert broadcaster.subscribe("ticks").replayed is False
@@ -0,0 +1,78 @@
+from collections.abc import AsyncIterable
+
+import anyio
+import fastapi.routing
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import EventSourceResponse
+from fastapi.sse import (
+    KEEPALIVE_COMMENT,
+    _get_keepalive_scheduler,
+    _KeepaliveScheduler,
+)
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.anyio
+async def test_pings_only_idle_streams():
+    scheduler = _KeepaliveScheduler(interval=0.05)
+    idle_send, idle_receive = anyio.create_memory_object_stream[bytes](1)
+    busy_send, busy_receive = anyio.create_memory_object_stream[bytes](1)
+    received: list[bytes] = []
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(scheduler.run)
+        scheduler.register(idle_send)
+        scheduler.register(busy_send)
+        for _ in range(6):
+            await anyio.sleep(0.02)
+            # Sending data postpones the ping
+            scheduler.touch(busy_send)
+            assert busy_receive.statistics().current_buffer_used == 0
+        received.append(await idle_receive.receive())
+        scheduler.unregister(idle_send)
+        scheduler.unregister(busy_send)
+        tg.cancel_scope.cancel()
+    assert received == [KEEPALIVE_COMMENT]
+    for stream in (idle_send, idle_receive, busy_send, busy_receive):
+        stream.close()
+
+
+@pytest.mark.anyio
+async def test_closed_stream_unregistered():
+    scheduler = _KeepaliveScheduler(interval=0.01)
+    send_stream, receive_stream = anyio.create_memory_object_stream[bytes](1)
+    receive_stream.close()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(scheduler.run)
+        scheduler.register(send_stream)
+        await anyio.sleep(0.05)
+        assert not scheduler._deadlines
+        tg.cancel_scope.cancel()
+    send_stream.close()
+
+
+def test_scheduler_during_lifespan(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(fastapi.routing, "_PING_INTERVAL", 0.05)
+    app = FastAPI()
+
+    @app.get("/slow", response_class=EventSourceResponse)
+    async def slow_stream() -> AsyncIterable[dict[str, int]]:
+        yield {"n": 1}
+        await anyio.sleep(0.3)
+        yield {"n": 2}
+
+    assert _get_keepalive_scheduler(app) is None
+    with TestClient(app) as client:
+        scheduler = _get_keepalive_scheduler(app)
+        assert scheduler is not None
+        assert scheduler.interval == 0.05
+        response = client.get("/slow")
+        assert response.status_code == 200
+        assert ": ping\n" in response.text
+        data_lines = [
+            line for line in response.text.split("\n") if line.startswith("data: ")
+        ]
+        assert data_lines == ['data: {"n":1}', 'data: {"n":2}']
+        # Unregistered when the stream ends
+        assert not scheduler._deadlines
+    assert _get_keepalive_scheduler(app) is None
@@ -0,0 +1,80 @@
+from fastapi import FastAPI, Query
+from fastapi._compat import get_cached_type_adapter
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class OrderOut(BaseModel):
+    id: int
+    total: float
+
+
+def test_identical_response_models_share_type_adapter():
+    app = FastAPI()
+
+    @app.get("/orders", response_model=list[OrderOut])
+    def read_orders():
+        return [{"id": 1, "total": 2.5}]
+
+    @app.get("/archived-orders", response_model=list[OrderOut])
+    def read_archived_orders():
+        return [{"id": 2, "total": 1}]
+
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    adapters = {id(route.response_field._type_adapter) for route in routes}
+    assert len(adapters) == 1
+    assert routes[0].response_field.name != routes[1].response_field.name
+    client = TestClient(app)
+    assert client.get("/orders").json() == [{"id": 1, "total": 2.5}]
+    assert client.get("/archived-orders").json() == [{"id": 2, "total": 1.0}]
+
+
+def test_cache_info_counts_hits():
+    class CountedOut(BaseModel):
+        name: str
+
+    app = FastAPI()
+    before = get_cached_type_adapter.cache_info()
+    for i in range(3):
+
+        def read_counted():
+            return {"name": "foo"}  # pragma: no cover
+
+        app.add_api_route(f"/counted/{i}", read_counted, response_model=CountedOut)
+    after = get_cached_type_adapter.cache_info()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
+
+
+def test_different_defaults_are_not_shared():
+    app = FastAPI()
+
+    @app.get("/int")
+    def read_int(value: int = Query(default=1, le=5)):
+        return value
+
+    @app.get("/bool")
+    def read_bool(value: int = Query(default=True, le=5)):
+        return value
+
+    routes = {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+    int_field = routes["/int"].dependant.query_params[0]
+    bool_field = routes["/bool"].dependant.query_params[0]
+    assert int_field._type_adapter is not bool_field._type_adapter
+    client = TestClient(app)
+    response = client.get("/int", params={"value": 6})
+    assert response.status_code == 422, response.text
+    assert client.get("/int").json() == 1
+
+
+def test_unhashable_field_is_not_cached():
+    app = FastAPI()
+
+    @app.get("/items")
+    def read_items(q: set[str] = Query(default={"foo"})):
+        return sorted(q)
+
+    client = TestClient(app)
+    assert client.get("/items").json() == ["foo"]
+    assert client.get("/items", params={"q": ["a", "b"]}).json() == ["a", "b"]